@@ -1,6 +1,41 @@
+from importlib import import_module
+
 __version__ = '0.1.0'
-__all__ = ['get_schema_view', 'get_openapi_schema']
+__all__ = ['get_schema_view', 'get_async_schema_view', 'get_openapi_schema', 'invalidate_schema_cache', 'get_schema_cache_stats',
+           'get_introspection_cache_stats', 'clear_fragment_cache', 'register_field_type', 'register_model_field_type']
+
+# Resolved on first access so that listing the app in INSTALLED_APPS does not import DRF or the generator.
+_LAZY_ATTRIBUTES = {
+    'get_openapi_schema': 'autoapi_swagger.docs_generator',
+    'get_schema_view': 'autoapi_swagger.views',
+    'get_async_schema_view': 'autoapi_swagger.views',
+    'invalidate_schema_cache': 'autoapi_swagger.cache',
+    'get_schema_cache_stats': 'autoapi_swagger.cache',
+    'get_introspection_cache_stats': 'autoapi_swagger.utils',
+    'clear_fragment_cache': 'autoapi_swagger.incremental',
+    'register_field_type': 'autoapi_swagger.field_types',
+    'register_model_field_type': 'autoapi_swagger.field_types',
+}
+
+# Spelled out instead of imported from typing, which would cost more than the package itself.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from autoapi_swagger.docs_generator import get_openapi_schema
+    from autoapi_swagger.views import get_schema_view, get_async_schema_view
+    from autoapi_swagger.cache import invalidate_schema_cache, get_schema_cache_stats
+    from autoapi_swagger.utils import get_introspection_cache_stats
+    from autoapi_swagger.incremental import clear_fragment_cache
+    from autoapi_swagger.field_types import register_field_type, register_model_field_type
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-from autoapi_swagger.docs_generator import get_openapi_schema
-from autoapi_swagger.views import get_schema_view
 
+def __dir__():
+    return sorted({*globals(), *__all__})
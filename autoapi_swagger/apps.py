@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class AutoAPISwaggerConfig(AppConfig):
+    name = 'autoapi_swagger'
+    verbose_name = 'AutoAPI Swagger'
+    
+    def ready(self):
+        from autoapi_swagger.settings import get_setting
+        
+        if get_setting('WARM_UP_SCHEMA'):
+            from autoapi_swagger.warmup import is_server_process, start_schema_warmup
+            
+            if is_server_process():
+                start_schema_warmup()
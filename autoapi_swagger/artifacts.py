@@ -0,0 +1,61 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type, Union
+from autoapi_swagger.payload import SchemaPayload, compress, get_available_encodings, IDENTITY, GZIP, BROTLI, MAX_LEVELS
+
+
+SCHEMA_FILENAME = 'openapi.json'
+MINIFIED_SCHEMA_FILENAME = 'openapi.min.json'
+YAML_SCHEMA_FILENAME = 'openapi.yaml'
+ENCODING_SUFFIXES = {GZIP: '.gz', BROTLI: '.br'}
+
+
+def write_schema_artifacts(
+    schema: Dict[str, Any],
+    directory: Union[str, Path],
+    encoder: Optional[Type[json.JSONEncoder]] = None,
+    indent: int = 2,
+    yaml: bool = False,
+) -> List[Path]:
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    payload = SchemaPayload.from_schema(schema, encoder=encoder)
+    
+    pretty = json.dumps(schema, cls=encoder, indent=indent, ensure_ascii=False) + '\n'
+    files = {
+        SCHEMA_FILENAME: pretty.encode('utf-8'),
+        MINIFIED_SCHEMA_FILENAME: payload.content,
+    }
+    for encoding in get_available_encodings():
+        if encoding != IDENTITY:
+            files[MINIFIED_SCHEMA_FILENAME + ENCODING_SUFFIXES[encoding]] = compress(payload.content, encoding, MAX_LEVELS[encoding])
+    if yaml:
+        from autoapi_swagger.ir import render_yaml
+        
+        files[YAML_SCHEMA_FILENAME] = render_yaml(schema, encoder=encoder).encode('utf-8')
+    
+    written = []
+    for filename, content in files.items():
+        written.append(_atomic_write(directory / filename, content))
+    return written
+
+
+def load_schema_artifact(directory: Union[str, Path]) -> SchemaPayload:
+    directory = Path(directory)
+    minified = directory / MINIFIED_SCHEMA_FILENAME
+    
+    encoded = {}
+    for encoding, suffix in ENCODING_SUFFIXES.items():
+        compressed = directory / (MINIFIED_SCHEMA_FILENAME + suffix)
+        if compressed.exists():
+            encoded[encoding] = compressed.read_bytes()
+    
+    return SchemaPayload(minified.read_bytes(), encoded=encoded)
+
+
+def _atomic_write(path: Path, content: bytes) -> Path:
+    tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,63 @@
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from autoapi_swagger.payload import IDENTITY, SchemaPayload, get_available_encodings
+
+
+SWAGGER_UI_DIR = Path(__file__).parent / 'swagger_ui'
+
+SWAGGER_UI_ASSETS = {
+    'swagger-ui.css': 'text/css; charset=utf-8',
+    'swagger-ui-bundle.js': 'application/javascript; charset=utf-8',
+    'swagger-ui-standalone-preset.js': 'application/javascript; charset=utf-8',
+    'favicon-32x32.png': 'image/png',
+    'favicon-16x16.png': 'image/png',
+}
+
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript')
+
+
+class SwaggerUIAsset:
+    def __init__(self, name: str, content_type: str, content: bytes):
+        self.name = name
+        self.content_type = content_type
+        self.payload = SchemaPayload(content)
+        stem, _, extension = name.rpartition('.')
+        self.hashed_name = f'{stem}.{self.payload.digest[:12]}.{extension}'
+    
+    def encodings(self) -> Tuple[str, ...]:
+        if self.content_type.startswith(COMPRESSIBLE_TYPES):
+            return get_available_encodings()
+        return (IDENTITY,)
+
+
+_assets: Optional[Dict[str, SwaggerUIAsset]] = None
+_lock = threading.Lock()
+
+
+def get_swagger_ui_assets() -> Dict[str, SwaggerUIAsset]:
+    global _assets
+    if _assets is None:
+        with _lock:
+            if _assets is None:
+                assets = (
+                    SwaggerUIAsset(name, content_type, (SWAGGER_UI_DIR / name).read_bytes())
+                    for name, content_type in SWAGGER_UI_ASSETS.items()
+                )
+                _assets = {asset.hashed_name: asset for asset in assets}
+    return _assets
+
+
+def reset_asset_locks() -> None:
+    global _lock
+    _lock = threading.Lock()
+    for asset in (_assets or {}).values():
+        asset.payload.reset_locks()
+
+
+def get_swagger_ui_asset(hashed_name: str) -> Optional[SwaggerUIAsset]:
+    return get_swagger_ui_assets().get(hashed_name)
+
+
+def get_swagger_ui_asset_urls(assets_url: str) -> Dict[str, str]:
+    return {asset.name: assets_url + hashed_name for hashed_name, asset in get_swagger_ui_assets().items()}
@@ -0,0 +1,373 @@
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+from asgiref.sync import sync_to_async
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from rest_framework.utils.encoders import JSONEncoder
+from autoapi_swagger.artifacts import load_schema_artifact
+from autoapi_swagger.constants import DEFAULT_TITLE, DEFAULT_VERSION, PERMISSION_VARIANT_CACHE_SIZE, SHARD_CACHE_SIZE
+from autoapi_swagger.docs_generator import build_shard_catalog, build_shard_index, get_openapi_schema, get_schema_shards
+from autoapi_swagger.payload import SchemaPayload
+from autoapi_swagger.refs import ShardCatalog, filter_schema, get_shard_catalog, get_tag_counts, select_operations
+from autoapi_swagger.settings import get_setting
+from autoapi_swagger.stores import get_schema_store, load_or_build_payload
+from autoapi_swagger.utils import get_current_resolver, prune_introspection_caches, resolver_changed
+
+if TYPE_CHECKING:
+    from autoapi_swagger.permissions import OperationPermissions
+
+
+PayloadEntry = Tuple['SchemaCache', Hashable, Callable[[], SchemaPayload]]
+
+
+class SchemaCache:
+    def __init__(self, maxsize: Optional[int] = None):
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Any] = OrderedDict()
+        self._build_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    def get_or_build(self, key: Hashable, builder: Callable[[], Any]) -> Any:
+        get_current_resolver()
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+            generation = self._generation
+        
+        with build_lock:
+            with self._lock:
+                if key in self._entries:
+                    self.hits += 1
+                    return self._entries[key]
+                self.misses += 1
+            
+            value = builder()
+            
+            with self._lock:
+                self._put(key, value, generation)
+                self._build_locks.pop(key, None)
+            return value
+    
+    @property
+    def generation(self) -> int:
+        return self._generation
+    
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        with self._lock:
+            self._put(key, value, self._generation if generation is None else generation)
+    
+    def peek(self, key: Hashable) -> Any:
+        get_current_resolver()
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+    
+    def _put(self, key: Hashable, value: Any, generation: int) -> None:
+        if self._generation == generation:
+            self._entries[key] = value
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def reset_locks(self) -> None:
+        self._lock = threading.Lock()
+        self._build_locks.clear()
+        for value in self._entries.values():
+            if isinstance(value, SchemaPayload):
+                value.reset_locks()
+    
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.invalidations += 1
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'entries': len(self._entries),
+            }
+
+
+class SingleFlight:
+    def __init__(self):
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future] = {}
+    
+    async def run(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        task = self._tasks.get(task_key)
+        if task is None:
+            task = loop.create_task(sync_to_async(func, thread_sensitive=False)())
+            self._tasks[task_key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(task_key, None))
+        return await asyncio.shield(task)
+    
+    def pending(self) -> int:
+        return len(self._tasks)
+
+
+schema_cache = SchemaCache()
+shard_cache = SchemaCache(maxsize=SHARD_CACHE_SIZE)
+variant_cache = SchemaCache(maxsize=PERMISSION_VARIANT_CACHE_SIZE)
+single_flight = SingleFlight()
+
+
+def make_cache_key(
+    title: str = DEFAULT_TITLE,
+    version: str = DEFAULT_VERSION,
+    description: str = '',
+    servers: Optional[List[Dict[str, str]]] = None,
+) -> Tuple[str, str, str, str]:
+    return (title, version, description, json.dumps(servers, sort_keys=True))
+
+
+def get_cached_openapi_schema(
+    title: str = DEFAULT_TITLE,
+    version: str = DEFAULT_VERSION,
+    description: str = '',
+    servers: Optional[List[Dict[str, str]]] = None,
+) -> Dict[str, Any]:
+    key = ('schema',) + make_cache_key(title, version, description, servers)
+    return schema_cache.get_or_build(key, lambda: get_openapi_schema(
+        title=title,
+        version=version,
+        description=description,
+        servers=servers,
+        intern=True,
+    ))
+
+
+def get_cached_schema_payload(
+    title: str = DEFAULT_TITLE,
+    version: str = DEFAULT_VERSION,
+    description: str = '',
+    servers: Optional[List[Dict[str, str]]] = None,
+) -> SchemaPayload:
+    cache, key, builder = get_payload_entry(title, version, description, servers)
+    return cache.get_or_build(key, builder)
+
+
+def get_cached_shard_payload(
+    title: str = DEFAULT_TITLE,
+    version: str = DEFAULT_VERSION,
+    description: str = '',
+    servers: Optional[List[Dict[str, str]]] = None,
+    tag: Optional[str] = None,
+    prefix: Optional[str] = None,
+) -> SchemaPayload:
+    cache, key, builder = get_payload_entry(title, version, description, servers, tag, prefix)
+    return cache.get_or_build(key, builder)
+
+
+async def aget_cached_schema_payload(
+    title: str = DEFAULT_TITLE,
+    version: str = DEFAULT_VERSION,
+    description: str = '',
+    servers: Optional[List[Dict[str, str]]] = None,
+    tag: Optional[str] = None,
+    prefix: Optional[str] = None,
+) -> SchemaPayload:
+    cache, key, builder = get_payload_entry(title, version, description, servers, tag, prefix)
+    payload = cache.peek(key)
+    if payload is not None:
+        return payload
+    return await single_flight.run((id(cache), key), lambda: cache.get_or_build(key, builder))
+
+
+def peek_schema_payload(
+    title: str = DEFAULT_TITLE,
+    version: str = DEFAULT_VERSION,
+    description: str = '',
+    servers: Optional[List[Dict[str, str]]] = None,
+) -> Optional[SchemaPayload]:
+    cache, key, _ = get_payload_entry(title, version, description, servers)
+    return cache.peek(key)
+
+
+def cache_streamed_payload(
+    chunks: Iterator[bytes],
+    title: str = DEFAULT_TITLE,
+    version: str = DEFAULT_VERSION,
+    description: str = '',
+    servers: Optional[List[Dict[str, str]]] = None,
+) -> Iterator[bytes]:
+    cache, key, _ = get_payload_entry(title, version, description, servers)
+    generation = cache.generation
+    content = []
+    for chunk in chunks:
+        content.append(chunk)
+        yield chunk
+    # Only a fully sent stream is kept, so later requests are served from the cache.
+    cache.set(key, SchemaPayload(b''.join(content)), generation)
+
+
+def get_payload_entry(
+    title: str = DEFAULT_TITLE,
+    version: str = DEFAULT_VERSION,
+    description: str = '',
+    servers: Optional[List[Dict[str, str]]] = None,
+    tag: Optional[str] = None,
+    prefix: Optional[str] = None,
+) -> PayloadEntry:
+    artifact_dir = get_setting('SCHEMA_ARTIFACT_DIR')
+    is_shard = tag is not None or bool(prefix)
+    
+    if artifact_dir and not is_shard:
+        return schema_cache, ('artifact', str(artifact_dir)), lambda: load_schema_artifact(artifact_dir)
+    
+    if artifact_dir:
+        return shard_cache, ('artifact-shard', str(artifact_dir), tag, prefix), lambda: SchemaPayload.from_schema(
+            filter_schema(load_artifact_schema(), tag, prefix),
+            encoder=JSONEncoder,
+        )
+    
+    if is_shard:
+        cache, key = shard_cache, ('shard',) + make_cache_key(title, version, description, servers) + (tag, prefix)
+        builder = lambda: SchemaPayload.from_schema(
+            get_openapi_schema(
+                title=title,
+                version=version,
+                description=description,
+                servers=servers,
+                tag=tag,
+                prefix=prefix,
+                intern=True,
+            ),
+            encoder=JSONEncoder,
+        )
+    else:
+        cache, key = schema_cache, ('payload',) + make_cache_key(title, version, description, servers)
+        builder = lambda: SchemaPayload.from_schema(
+            get_cached_openapi_schema(title, version, description, servers),
+            encoder=JSONEncoder,
+        )
+    
+    store = get_schema_store()
+    if store is not None:
+        return cache, key, partial(load_or_build_payload, store, key, builder)
+    return cache, key, builder
+
+
+def get_cached_shard_index(title: str = DEFAULT_TITLE, version: str = DEFAULT_VERSION) -> SchemaPayload:
+    artifact_dir = get_setting('SCHEMA_ARTIFACT_DIR')
+    if artifact_dir:
+        key = ('artifact-index', str(artifact_dir))
+        return schema_cache.get_or_build(key, lambda: SchemaPayload.from_schema(
+            build_shard_index(title, version, get_tag_counts(load_artifact_schema())),
+            encoder=JSONEncoder,
+        ))
+    
+    key = ('index', title, version)
+    return schema_cache.get_or_build(key, lambda: SchemaPayload.from_schema(
+        build_shard_index(title, version, get_schema_shards()),
+        encoder=JSONEncoder,
+    ))
+
+
+def get_cached_shard_catalog() -> ShardCatalog:
+    artifact_dir = get_setting('SCHEMA_ARTIFACT_DIR')
+    if artifact_dir:
+        key = ('artifact-catalog', str(artifact_dir))
+        return schema_cache.get_or_build(key, lambda: get_shard_catalog(load_artifact_schema()))
+    return schema_cache.get_or_build(('catalog',), build_shard_catalog)
+
+
+def get_cached_operation_permissions() -> 'OperationPermissions':
+    from autoapi_swagger.permissions import build_operation_permissions
+    
+    return schema_cache.get_or_build(('permissions',), build_operation_permissions)
+
+
+def get_variant_entry(
+    request: Any,
+    title: str = DEFAULT_TITLE,
+    version: str = DEFAULT_VERSION,
+    description: str = '',
+    servers: Optional[List[Dict[str, str]]] = None,
+    tag: Optional[str] = None,
+    prefix: Optional[str] = None,
+    index: bool = False,
+) -> Optional[PayloadEntry]:
+    operation_permissions = get_cached_operation_permissions()
+    fingerprint = operation_permissions.fingerprint(request)
+    if operation_permissions.allows_all(fingerprint):
+        return None
+    
+    def builder() -> SchemaPayload:
+        if get_setting('SCHEMA_ARTIFACT_DIR'):
+            schema = load_artifact_schema()
+        else:
+            schema = get_cached_openapi_schema(title, version, description, servers)
+        schema = select_operations(schema, operation_permissions.allowed_operations(fingerprint))
+        if tag is not None or prefix:
+            schema = filter_schema(schema, tag, prefix)
+        if index:
+            schema = build_shard_index(title, version, get_tag_counts(schema))
+        return SchemaPayload.from_schema(schema, encoder=JSONEncoder)
+    
+    key = ('variant',) + make_cache_key(title, version, description, servers) + (tag, prefix, index, fingerprint)
+    return variant_cache, key, builder
+
+
+def get_cached_variant_payload(request: Any, **kwargs: Any) -> Optional[SchemaPayload]:
+    entry = get_variant_entry(request, **kwargs)
+    if entry is None:
+        return None
+    cache, key, builder = entry
+    return cache.get_or_build(key, builder)
+
+
+async def aget_cached_variant_payload(request: Any, **kwargs: Any) -> Optional[SchemaPayload]:
+    entry = await sync_to_async(get_variant_entry)(request, **kwargs)
+    if entry is None:
+        return None
+    cache, key, builder = entry
+    payload = cache.peek(key)
+    if payload is not None:
+        return payload
+    return await single_flight.run((id(cache), key), lambda: cache.get_or_build(key, builder))
+
+
+def load_artifact_schema() -> Dict[str, Any]:
+    return json.loads(get_cached_schema_payload().content)
+
+
+def invalidate_schema_cache() -> None:
+    schema_cache.invalidate()
+    shard_cache.invalidate()
+    variant_cache.invalidate()
+    prune_introspection_caches()
+
+
+def get_schema_cache_stats() -> Dict[str, int]:
+    return schema_cache.stats()
+
+
+@receiver(setting_changed)
+def _invalidate_on_setting_changed(*, setting: str, **kwargs) -> None:
+    if setting == 'AUTOAPI_SWAGGER':
+        invalidate_schema_cache()
+
+
+@receiver(resolver_changed)
+def _invalidate_on_resolver_changed(**kwargs) -> None:
+    schema_cache.invalidate()
+    shard_cache.invalidate()
+    variant_cache.invalidate()
@@ -0,0 +1,180 @@
+import json
+import re
+from typing import Any, Container, Dict, Iterator, Optional, Tuple
+
+
+SCHEMA_REF_PREFIX = '#/components/schemas/'
+PARAMETER_REF_PREFIX = '#/components/parameters/'
+RESPONSE_REF_PREFIX = '#/components/responses/'
+
+
+class ComponentTable:
+    def __init__(self, ref_prefix: str):
+        self.ref_prefix = ref_prefix
+        self.components: Dict[str, Any] = {}
+        self.counts: Dict[str, int] = {}
+        self._names: Dict[str, str] = {}
+    
+    def count(self, key: str) -> None:
+        self.counts[key] = self.counts.get(key, 0) + 1
+    
+    def intern(self, key: str, value: Any, base_name: str, reserved: Optional[Container[str]] = None) -> Dict[str, str]:
+        name = self._names.get(key)
+        if name is None:
+            name = base_name
+            suffix = 2
+            while name in self.components or (reserved is not None and name in reserved):
+                name = f'{base_name}{suffix}'
+                suffix += 1
+            self._names[key] = name
+            self.components[name] = value
+        return {'$ref': self.ref_prefix + name}
+
+
+class SchemaCompactor:
+    def __init__(self, min_occurrences: int = 2, schemas: Optional[Container[str]] = None):
+        self.min_occurrences = min_occurrences
+        self.schemas = schemas if schemas is not None else {}
+        self.parameters = ComponentTable(PARAMETER_REF_PREFIX)
+        self.responses = ComponentTable(RESPONSE_REF_PREFIX)
+        self.envelopes = ComponentTable(SCHEMA_REF_PREFIX)
+        self._keys: Dict[int, Tuple[Any, str]] = {}
+    
+    def count_operation(self, operation: Dict[str, Any]) -> None:
+        for parameter in operation.get('parameters', ()):
+            if '$ref' not in parameter:
+                self.parameters.count(self._key(parameter))
+        for response in operation.get('responses', {}).values():
+            if '$ref' in response:
+                continue
+            envelope = get_envelope(response)
+            if envelope is not None:
+                self.envelopes.count(self._key(envelope))
+            self.responses.count(self._key(response))
+    
+    def compact_operation(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        compacted = dict(operation)
+        if 'parameters' in operation:
+            compacted['parameters'] = [self._compact_parameter(p) for p in operation['parameters']]
+        if 'responses' in operation:
+            compacted['responses'] = {
+                code: self._compact_response(response) for code, response in operation['responses'].items()
+            }
+        return compacted
+    
+    def component_items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        if self.parameters.components:
+            yield 'parameters', self.parameters.components
+        if self.responses.components:
+            yield 'responses', self.responses.components
+    
+    def _compact_parameter(self, parameter: Dict[str, Any]) -> Dict[str, Any]:
+        if '$ref' in parameter:
+            return parameter
+        key = self._key(parameter)
+        if not self._is_shared(self.parameters, key):
+            return parameter
+        base_name = camelize(f"{parameter.get('name', '')} {parameter.get('in', '')}") or 'Parameter'
+        return self.parameters.intern(key, parameter, base_name)
+    
+    def _compact_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        if '$ref' in response:
+            return response
+        response_key = self._key(response)
+        
+        envelope = get_envelope(response)
+        if envelope is not None:
+            envelope_key = self._key(envelope)
+            if self._is_shared(self.envelopes, envelope_key):
+                envelope_ref = self.envelopes.intern(
+                    envelope_key, envelope, get_envelope_name(envelope), reserved=self.schemas,
+                )
+                response = replace_response_schema(response, envelope_ref)
+        
+        if not self._is_shared(self.responses, response_key):
+            return response
+        return self.responses.intern(response_key, response, get_response_name(response))
+    
+    def _is_shared(self, table: ComponentTable, key: str) -> bool:
+        return self.min_occurrences <= 1 or table.counts.get(key, 0) >= self.min_occurrences
+    
+    def _key(self, value: Any) -> str:
+        cached = self._keys.get(id(value))
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        key = json.dumps(value, sort_keys=True, default=str)
+        self._keys[id(value)] = (value, key)
+        return key
+
+
+def compact_schema(schema: Dict[str, Any], min_occurrences: int = 2) -> Dict[str, Any]:
+    components = schema.get('components', {})
+    schemas = components.get('schemas', {})
+    compactor = SchemaCompactor(min_occurrences=min_occurrences, schemas=schemas)
+    
+    if min_occurrences > 1:
+        for operation in iter_operations(schema.get('paths', {})):
+            compactor.count_operation(operation)
+    
+    paths = {
+        path: {method: compactor.compact_operation(operation) for method, operation in path_item.items()}
+        for path, path_item in schema.get('paths', {}).items()
+    }
+    
+    compacted_components = dict(components)
+    compacted_components['schemas'] = {**schemas, **compactor.envelopes.components}
+    for section, entries in compactor.component_items():
+        compacted_components[section] = {**components.get(section, {}), **entries}
+    
+    return {**schema, 'paths': paths, 'components': compacted_components}
+
+
+def iter_operations(paths: Dict[str, Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    for path_item in paths.values():
+        yield from path_item.values()
+
+
+def get_envelope(response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    for media in response.get('content', {}).values():
+        schema = media.get('schema', {})
+        if 'allOf' in schema and get_data_ref(schema) is not None:
+            return schema
+    return None
+
+
+def get_data_ref(envelope: Dict[str, Any]) -> Optional[Tuple[str, bool]]:
+    for part in envelope.get('allOf', ()):
+        data = part.get('properties', {}).get('data')
+        if not data:
+            continue
+        if '$ref' in data:
+            return data['$ref'], False
+        if data.get('type') == 'array' and '$ref' in data.get('items', {}):
+            return data['items']['$ref'], True
+    return None
+
+
+def get_envelope_name(envelope: Dict[str, Any]) -> str:
+    ref, is_list = get_data_ref(envelope)
+    name = ref.rsplit('/', 1)[-1]
+    return f'{name}ListEnvelope' if is_list else f'{name}Envelope'
+
+
+def get_response_name(response: Dict[str, Any]) -> str:
+    for media in response.get('content', {}).values():
+        ref = media.get('schema', {}).get('$ref', '')
+        if ref.startswith(SCHEMA_REF_PREFIX):
+            name = ref[len(SCHEMA_REF_PREFIX):]
+            return name[:-len('Envelope')] + 'Response' if name.endswith('Envelope') else f'{name}Response'
+    return camelize(response.get('description', '')) or 'Response'
+
+
+def replace_response_schema(response: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **response,
+        'content': {media_type: {**media, 'schema': schema} for media_type, media in response['content'].items()},
+    }
+
+
+def camelize(value: str) -> str:
+    return ''.join(word[:1].upper() + word[1:] for word in re.split(r'[^0-9a-zA-Z]+', value) if word)
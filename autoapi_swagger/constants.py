@@ -86,4 +86,14 @@ SUCCESS_RESPONSES = {
 
 SWAGGER_UI_VERSION = '4.15.5'
 CONTENT_TYPE_JSON = 'application/json'
-
+SCHEMA_CACHE_CONTROL = 'public, max-age=60'
+PRIVATE_SCHEMA_CACHE_CONTROL = 'private, max-age=60'
+PRIVATE_SCHEMA_VARY = 'Accept-Encoding, Authorization, Cookie'
+INTROSPECTION_CACHE_SIZE = 4096
+STREAM_CHUNK_SIZE = 64 * 1024
+SHARD_CACHE_SIZE = 64
+PERMISSION_VARIANT_CACHE_SIZE = 128
+SWAGGER_UI_ASSET_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+WARM_UP_FORK_TIMEOUT = 60
+MANAGEMENT_PROGRAMS = ('manage', 'django-admin', 'django')
+SCHEMA_STORE_LOCK_TIMEOUT = 300
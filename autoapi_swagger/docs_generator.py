@@ -1,17 +1,44 @@
 import inspect
-from typing import Any, Dict, List, Optional, Type
-from django.urls import get_resolver
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+from urllib.parse import quote
+from django.urls import URLResolver
 from rest_framework import serializers, viewsets
+from autoapi_swagger.compaction import compact_schema
 from autoapi_swagger.constants import OPENAPI_VERSION, DEFAULT_SERVER, WRITE_METHODS
+from autoapi_swagger.naming import get_component_name
+from autoapi_swagger.refs import ShardCatalog, prune_components, validate_refs
 from autoapi_swagger.utils import (
     get_serializer_fields,
+    get_declared_serializers,
+    get_nested_serializers,
     get_view_actions,
     get_view_serializer,
     get_view_queryset_model,
-    extract_url_patterns,
+    get_resolver_patterns,
+    get_current_resolver,
     get_model_fields,
+    get_related_models,
+)
+from autoapi_swagger.model_graph import get_model_pk
+from autoapi_swagger.instrumentation import timed_stage
+from autoapi_swagger.ir import (
+    MISSING, Node, ObjectSchema, Operation, Parameter, PropertySchema, Ref, Renderer, RequestBody,
 )
 from autoapi_swagger.responses import build_responses, build_jsend_schema
+from autoapi_swagger.settings import get_setting
+
+
+ID_PATH_PARAMETER = Parameter(
+    name='id',
+    location='path',
+    schema=PropertySchema(type='integer'),
+    required=True,
+    description='Resource identifier',
+)
+
+ViewFragment = Tuple[Dict[str, Dict[str, Operation]], Dict[str, Node]]
+OperationSpec = Tuple[str, str, Optional[str], bool]
 
 
 def get_openapi_schema(
@@ -19,25 +46,33 @@ def get_openapi_schema(
     version: str = '1.0.0',
     description: str = '',
     servers: Optional[List[Dict[str, str]]] = None,
+    workers: Optional[int] = None,
+    executor: Optional[str] = None,
+    incremental: Optional[bool] = None,
+    compact: Optional[bool] = None,
+    tag: Optional[str] = None,
+    prefix: Optional[str] = None,
+    intern: bool = False,
 ) -> Dict[str, Any]:
-    urlpatterns = get_resolver().url_patterns
     paths = {}
-    components = {'schemas': build_jsend_schema()}
+    schemas = {}
     
-    patterns = extract_url_patterns(urlpatterns)
+    with timed_stage('extract_url_patterns'):
+        patterns = filter_patterns(get_drf_patterns(), tag, prefix)
     
-    for pattern_info in patterns:
-        view_class = pattern_info['view_class']
-        if not is_drf_view(view_class):
-            continue
-        
-        path_item = build_path_item(view_class, pattern_info['path'], pattern_info['name'])
-        if path_item:
-            for path_key, path_operations in path_item.items():
-                paths.setdefault(path_key, {}).update(path_operations)
-            extract_schemas(view_class, components['schemas'])
+    for fragment in build_view_fragments(patterns, workers, executor, incremental):
+        if fragment:
+            with timed_stage('assembly'):
+                merge_view_fragment(fragment, paths, schemas)
     
-    return {
+    with timed_stage('assembly'):
+        renderer = Renderer(intern=intern)
+        paths = renderer.render_paths(paths)
+        components = {'schemas': build_jsend_schema()}
+        for schema_name, schema in schemas.items():
+            components['schemas'].setdefault(schema_name, renderer.render(schema))
+    
+    schema = {
         'openapi': OPENAPI_VERSION,
         'info': {
             'title': title,
@@ -48,6 +83,130 @@ def get_openapi_schema(
         'paths': paths,
         'components': components,
     }
+    
+    compact = get_setting('COMPACT_SCHEMA') if compact is None else compact
+    if compact:
+        with timed_stage('assembly'):
+            schema = compact_schema(schema)
+    
+    if tag is not None or prefix:
+        schema = prune_components(schema)
+    
+    if get_setting('VALIDATE_REFS'):
+        with timed_stage('validate_refs'):
+            validate_refs(schema)
+    
+    return schema
+
+
+def get_schema_shards(patterns: Optional[List[Dict[str, Any]]] = None) -> Dict[str, int]:
+    shards: Dict[str, int] = {}
+    for pattern_info in get_drf_patterns() if patterns is None else patterns:
+        view_class = pattern_info['view_class']
+        operations = sum(1 for _ in iter_operation_specs(view_class, pattern_info['path']))
+        if operations:
+            tag = get_view_tag(view_class)
+            shards[tag] = shards.get(tag, 0) + operations
+    return shards
+
+
+def build_shard_catalog(patterns: Optional[List[Dict[str, Any]]] = None) -> ShardCatalog:
+    patterns = get_drf_patterns() if patterns is None else patterns
+    return ShardCatalog(get_schema_shards(patterns), (
+        normalize_path(p['path']) for p in patterns
+        if next(iter_operation_specs(p['view_class'], p['path']), None) is not None
+    ))
+
+
+def build_shard_index(title: str, version: str, shards: Dict[str, int]) -> Dict[str, Any]:
+    return {
+        'info': {'title': title, 'version': version},
+        'shards': [
+            {'tag': tag, 'url': f"{quote(tag, safe='')}.json", 'operations': operations}
+            for tag, operations in sorted(shards.items())
+        ],
+    }
+
+
+def filter_patterns(
+    patterns: List[Dict[str, Any]],
+    tag: Optional[str] = None,
+    prefix: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    if tag is None and not prefix:
+        return patterns
+    prefix = normalize_path(prefix) if prefix else None
+    return [
+        p for p in patterns
+        if (tag is None or get_view_tag(p['view_class']) == tag)
+        and (prefix is None or normalize_path(p['path']).startswith(prefix))
+    ]
+
+
+def get_drf_patterns(resolver: Optional[URLResolver] = None) -> List[Dict[str, Any]]:
+    resolver = resolver or get_current_resolver()
+    return [p for p in get_resolver_patterns(resolver) if is_drf_view(p['view_class'])]
+
+
+def build_view_fragments(
+    patterns: List[Dict[str, Any]],
+    workers: Optional[int] = None,
+    executor: Optional[str] = None,
+    incremental: Optional[bool] = None,
+) -> Iterable[Optional[ViewFragment]]:
+    incremental = get_setting('INCREMENTAL_BUILDS') if incremental is None else incremental
+    if incremental:
+        from autoapi_swagger.incremental import fragment_store
+        
+        return fragment_store.build(patterns, lambda missing: list(build_view_fragments(missing, workers, executor, False)))
+    
+    workers = get_setting('SCHEMA_WORKERS') if workers is None else workers
+    executor = executor or get_setting('SCHEMA_EXECUTOR')
+    
+    if not workers or workers <= 1 or len(patterns) <= 1:
+        return map(build_view_fragment, patterns)
+    
+    if executor == 'process':
+        chunksize = max(1, len(patterns) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_process_worker) as pool:
+            # Route converters may be local classes that cannot be pickled; workers only need the path.
+            patterns = [{k: v for k, v in p.items() if k != 'converters'} for p in patterns]
+            return list(pool.map(build_view_fragment, patterns, chunksize=chunksize))
+    
+    if executor != 'thread':
+        raise ValueError(f"Unknown schema executor {executor!r}; expected 'thread' or 'process'")
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(build_view_fragment, patterns))
+
+
+def build_view_fragment(pattern_info: Dict[str, Any]) -> Optional[ViewFragment]:
+    view_class = pattern_info['view_class']
+    with timed_stage('build_path_item', view_class):
+        path_item = build_path_item(view_class, pattern_info['path'], pattern_info['name'])
+    if not path_item:
+        return None
+    
+    schemas = {}
+    with timed_stage('extract_schemas', view_class):
+        extract_schemas(view_class, schemas)
+    return path_item, schemas
+
+
+def merge_view_fragment(fragment: ViewFragment, paths: Dict[str, Any], schemas: Dict[str, Any]) -> None:
+    path_item, view_schemas = fragment
+    for path_key, path_operations in path_item.items():
+        paths.setdefault(path_key, {}).update(path_operations)
+    for schema_name, schema in view_schemas.items():
+        schemas.setdefault(schema_name, schema)
+
+
+def _init_process_worker() -> None:
+    import django
+    from django.apps import apps
+    
+    if not apps.ready:
+        django.setup()
 
 
 def is_drf_view(view_class: Type[Any]) -> bool:
@@ -60,8 +219,18 @@ def is_drf_view(view_class: Type[Any]) -> bool:
     )
 
 
-def build_path_item(view_class: Type[Any], path: str, path_name: str) -> Optional[Dict[str, Any]]:
+def build_path_item(view_class: Type[Any], path: str, path_name: str) -> Optional[Dict[str, Dict[str, Operation]]]:
     path_item = {}
+    
+    for op_path, method, action_name, is_detail in iter_operation_specs(view_class, path):
+        operation = build_operation(view_class, action_name, method, is_detail)
+        if operation:
+            path_item.setdefault(op_path, {})[method] = operation
+    
+    return path_item or None
+
+
+def iter_operation_specs(view_class: Type[Any], path: str) -> Iterator[OperationSpec]:
     base_path = normalize_path(path)
     
     if issubclass(view_class, viewsets.ViewSet):
@@ -69,16 +238,10 @@ def build_path_item(view_class: Type[Any], path: str, path_name: str) -> Optiona
             method = action_info['method'].lower()
             is_detail = action_info.get('detail', False)
             op_path = f"{base_path}/{{id}}/" if is_detail else base_path
-            operation = build_operation(view_class, action_name, method, is_detail)
-            if operation:
-                path_item.setdefault(op_path, {})[method] = operation
+            yield op_path, method, action_name, is_detail
     else:
         for method in get_view_methods(view_class):
-            operation = build_operation(view_class, None, method, False)
-            if operation:
-                path_item.setdefault(base_path, {})[method] = operation
-    
-    return path_item or None
+            yield base_path, method, None, False
 
 
 def normalize_path(path: str) -> str:
@@ -98,33 +261,26 @@ def build_operation(
     action_name: Optional[str],
     method: str,
     is_detail: bool
-) -> Optional[Dict[str, Any]]:
-    operation = {
-        'summary': get_operation_summary(view_class, action_name, method),
-        'operationId': get_operation_id(view_class, action_name, method),
-        'tags': [get_view_tag(view_class)],
-    }
-    
+) -> Optional[Operation]:
     serializer_class = get_view_serializer(view_class)
     model_class = get_view_queryset_model(view_class)
     
+    parameters = ()
     if is_detail or method in ['put', 'patch', 'delete']:
-        operation['parameters'] = [{
-            'name': 'id',
-            'in': 'path',
-            'required': True,
-            'schema': {'type': 'integer'},
-            'description': 'Resource identifier',
-        }]
+        parameters = (ID_PATH_PARAMETER,)
     
+    request_body = None
     if method in WRITE_METHODS:
         request_body = build_request_body(serializer_class, model_class)
-        if request_body:
-            operation['requestBody'] = request_body
     
-    operation['responses'] = build_responses(serializer_class, model_class, method, action_name)
-    
-    return operation
+    return Operation(
+        summary=get_operation_summary(view_class, action_name, method),
+        operation_id=get_operation_id(view_class, action_name, method),
+        tags=(get_view_tag(view_class),),
+        parameters=parameters,
+        request_body=request_body,
+        responses=build_responses(serializer_class, model_class, method, action_name),
+    )
 
 
 def get_operation_summary(view_class: Type[Any], action_name: Optional[str], method: str) -> str:
@@ -150,68 +306,120 @@ def get_view_tag(view_class: Type[Any]) -> str:
 def build_request_body(
     serializer_class: Optional[Type[serializers.Serializer]],
     model_class: Optional[Type[Any]]
-) -> Optional[Dict[str, Any]]:
+) -> Optional[RequestBody]:
     from autoapi_swagger.constants import CONTENT_TYPE_JSON
     
-    schema_name = (serializer_class or model_class).__name__ if (serializer_class or model_class) else None
-    if not schema_name:
+    source_class = serializer_class or model_class
+    if not source_class:
         return None
     
-    return {
-        'required': True,
-        'content': {
-            CONTENT_TYPE_JSON: {'schema': {'$ref': f"#/components/schemas/{schema_name}"}}
-        }
-    }
+    return RequestBody(Ref(get_component_name(source_class)), required=True, media_type=CONTENT_TYPE_JSON)
+
 
+def extract_schemas(view_class: Type[Any], schemas: Dict[str, Any]) -> None:
+    for schema_name, build_schema, source_class in iter_view_schemas(view_class):
+        if schema_name not in schemas:
+            schemas[schema_name] = build_schema(source_class)
 
 
+def iter_view_schemas(view_class: Type[Any]) -> Iterator[Tuple[str, Callable[[Type[Any]], ObjectSchema], Type[Any]]]:
+    for build_schema, source_class in iter_view_schema_sources(view_class):
+        yield get_component_name(source_class), build_schema, source_class
 
-def extract_schemas(view_class: Type[Any], schemas: Dict[str, Any]) -> None:
+
+def iter_view_schema_sources(view_class: Type[Any]) -> Iterator[Tuple[Callable[[Type[Any]], ObjectSchema], Type[Any]]]:
     serializer_class = get_view_serializer(view_class)
     model_class = get_view_queryset_model(view_class)
     
     if serializer_class:
-        schema_name = serializer_class.__name__
-        if schema_name not in schemas:
-            schemas[schema_name] = build_serializer_schema(serializer_class)
+        yield build_serializer_schema, serializer_class
+        for nested_class in get_nested_serializers(serializer_class):
+            yield build_serializer_schema, nested_class
     
     if model_class:
-        schema_name = model_class.__name__
-        if schema_name not in schemas:
-            schemas[schema_name] = build_model_schema(model_class)
+        yield build_model_schema, model_class
+        for related_class in get_related_models(model_class):
+            yield build_model_schema, related_class
+
+
+def iter_component_classes(patterns: List[Dict[str, Any]]) -> Iterator[Type[Any]]:
+    for pattern_info in patterns:
+        view_class = pattern_info['view_class']
+        if next(iter_operation_specs(view_class, pattern_info['path']), None) is None:
+            continue
+        serializer_class = get_view_serializer(view_class)
+        model_class = get_view_queryset_model(view_class)
+        if serializer_class:
+            yield serializer_class
+            yield from get_declared_serializers(serializer_class)
+        if model_class:
+            yield model_class
+            yield from get_related_models(model_class)
 
 
-def build_serializer_schema(serializer_class: Type[serializers.Serializer]) -> Dict[str, Any]:
-    schema = {'type': 'object', 'properties': {}, 'required': []}
+def build_serializer_schema(serializer_class: Type[serializers.Serializer]) -> ObjectSchema:
+    properties = []
+    required = []
     
     for field_name, field_info in get_serializer_fields(serializer_class).items():
-        prop = {'type': field_info['type']}
-        for key in ['format', 'description', 'default', 'enum']:
-            if key in field_info:
-                prop[key] = field_info[key]
-        schema['properties'][field_name] = prop
+        if 'serializer' in field_info:
+            prop = build_nested_serializer_property(field_info)
+        else:
+            enum = field_info.get('enum')
+            prop = PropertySchema(
+                type=field_info['type'],
+                format=field_info.get('format'),
+                description=field_info.get('description'),
+                default=field_info.get('default', MISSING),
+                enum=tuple(enum) if enum is not None else None,
+            )
+        properties.append((field_name, prop))
         if field_info['required']:
-            schema['required'].append(field_name)
+            required.append(field_name)
     
-    return schema
+    return ObjectSchema(properties, required)
 
 
-def build_model_schema(model_class: Type[Any]) -> Dict[str, Any]:
-    schema = {
-        'type': 'object',
-        'properties': {'id': {'type': 'integer', 'description': 'Primary key'}},
-        'required': [],
-    }
+def build_nested_serializer_property(field_info: Dict[str, Any]) -> Node:
+    ref = Ref(get_component_name(field_info['serializer']))
+    if not field_info['many']:
+        return ref
+    return PropertySchema(type='array', items=ref, description=field_info.get('description'))
+
+
+def build_model_schema(model_class: Type[Any]) -> ObjectSchema:
+    properties = []
+    required = []
+    
+    pk = get_model_pk(model_class)
+    if pk is not None:
+        pk_name, pk_type_info = pk
+        properties.append((pk_name, PropertySchema(
+            type=pk_type_info['type'],
+            format=pk_type_info.get('format'),
+            description='Primary key',
+        )))
     
     for field_name, field_info in get_model_fields(model_class).items():
-        prop = {'type': field_info['type']}
-        for key in ['format', 'description', 'default']:
-            if key in field_info:
-                prop[key] = field_info[key]
-        schema['properties'][field_name] = prop
+        properties.append((field_name, build_model_field_property(field_info)))
         if field_info['required']:
-            schema['required'].append(field_name)
+            required.append(field_name)
     
-    return schema
+    return ObjectSchema(properties, required)
+
 
+def build_model_field_property(field_info: Dict[str, Any]) -> PropertySchema:
+    many = bool(field_info.get('many'))
+    read_only = bool(field_info.get('read_only'))
+    related_model = field_info.get('related_model')
+    
+    type_schema = PropertySchema(type=field_info['type'], format=field_info.get('format'))
+    return PropertySchema(
+        type='array' if many else type_schema.type,
+        format=None if many else type_schema.format,
+        items=type_schema if many else None,
+        description=field_info.get('description'),
+        default=field_info.get('default', MISSING),
+        read_only=read_only,
+        related=Ref(get_component_name(related_model)) if related_model is not None and not read_only else None,
+    )
@@ -0,0 +1,112 @@
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Type
+from django.db import models
+from rest_framework import serializers
+
+
+STRING_TYPE = MappingProxyType({'type': 'string'})
+
+
+class FieldTypeRegistry:
+    def __init__(self, types: Dict[Type[Any], Dict[str, Any]], default: Mapping[str, Any] = STRING_TYPE):
+        self.default = default
+        self._types: Dict[Type[Any], Mapping[str, Any]] = {}
+        self._resolved: Dict[Type[Any], Mapping[str, Any]] = {}
+        self._lock = threading.Lock()
+        for field_class, type_info in types.items():
+            self.register(field_class, type_info)
+    
+    def register(self, field_class: Type[Any], type_info: Dict[str, Any]) -> None:
+        with self._lock:
+            self._types[field_class] = MappingProxyType(dict(type_info))
+            self._resolved.clear()
+    
+    def unregister(self, field_class: Type[Any]) -> None:
+        with self._lock:
+            self._types.pop(field_class, None)
+            self._resolved.clear()
+    
+    def resolve(self, field_class: Type[Any]) -> Mapping[str, Any]:
+        try:
+            return self._resolved[field_class]
+        except KeyError:
+            pass
+        
+        type_info = next(
+            (self._types[klass] for klass in field_class.__mro__ if klass in self._types),
+            self.default,
+        )
+        self._resolved[field_class] = type_info
+        return type_info
+    
+    def reset_locks(self) -> None:
+        self._lock = threading.Lock()
+
+
+serializer_field_types = FieldTypeRegistry({
+    serializers.CharField: {'type': 'string'},
+    serializers.IntegerField: {'type': 'integer'},
+    serializers.FloatField: {'type': 'number'},
+    serializers.DecimalField: {'type': 'number'},
+    serializers.BooleanField: {'type': 'boolean'},
+    serializers.DateField: {'type': 'string', 'format': 'date'},
+    serializers.DateTimeField: {'type': 'string', 'format': 'date-time'},
+    serializers.TimeField: {'type': 'string', 'format': 'time'},
+    serializers.EmailField: {'type': 'string', 'format': 'email'},
+    serializers.URLField: {'type': 'string', 'format': 'uri'},
+    serializers.UUIDField: {'type': 'string', 'format': 'uuid'},
+    serializers.JSONField: {'type': 'object'},
+    serializers.FileField: {'type': 'string', 'format': 'binary'},
+    serializers.ImageField: {'type': 'string', 'format': 'binary'},
+    serializers.ListSerializer: {'type': 'array'},
+    serializers.Serializer: {'type': 'object'},
+})
+
+model_field_types = FieldTypeRegistry({
+    models.CharField: {'type': 'string'},
+    models.TextField: {'type': 'string'},
+    models.IntegerField: {'type': 'integer'},
+    models.BigIntegerField: {'type': 'integer'},
+    models.SmallIntegerField: {'type': 'integer'},
+    models.PositiveIntegerField: {'type': 'integer'},
+    models.FloatField: {'type': 'number'},
+    models.DecimalField: {'type': 'number'},
+    models.BooleanField: {'type': 'boolean'},
+    models.DateField: {'type': 'string', 'format': 'date'},
+    models.DateTimeField: {'type': 'string', 'format': 'date-time'},
+    models.TimeField: {'type': 'string', 'format': 'time'},
+    models.EmailField: {'type': 'string', 'format': 'email'},
+    models.URLField: {'type': 'string', 'format': 'uri'},
+    models.UUIDField: {'type': 'string', 'format': 'uuid'},
+    models.JSONField: {'type': 'object'},
+    models.FileField: {'type': 'string', 'format': 'binary'},
+    models.ImageField: {'type': 'string', 'format': 'binary'},
+})
+
+
+def reset_field_type_locks() -> None:
+    serializer_field_types.reset_locks()
+    model_field_types.reset_locks()
+
+
+def register_field_type(field_class: Type[serializers.Field], type_info: Dict[str, Any]) -> None:
+    from autoapi_swagger.cache import invalidate_schema_cache
+    from autoapi_swagger.incremental import clear_fragment_cache
+    from autoapi_swagger.utils import clear_introspection_caches
+    
+    serializer_field_types.register(field_class, type_info)
+    clear_introspection_caches()
+    invalidate_schema_cache()
+    clear_fragment_cache()
+
+
+def register_model_field_type(field_class: Type[models.Field], type_info: Dict[str, Any]) -> None:
+    from autoapi_swagger.cache import invalidate_schema_cache
+    from autoapi_swagger.incremental import clear_fragment_cache
+    from autoapi_swagger.utils import clear_introspection_caches
+    
+    model_field_types.register(field_class, type_info)
+    clear_introspection_caches()
+    invalidate_schema_cache()
+    clear_fragment_cache()
@@ -0,0 +1,130 @@
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type
+from django.db.models import ForeignObjectRel
+from autoapi_swagger.memo import ModuleStamp, stat_module
+from autoapi_swagger.naming import get_component_name
+from autoapi_swagger.utils import get_declared_serializers, get_view_serializer, get_view_queryset_model
+
+
+class ModuleStamps:
+    def __init__(self):
+        self._stamps: Dict[str, Optional[ModuleStamp]] = {}
+    
+    def for_module(self, module_name: str) -> Optional[ModuleStamp]:
+        if module_name not in self._stamps:
+            self._stamps[module_name] = stat_module(module_name)
+        return self._stamps[module_name]
+    
+    def for_classes(self, *classes: Optional[Type[Any]]) -> Tuple[ModuleStamp, ...]:
+        module_names = []
+        for cls in classes:
+            if cls is None:
+                continue
+            for klass in cls.__mro__:
+                if klass.__module__ not in module_names:
+                    module_names.append(klass.__module__)
+        return tuple(stamp for stamp in map(self.for_module, module_names) if stamp)
+
+
+class FragmentStore:
+    def __init__(self):
+        self._fragments: Dict[Hashable, Tuple[Tuple[Hashable, ...], Any]] = {}
+        self._lock = threading.Lock()
+        self.reused = 0
+        self.rebuilt = 0
+    
+    def build(
+        self,
+        patterns: List[Dict[str, Any]],
+        build_many: Callable[[List[Dict[str, Any]]], List[Any]],
+    ) -> List[Any]:
+        stamps = ModuleStamps()
+        keys = [fragment_key(pattern_info) for pattern_info in patterns]
+        view_stamps = [view_stamp(pattern_info['view_class'], stamps) for pattern_info in patterns]
+        
+        results: List[Any] = [None] * len(patterns)
+        missing = []
+        with self._lock:
+            for index, key in enumerate(keys):
+                entry = self._fragments.get(key)
+                if entry is not None and entry[0] == view_stamps[index]:
+                    results[index] = entry[1]
+                else:
+                    missing.append(index)
+            self.reused += len(patterns) - len(missing)
+            self.rebuilt += len(missing)
+        
+        built = build_many([patterns[index] for index in missing]) if missing else []
+        
+        with self._lock:
+            for index, fragment in zip(missing, built):
+                results[index] = fragment
+                self._fragments[keys[index]] = (view_stamps[index], fragment)
+        return results
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._fragments.clear()
+            self.reused = 0
+            self.rebuilt = 0
+    
+    def reset_locks(self) -> None:
+        self._lock = threading.Lock()
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'reused': self.reused,
+                'rebuilt': self.rebuilt,
+                'fragments': len(self._fragments),
+            }
+
+
+def fragment_key(pattern_info: Dict[str, Any]) -> Hashable:
+    view_class = pattern_info['view_class']
+    return (view_class.__module__, view_class.__qualname__, pattern_info['path'], pattern_info['name'])
+
+
+def view_stamp(view_class: Type[Any], stamps: ModuleStamps) -> Tuple[Hashable, ...]:
+    serializer_class = get_view_serializer(view_class)
+    model_class = get_view_queryset_model(view_class)
+    # Only class attributes and Django's model options are read, so a reused fragment costs no introspection.
+    sources = [
+        cls for cls in (
+            serializer_class,
+            model_class,
+            *(get_declared_serializers(serializer_class) if serializer_class else ()),
+            *get_relation_targets(model_class),
+        ) if cls is not None
+    ]
+    # Component names depend on the whole URLconf, so a fragment is only reused while its names still hold.
+    return stamps.for_classes(view_class, *sources) + tuple(map(get_component_name, sources))
+
+
+def get_relation_targets(model_class: Optional[Type[Any]]) -> Tuple[Type[Any], ...]:
+    if not hasattr(model_class, '_meta'):
+        return ()
+    seen = {model_class}
+    targets = []
+    queue = deque([model_class])
+    while queue:
+        for field in queue.popleft()._meta.get_fields():
+            target = field.related_model
+            if isinstance(field, ForeignObjectRel) or not isinstance(target, type) or target in seen:
+                continue
+            seen.add(target)
+            targets.append(target)
+            queue.append(target)
+    return tuple(targets)
+
+
+fragment_store = FragmentStore()
+
+
+def get_fragment_cache_stats() -> Dict[str, int]:
+    return fragment_store.stats()
+
+
+def clear_fragment_cache() -> None:
+    fragment_store.clear()
@@ -0,0 +1,109 @@
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+from django.dispatch import Signal
+
+
+STAGES = (
+    'extract_url_patterns',
+    'build_path_item',
+    'get_serializer_fields',
+    'get_model_fields',
+    'extract_schemas',
+    'assembly',
+    'validate_refs',
+)
+
+schema_stage_timed = Signal()
+
+StageHook = Callable[[str, Optional[str], float], None]
+_hooks: List[StageHook] = []
+
+
+def register_hook(callback: StageHook) -> None:
+    _hooks.append(callback)
+
+
+def unregister_hook(callback: StageHook) -> None:
+    if callback in _hooks:
+        _hooks.remove(callback)
+
+
+def is_enabled() -> bool:
+    return bool(_hooks) or bool(schema_stage_timed.receivers)
+
+
+def timed_stage(stage: str, subject: Any = None) -> ContextManager[None]:
+    if not is_enabled():
+        return nullcontext()
+    return _timed_stage(stage, subject)
+
+
+@contextmanager
+def _timed_stage(stage: str, subject: Any) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        emit(stage, get_label(subject), time.perf_counter() - start)
+
+
+def emit(stage: str, label: Optional[str], duration: float) -> None:
+    for hook in list(_hooks):
+        hook(stage, label, duration)
+    if schema_stage_timed.receivers:
+        schema_stage_timed.send(sender=None, stage=stage, label=label, duration=duration)
+
+
+def get_label(subject: Any) -> Optional[str]:
+    if subject is None or isinstance(subject, str):
+        return subject
+    return f'{subject.__module__}.{subject.__qualname__}'
+
+
+class SchemaBuildProfile:
+    def __init__(self):
+        self.events: List[Tuple[str, Optional[str], float]] = []
+        self._lock = threading.Lock()
+    
+    def __call__(self, stage: str, label: Optional[str], duration: float) -> None:
+        with self._lock:
+            self.events.append((stage, label, duration))
+    
+    def totals(self) -> Dict[str, Dict[str, float]]:
+        totals = {}
+        for stage, _, duration in self.events:
+            entry = totals.setdefault(stage, {'count': 0, 'seconds': 0.0})
+            entry['count'] += 1
+            entry['seconds'] += duration
+        return totals
+    
+    def by_label(self, *stages: str) -> Dict[str, float]:
+        durations = {}
+        for stage, label, duration in self.events:
+            if stage in stages and label is not None:
+                durations[label] = durations.get(label, 0.0) + duration
+        return durations
+    
+    def top(self, *stages: str, limit: int = 10) -> List[Tuple[str, float]]:
+        return sorted(self.by_label(*stages).items(), key=lambda item: item[1], reverse=True)[:limit]
+    
+    def slowest_views(self, limit: int = 10) -> List[Tuple[str, float]]:
+        return self.top('build_path_item', 'extract_schemas', limit=limit)
+    
+    def slowest_serializers(self, limit: int = 10) -> List[Tuple[str, float]]:
+        return self.top('get_serializer_fields', limit=limit)
+    
+    def slowest_models(self, limit: int = 10) -> List[Tuple[str, float]]:
+        return self.top('get_model_fields', limit=limit)
+
+
+@contextmanager
+def profile_schema_build() -> Iterator[SchemaBuildProfile]:
+    profile = SchemaBuildProfile()
+    register_hook(profile)
+    try:
+        yield profile
+    finally:
+        unregister_hook(profile)
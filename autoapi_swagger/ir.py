@@ -0,0 +1,283 @@
+import copy
+import json
+from operator import attrgetter
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Type
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+Render = Callable[[Any], Any]
+
+CONTENT_TYPE_JSON = 'application/json'
+
+
+class _MissingType:
+    __slots__ = ()
+    
+    def __reduce__(self):
+        return 'MISSING'
+    
+    def __repr__(self):
+        return 'MISSING'
+
+
+MISSING = _MissingType()
+
+
+class Node:
+    __slots__ = ()
+    interned = True
+    
+    def lower(self, render: Render) -> Any:
+        raise NotImplementedError
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if len(cls.__slots__) == 1:
+            getter = attrgetter(cls.__slots__[0])
+            cls._values = staticmethod(lambda node: (getter(node),))
+        elif cls.__slots__:
+            cls._values = staticmethod(attrgetter(*cls.__slots__))
+    
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self._values(self) == other._values(other)
+    
+    def __hash__(self) -> int:
+        return hash((type(self), self._values(self)))
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({values})'
+
+
+class Raw(Node):
+    __slots__ = ('value',)
+    
+    def __init__(self, value: Any):
+        self.value = value
+    
+    def lower(self, render: Render) -> Any:
+        return copy.deepcopy(self.value)
+    
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is Raw and other.value is self.value
+    
+    def __hash__(self) -> int:
+        return id(self.value)
+
+
+class Ref(Node):
+    __slots__ = ('name', 'section')
+    
+    def __init__(self, name: str, section: str = 'schemas'):
+        self.name = name
+        self.section = section
+    
+    def lower(self, render: Render) -> Dict[str, str]:
+        return {'$ref': f'#/components/{self.section}/{self.name}'}
+
+
+class ArraySchema(Node):
+    __slots__ = ('items',)
+    
+    def __init__(self, items: Node):
+        self.items = items
+    
+    def lower(self, render: Render) -> Dict[str, Any]:
+        return {'type': 'array', 'items': render(self.items)}
+
+
+class EnvelopeSchema(Node):
+    __slots__ = ('envelope', 'data')
+    
+    def __init__(self, envelope: Ref, data: Node):
+        self.envelope = envelope
+        self.data = data
+    
+    def lower(self, render: Render) -> Dict[str, Any]:
+        return {'allOf': [render(self.envelope), {'properties': {'data': render(self.data)}}]}
+
+
+class PropertySchema(Node):
+    __slots__ = ('type', 'format', 'items', 'description', 'default', 'enum', 'read_only', 'related')
+    
+    def __init__(
+        self,
+        type: Optional[str] = None,
+        format: Optional[str] = None,
+        items: Optional[Node] = None,
+        description: Optional[str] = None,
+        default: Any = MISSING,
+        enum: Optional[Sequence[Any]] = None,
+        read_only: bool = False,
+        related: Optional[Ref] = None,
+    ):
+        self.type = type
+        self.format = format
+        self.items = items
+        self.description = description
+        self.default = default
+        self.enum = enum
+        self.read_only = read_only
+        self.related = related
+    
+    def lower(self, render: Render) -> Dict[str, Any]:
+        schema = {'type': self.type}
+        if self.format is not None:
+            schema['format'] = self.format
+        if self.items is not None:
+            schema['items'] = render(self.items)
+        if self.description is not None:
+            schema['description'] = self.description
+        if self.default is not MISSING:
+            schema['default'] = copy.deepcopy(self.default)
+        if self.enum is not None:
+            schema['enum'] = list(self.enum)
+        if self.read_only:
+            schema['readOnly'] = True
+        if self.related is not None:
+            schema['x-related'] = render(self.related)
+        return schema
+
+
+class ObjectSchema(Node):
+    __slots__ = ('properties', 'required')
+    interned = False
+    
+    def __init__(self, properties: Sequence[Tuple[str, Node]] = (), required: Sequence[str] = ()):
+        self.properties = tuple(properties)
+        self.required = tuple(required)
+    
+    def lower(self, render: Render) -> Dict[str, Any]:
+        return {
+            'type': 'object',
+            'properties': {name: render(schema) for name, schema in self.properties},
+            'required': list(self.required),
+        }
+
+
+class Parameter(Node):
+    __slots__ = ('name', 'location', 'required', 'schema', 'description')
+    
+    def __init__(self, name: str, location: str, schema: Node, required: bool = False, description: Optional[str] = None):
+        self.name = name
+        self.location = location
+        self.required = required
+        self.schema = schema
+        self.description = description
+    
+    def lower(self, render: Render) -> Dict[str, Any]:
+        parameter = {'name': self.name, 'in': self.location, 'required': self.required, 'schema': render(self.schema)}
+        if self.description is not None:
+            parameter['description'] = self.description
+        return parameter
+
+
+class RequestBody(Node):
+    __slots__ = ('schema', 'required', 'media_type')
+    
+    def __init__(self, schema: Node, required: bool = True, media_type: str = CONTENT_TYPE_JSON):
+        self.schema = schema
+        self.required = required
+        self.media_type = media_type
+    
+    def lower(self, render: Render) -> Dict[str, Any]:
+        return {'required': self.required, 'content': {self.media_type: {'schema': render(self.schema)}}}
+
+
+class Response(Node):
+    __slots__ = ('description', 'schema', 'media_type')
+    
+    def __init__(self, description: str, schema: Optional[Node] = None, media_type: str = CONTENT_TYPE_JSON):
+        self.description = description
+        self.schema = schema
+        self.media_type = media_type
+    
+    def lower(self, render: Render) -> Dict[str, Any]:
+        response = {'description': self.description}
+        if self.schema is not None:
+            response['content'] = {self.media_type: {'schema': render(self.schema)}}
+        return response
+
+
+class Operation(Node):
+    __slots__ = ('summary', 'operation_id', 'tags', 'parameters', 'request_body', 'responses')
+    interned = False
+    
+    def __init__(
+        self,
+        summary: str,
+        operation_id: str,
+        tags: Sequence[str] = (),
+        parameters: Sequence[Node] = (),
+        request_body: Optional[Node] = None,
+        responses: Optional[Dict[str, Node]] = None,
+    ):
+        self.summary = summary
+        self.operation_id = operation_id
+        self.tags = tuple(tags)
+        self.parameters = tuple(parameters)
+        self.request_body = request_body
+        self.responses = responses or {}
+    
+    def lower(self, render: Render) -> Dict[str, Any]:
+        operation = {'summary': self.summary, 'operationId': self.operation_id, 'tags': list(self.tags)}
+        if self.parameters:
+            operation['parameters'] = [render(parameter) for parameter in self.parameters]
+        if self.request_body is not None:
+            operation['requestBody'] = render(self.request_body)
+        operation['responses'] = {code: render(response) for code, response in self.responses.items()}
+        return operation
+
+
+class Renderer:
+    # Interned output shares equal subtrees, which is only safe for documents that are serialized, not mutated.
+    def __init__(self, intern: bool = True):
+        self.intern = intern
+        self._rendered: Dict[Node, Any] = {}
+    
+    def render(self, value: Any) -> Any:
+        if not isinstance(value, Node):
+            return value
+        if not (self.intern and value.interned):
+            return value.lower(self.render)
+        try:
+            return self._rendered[value]
+        except KeyError:
+            rendered = self._rendered[value] = value.lower(self.render)
+            return rendered
+        except TypeError:
+            return value.lower(self.render)
+    
+    def render_paths(self, paths: Dict[str, Dict[str, Node]]) -> Dict[str, Dict[str, Any]]:
+        return {
+            path: {method: self.render(operation) for method, operation in path_item.items()}
+            for path, path_item in paths.items()
+        }
+    
+    def render_components(self, components: Dict[str, Any]) -> Dict[str, Any]:
+        return {name: self.render(component) for name, component in components.items()}
+
+
+def render_json(document: Dict[str, Any], encoder: Optional[Type[json.JSONEncoder]] = None, indent: Optional[int] = None) -> str:
+    if indent is None:
+        return json.dumps(document, cls=encoder, separators=(',', ':'), ensure_ascii=False)
+    return json.dumps(document, cls=encoder, indent=indent, ensure_ascii=False) + '\n'
+
+
+def render_yaml(document: Dict[str, Any], encoder: Optional[Type[json.JSONEncoder]] = None) -> str:
+    if yaml is None:
+        raise RuntimeError('Rendering the schema as YAML requires PyYAML (pip install autoapi-swagger[yaml])')
+    if encoder is not None:
+        document = json.loads(render_json(document, encoder))
+    return yaml.dump(document, Dumper=_YAMLDumper, sort_keys=False, allow_unicode=True)
+
+
+if yaml is not None:
+    class _YAMLDumper(yaml.SafeDumper):
+        # Rendered schemas share identical subtrees; spell them out instead of emitting anchors.
+        def ignore_aliases(self, data: Any) -> bool:
+            return True
@@ -0,0 +1,362 @@
+import http.client
+import itertools
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+COMPONENTS_PREFIX = '#/components/'
+JSON_CONTENT_TYPE = 'application/json'
+PERCENTILES = (50, 95, 99)
+SAFE_METHODS = ('get', 'head', 'options')
+MAX_BODY_DEPTH = 8
+
+STRING_FORMATS = {
+    'date-time': '2024-01-01T00:00:00Z',
+    'date': '2024-01-01',
+    'time': '00:00:00',
+    'email': 'user@example.com',
+    'uri': 'https://example.com/',
+    'url': 'https://example.com/',
+    'uuid': '00000000-0000-4000-8000-000000000000',
+    'ipv4': '127.0.0.1',
+    'ipv6': '::1',
+    'byte': 'ZXhhbXBsZQ==',
+    'binary': 'example',
+    'decimal': '1.00',
+    'slug': 'example',
+}
+TYPE_VALUES = {'integer': 1, 'number': 1, 'boolean': True, 'string': 'string'}
+CONVERTER_VALUES = {'int': '1', 'uuid': STRING_FORMATS['uuid']}
+
+PATH_PLACEHOLDER = re.compile(r'\{(?P<name>\w+)\}|<(?:(?P<converter>\w+):)?(?P<converter_name>\w+)>|\(\?P<(?P<group_name>\w+)>[^)]*\)')
+REGEX_CHARACTERS = re.compile(r'[\\()\[\]?*+|{}<>]')
+
+Send = Callable[[str, str, Any, Dict[str, str]], int]
+
+
+class LoadOperation:
+    __slots__ = ('operation_id', 'method', 'path', 'url', 'body')
+    
+    def __init__(self, operation_id: str, method: str, path: str, url: str, body: Any = None):
+        self.operation_id = operation_id
+        self.method = method
+        self.path = path
+        self.url = url
+        self.body = body
+    
+    def __repr__(self) -> str:
+        return f'LoadOperation({self.operation_id!r}, {self.method.upper()} {self.url})'
+
+
+class LoadPlan:
+    def __init__(self, operations: List[LoadOperation], skipped: Dict[str, str]):
+        self.operations = operations
+        self.skipped = skipped
+
+
+class OperationStats:
+    def __init__(self, operation_id: str, method: str, url: str):
+        self.operation_id = operation_id
+        self.method = method
+        self.url = url
+        self.latencies: List[float] = []
+        self.statuses: Dict[int, int] = {}
+        self.errors = 0
+    
+    def record(self, latency: float, status: int) -> None:
+        self.latencies.append(latency)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if not 0 < status < 400:
+            self.errors += 1
+    
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+        return {
+            'method': self.method.upper(),
+            'url': self.url,
+            'requests': len(latencies),
+            'errors': self.errors,
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+            'throughput': len(latencies) / elapsed if elapsed else 0.0,
+            **{f'p{percent}_ms': percentile(latencies, percent) * 1000 for percent in PERCENTILES},
+        }
+
+
+class LoadReport:
+    def __init__(self, stats: Dict[str, OperationStats], elapsed: float, concurrency: int, skipped: Dict[str, str]):
+        self.stats = stats
+        self.elapsed = elapsed
+        self.concurrency = concurrency
+        self.skipped = skipped
+    
+    def to_dict(self) -> Dict[str, Any]:
+        total = sum(len(stats.latencies) for stats in self.stats.values())
+        latencies = sorted(itertools.chain.from_iterable(stats.latencies for stats in self.stats.values()))
+        return {
+            'elapsed': self.elapsed,
+            'concurrency': self.concurrency,
+            'requests': total,
+            'errors': sum(stats.errors for stats in self.stats.values()),
+            'throughput': total / self.elapsed if self.elapsed else 0.0,
+            **{f'p{percent}_ms': percentile(latencies, percent) * 1000 for percent in PERCENTILES},
+            'operations': {operation_id: stats.summary(self.elapsed) for operation_id, stats in self.stats.items()},
+            'skipped': dict(self.skipped),
+        }
+    
+    def format_table(self) -> str:
+        report = self.to_dict()
+        width = max([len('operationId'), len('total')] + [len(operation_id) for operation_id in report['operations']])
+        lines = [f"{'operationId':<{width}}  {'requests':>8}  {'errors':>6}  {'req/s':>8}  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}"]
+        for operation_id, summary in sorted(report['operations'].items()):
+            lines.append(format_row(operation_id, summary, width))
+        lines.append(format_row('total', report, width))
+        return '\n'.join(lines)
+
+
+def format_row(label: str, summary: Dict[str, Any], width: int) -> str:
+    return (
+        f"{label:<{width}}  {summary['requests']:>8}  {summary['errors']:>6}  {summary['throughput']:>8.1f}  "
+        f"{summary['p50_ms']:>8.2f}  {summary['p95_ms']:>8.2f}  {summary['p99_ms']:>8.2f}"
+    )
+
+
+def percentile(ordered: List[float], percent: float) -> float:
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+def build_load_plan(
+    schema: Dict[str, Any],
+    methods: Optional[Iterable[str]] = None,
+    operation_ids: Optional[Iterable[str]] = None,
+    path_params: Optional[Dict[str, str]] = None,
+    unsafe_methods: bool = False,
+) -> LoadPlan:
+    methods = {method.lower() for method in methods} if methods else None
+    operation_ids = set(operation_ids) if operation_ids else None
+    components = schema.get('components', {})
+    
+    operations: List[LoadOperation] = []
+    skipped: Dict[str, str] = {}
+    taken: Dict[str, int] = {}
+    for path, path_item in schema.get('paths', {}).items():
+        for method, operation in path_item.items():
+            operation_id = operation.get('operationId') or f'{method}_{path}'
+            if (methods is not None and method not in methods) or (operation_ids is not None and operation_id not in operation_ids):
+                continue
+            # Several routes can share an operationId; keep their numbers apart.
+            taken[operation_id] = count = taken.get(operation_id, 0) + 1
+            if count > 1:
+                operation_id = f'{operation_id}_{count}'
+            
+            if not unsafe_methods and method not in SAFE_METHODS:
+                skipped[operation_id] = f'{method.upper()} writes data; unsafe methods are disabled'
+                continue
+            url = build_url(path, operation.get('parameters', ()), components, path_params or {})
+            if url is None:
+                skipped[operation_id] = f'cannot fill path {path}'
+                continue
+            operations.append(LoadOperation(operation_id, method, path, url, get_request_body(operation, components)))
+    return LoadPlan(operations, skipped)
+
+
+def build_url(
+    path: str,
+    parameters: Iterable[Dict[str, Any]],
+    components: Dict[str, Any],
+    path_params: Dict[str, str],
+) -> Optional[str]:
+    values = dict(path_params)
+    for parameter in parameters:
+        parameter = resolve(parameter, components)
+        if parameter.get('in') == 'path' and parameter['name'] not in values:
+            values[parameter['name']] = str(synthesize(parameter.get('schema', {}), components))
+    
+    def replace(match: 're.Match[str]') -> str:
+        name = match.group('name') or match.group('converter_name') or match.group('group_name')
+        if name in values:
+            return values[name]
+        return CONVERTER_VALUES.get(match.group('converter'), '1' if name in ('id', 'pk') else 'example')
+    
+    url = PATH_PLACEHOLDER.sub(replace, path).replace('^', '').replace('$', '')
+    if REGEX_CHARACTERS.search(url):
+        return None
+    return url
+
+
+def get_request_body(operation: Dict[str, Any], components: Dict[str, Any]) -> Any:
+    request_body = operation.get('requestBody')
+    if request_body is None:
+        return None
+    media = resolve(request_body, components).get('content', {}).get(JSON_CONTENT_TYPE)
+    if media is None:
+        return None
+    if 'example' in media:
+        return media['example']
+    return synthesize(media.get('schema', {}), components, write=True)
+
+
+def resolve(value: Dict[str, Any], components: Dict[str, Any]) -> Dict[str, Any]:
+    seen = set()
+    while '$ref' in value and value['$ref'] not in seen:
+        ref = value['$ref']
+        seen.add(ref)
+        if not ref.startswith(COMPONENTS_PREFIX):
+            return {}
+        section, _, name = ref[len(COMPONENTS_PREFIX):].partition('/')
+        value = components.get(section, {}).get(name, {})
+    return value
+
+
+def synthesize(schema: Dict[str, Any], components: Dict[str, Any], write: bool = False, stack: Tuple[str, ...] = ()) -> Any:
+    ref = schema.get('$ref')
+    if ref is not None:
+        if ref in stack or len(stack) >= MAX_BODY_DEPTH:
+            return None
+        return synthesize(resolve(schema, components), components, write, stack + (ref,))
+    
+    for key in ('example', 'default'):
+        if key in schema:
+            return schema[key]
+    if schema.get('enum'):
+        return schema['enum'][0]
+    if 'allOf' in schema:
+        merged: Dict[str, Any] = {}
+        for part in schema['allOf']:
+            value = synthesize(part, components, write, stack)
+            if isinstance(value, dict):
+                merged.update(value)
+        return merged
+    for key in ('oneOf', 'anyOf'):
+        if schema.get(key):
+            return synthesize(schema[key][0], components, write, stack)
+    
+    schema_type = schema.get('type', 'object' if 'properties' in schema else None)
+    if schema_type == 'object':
+        return {
+            name: value
+            for name, value in (
+                (name, synthesize(prop, components, write, stack))
+                for name, prop in schema.get('properties', {}).items()
+                if not (write and prop.get('readOnly'))
+            )
+            if value is not None or name in schema.get('required', ())
+        }
+    if schema_type == 'array':
+        item = synthesize(schema.get('items', {}), components, write, stack)
+        return [] if item is None else [item]
+    if schema_type == 'string':
+        return STRING_FORMATS.get(schema.get('format'), TYPE_VALUES['string'])
+    return TYPE_VALUES.get(schema_type)
+
+
+def run_load(
+    operations: List[LoadOperation],
+    send: Send,
+    concurrency: int = 8,
+    requests: int = 20,
+    duration: Optional[float] = None,
+    warmup: int = 1,
+    headers: Optional[Dict[str, str]] = None,
+    skipped: Optional[Dict[str, str]] = None,
+) -> LoadReport:
+    headers = headers or {}
+    stats = {operation.operation_id: OperationStats(operation.operation_id, operation.method, operation.url) for operation in operations}
+    
+    # The first requests fill the schema, ORM and connection caches; they are not measured.
+    for operation in operations:
+        for _ in range(warmup):
+            send_request(send, operation, headers)
+    
+    jobs = iter_jobs(operations, requests if duration is None else None)
+    lock = threading.Lock()
+    start = time.perf_counter()
+    deadline = None if duration is None else start + duration
+    
+    def worker() -> None:
+        while deadline is None or time.perf_counter() < deadline:
+            with lock:
+                operation = next(jobs, None)
+            if operation is None:
+                return
+            started = time.perf_counter()
+            status = send_request(send, operation, headers)
+            latency = time.perf_counter() - started
+            with lock:
+                stats[operation.operation_id].record(latency, status)
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker) for _ in range(concurrency)]:
+            future.result()
+    return LoadReport(stats, time.perf_counter() - start, concurrency, skipped or {})
+
+
+def send_request(send: Send, operation: LoadOperation, headers: Dict[str, str]) -> int:
+    # Transport failures are reported as status 0 instead of stopping the run.
+    try:
+        return send(operation.method, operation.url, operation.body, headers)
+    except Exception:
+        return 0
+
+
+def iter_jobs(operations: List[LoadOperation], requests: Optional[int]) -> Iterator[LoadOperation]:
+    # Interleave operations so every worker exercises a mix of endpoints.
+    if requests is None:
+        return itertools.cycle(operations)
+    return (operation for _ in range(requests) for operation in operations)
+
+
+class HTTPSender:
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        parts = urlsplit(base_url)
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.netloc = parts.netloc
+        self.base_path = parts.path.rstrip('/')
+        self.timeout = timeout
+        self._local = threading.local()
+    
+    def __call__(self, method: str, url: str, body: Any, headers: Dict[str, str]) -> int:
+        data = None
+        headers = dict(headers)
+        if body is not None:
+            data = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = JSON_CONTENT_TYPE
+        
+        # One keep-alive connection per worker thread; reconnect once if the server dropped it.
+        for attempt in range(2):
+            connection = getattr(self._local, 'connection', None)
+            if connection is None:
+                connection = self._local.connection = self.connection_class(self.netloc, timeout=self.timeout)
+            try:
+                connection.request(method.upper(), self.base_path + url, body=data, headers=headers)
+                response = connection.getresponse()
+                response.read()
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    raise
+                continue
+            return response.status
+        return 0
+
+
+class ClientSender:
+    def __init__(self):
+        self._local = threading.local()
+    
+    def __call__(self, method: str, url: str, body: Any, headers: Dict[str, str]) -> int:
+        from django.test import Client
+        
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = Client(raise_request_exception=False)
+        data = '' if body is None else json.dumps(body)
+        return client.generic(method.upper(), url, data, content_type=JSON_CONTENT_TYPE, headers=headers).status_code
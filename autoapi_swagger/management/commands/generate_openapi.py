@@ -0,0 +1,99 @@
+from contextlib import nullcontext
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.utils.encoders import JSONEncoder
+from autoapi_swagger.artifacts import write_schema_artifacts
+from autoapi_swagger.constants import DEFAULT_TITLE, DEFAULT_VERSION
+from autoapi_swagger.docs_generator import get_openapi_schema
+from autoapi_swagger.instrumentation import profile_schema_build
+from autoapi_swagger.naming import component_names
+from autoapi_swagger.refs import DanglingRefError, find_dangling_refs
+from autoapi_swagger.settings import get_setting
+
+
+class Command(BaseCommand):
+    help = 'Generate the OpenAPI schema and write openapi.json, a minified copy and pre-compressed variants.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--title', default=DEFAULT_TITLE)
+        parser.add_argument('--api-version', default=DEFAULT_VERSION)
+        parser.add_argument('--description', default='')
+        parser.add_argument(
+            '--server', dest='servers', action='append', metavar='URL',
+            help='Server URL to list in the schema. May be given more than once.',
+        )
+        parser.add_argument(
+            '--output-dir',
+            help='Directory to write the artifacts to. Defaults to AUTOAPI_SWAGGER["SCHEMA_ARTIFACT_DIR"].',
+        )
+        parser.add_argument('--indent', type=int, default=2)
+        parser.add_argument(
+            '--yaml', action='store_true',
+            help='Also write openapi.yaml. Requires PyYAML.',
+        )
+        parser.add_argument(
+            '--workers', type=int,
+            help='Build view operations and components on this many workers. Defaults to AUTOAPI_SWAGGER["SCHEMA_WORKERS"].',
+        )
+        parser.add_argument(
+            '--process-pool', action='store_const', const='process', dest='executor',
+            help='Use a process pool instead of a thread pool for --workers.',
+        )
+        parser.add_argument(
+            '--profile', action='store_true',
+            help='Print per-stage timings and the slowest views, serializers and models.',
+        )
+        parser.add_argument('--profile-top', type=int, default=10, metavar='N')
+        parser.add_argument(
+            '--validate', action='store_true',
+            help='Fail without writing anything if a $ref points at a missing component. Lists disambiguated component names.',
+        )
+    
+    def handle(self, *args, **options):
+        output_dir = options['output_dir'] or get_setting('SCHEMA_ARTIFACT_DIR') or '.'
+        servers = [{'url': url} for url in options['servers']] if options['servers'] else None
+        
+        if options['profile'] and options['executor'] == 'process':
+            self.stderr.write('Timings from process pool workers are not collected; per-view numbers will be missing.')
+        
+        with profile_schema_build() if options['profile'] else nullcontext() as profile:
+            schema = get_openapi_schema(
+                title=options['title'],
+                version=options['api_version'],
+                description=options['description'],
+                servers=servers,
+                workers=options['workers'],
+                executor=options['executor'],
+                intern=True,
+            )
+        
+        if options['profile']:
+            self.write_profile(profile, options['profile_top'])
+        
+        if options['validate']:
+            self.validate(schema)
+        
+        for path in write_schema_artifacts(schema, output_dir, encoder=JSONEncoder, indent=options['indent'], yaml=options['yaml']):
+            self.stdout.write(f'Wrote {path} ({path.stat().st_size} bytes)')
+    
+    def validate(self, schema):
+        for name, qualified in component_names.collisions().items():
+            self.stderr.write(f"Component name {name!r} is used by several classes: {', '.join(qualified)}")
+        dangling = find_dangling_refs(schema)
+        if dangling:
+            raise CommandError(str(DanglingRefError(dangling)))
+        self.stdout.write('All $refs resolve.')
+    
+    def write_profile(self, profile, limit):
+        self.stdout.write('Stage timings:')
+        for stage, totals in profile.totals().items():
+            self.stdout.write(f"  {stage:<24} {totals['seconds'] * 1000:>10.2f} ms  ({totals['count']} calls)")
+        
+        for heading, entries in (
+            ('Slowest views', profile.slowest_views(limit)),
+            ('Slowest serializers', profile.slowest_serializers(limit)),
+            ('Slowest models', profile.slowest_models(limit)),
+        ):
+            if entries:
+                self.stdout.write(f'{heading}:')
+                for label, seconds in entries:
+                    self.stdout.write(f'  {seconds * 1000:>10.2f} ms  {label}')
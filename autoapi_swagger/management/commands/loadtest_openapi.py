@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.utils.encoders import JSONEncoder
+from autoapi_swagger.docs_generator import get_openapi_schema
+from autoapi_swagger.loadtest import SAFE_METHODS, ClientSender, HTTPSender, build_load_plan, run_load
+
+
+class Command(BaseCommand):
+    help = 'Drive concurrent load at every documented operation and report throughput and p50/p95/p99 latency per operationId.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            help='Base URL of a running server, e.g. http://127.0.0.1:8000. Without it requests go through the Django test client.',
+        )
+        parser.add_argument('--schema', help='Read the schema from this openapi.json instead of generating it.')
+        parser.add_argument('--tag', help='Only load operations with this tag.')
+        parser.add_argument('--prefix', help='Only load operations whose path starts with this prefix.')
+        parser.add_argument(
+            '--method', dest='methods', action='append', metavar='METHOD',
+            help='Only load this HTTP method. May be given more than once.',
+        )
+        parser.add_argument(
+            '--unsafe-methods', action='store_true',
+            help='Also send POST, PUT, PATCH and DELETE requests. These write to the database the server or test client uses.',
+        )
+        parser.add_argument(
+            '--operation', dest='operation_ids', action='append', metavar='OPERATION_ID',
+            help='Only load this operationId. May be given more than once.',
+        )
+        parser.add_argument(
+            '--path-param', dest='path_params', action='append', default=[], metavar='NAME=VALUE',
+            help='Value for a path parameter. Defaults to 1 for ids and "example" otherwise.',
+        )
+        parser.add_argument(
+            '--header', dest='headers', action='append', default=[], metavar='"NAME: VALUE"',
+            help='Header to send with every request, e.g. "Authorization: Token ...".',
+        )
+        parser.add_argument('--concurrency', type=int, default=8)
+        parser.add_argument('--requests', type=int, default=20, help='Measured requests per operation.')
+        parser.add_argument('--duration', type=float, help='Run for this many seconds instead of a fixed number of requests.')
+        parser.add_argument('--warmup', type=int, default=1, help='Unmeasured requests per operation before the run.')
+        parser.add_argument('--output', help='Also write the report as JSON to this file.')
+    
+    def handle(self, *args, **options):
+        unsafe = sorted({method.upper() for method in options['methods'] or () if method.lower() not in SAFE_METHODS})
+        if unsafe and not options['unsafe_methods']:
+            raise CommandError(f"{', '.join(unsafe)} requests write data; pass --unsafe-methods to send them.")
+        
+        if options['schema']:
+            if options['tag'] or options['prefix']:
+                raise CommandError('--tag and --prefix cannot be combined with --schema.')
+            schema = json.loads(Path(options['schema']).read_text())
+        else:
+            schema = json.loads(json.dumps(get_openapi_schema(tag=options['tag'], prefix=options['prefix'], intern=True), cls=JSONEncoder))
+        
+        plan = build_load_plan(
+            schema,
+            methods=options['methods'],
+            operation_ids=options['operation_ids'],
+            path_params=dict(self.split(value, '=', '--path-param') for value in options['path_params']),
+            unsafe_methods=options['unsafe_methods'],
+        )
+        for operation_id, reason in plan.skipped.items():
+            self.stderr.write(f'Skipping {operation_id}: {reason}')
+        if not plan.operations:
+            raise CommandError('No operations to load.')
+        
+        report = run_load(
+            plan.operations,
+            HTTPSender(options['url']) if options['url'] else ClientSender(),
+            concurrency=options['concurrency'],
+            requests=options['requests'],
+            duration=options['duration'],
+            warmup=options['warmup'],
+            headers=dict(self.split(value, ':', '--header') for value in options['headers']),
+            skipped=plan.skipped,
+        )
+        
+        self.stdout.write(report.format_table())
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(report.to_dict(), indent=2))
+            self.stdout.write(f"Wrote {options['output']}")
+    
+    def split(self, value, separator, option):
+        name, found, rest = value.partition(separator)
+        if not found or not name.strip():
+            raise CommandError(f'{option} expects NAME{separator}VALUE, got {value!r}.')
+        return name.strip(), rest.strip()
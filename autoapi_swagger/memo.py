@@ -0,0 +1,90 @@
+import os
+import sys
+import threading
+import weakref
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+ModuleStamp = Tuple[str, int, int]
+
+
+def stat_module(module_name: Optional[str]) -> Optional[ModuleStamp]:
+    module = sys.modules.get(module_name) if module_name else None
+    filename = getattr(module, '__file__', None)
+    if not filename:
+        return None
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return (module_name, stat.st_mtime_ns, stat.st_size)
+
+
+class WeakMemo:
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = weakref.WeakKeyDictionary()
+        self._stamps = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+    
+    def get_or_compute(self, key: Any, compute: Callable[[Any], Any]) -> Any:
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+            else:
+                self._data[key] = value
+                self.hits += 1
+                return value
+        
+        value = compute(key)
+        stamp = stat_module(getattr(key, '__module__', None))
+        
+        with self._lock:
+            self._data[key] = value
+            self._stamps[key] = stamp
+            while len(self._data) > self.maxsize:
+                evicted = next(iter(self._data))
+                del self._data[evicted]
+                self._stamps.pop(evicted, None)
+        return value
+    
+    def prune(self) -> None:
+        # Entries survive unless the source file of their key's module changed since they were computed.
+        stamps: Dict[Optional[str], Optional[ModuleStamp]] = {}
+        with self._lock:
+            for key in list(self._data):
+                module_name = getattr(key, '__module__', None)
+                if module_name not in stamps:
+                    stamps[module_name] = stat_module(module_name)
+                if self._stamps.get(key) != stamps[module_name]:
+                    del self._data[key]
+                    self._stamps.pop(key, None)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._stamps.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def reset_locks(self) -> None:
+        self._lock = threading.Lock()
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
+    
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+    
+    def __len__(self) -> int:
+        return len(self._data)
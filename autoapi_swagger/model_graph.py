@@ -0,0 +1,163 @@
+import threading
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Type
+from django.db import models
+from django.db.models import ForeignObjectRel
+from autoapi_swagger.field_types import model_field_types
+from autoapi_swagger.memo import ModuleStamp, stat_module
+
+
+class ModelGraph:
+    def __init__(self):
+        self._fields: Dict[Type[models.Model], Mapping[str, Mapping[str, Any]]] = {}
+        self._related: Dict[Type[models.Model], Tuple[Type[models.Model], ...]] = {}
+        self._stamps: Dict[str, Optional[ModuleStamp]] = {}
+        self._indexed = False
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+    
+    def index(self) -> None:
+        from django.apps import apps
+        
+        with self._lock:
+            if self._indexed:
+                return
+            for model_class in apps.get_models():
+                if model_class not in self._fields:
+                    self._add(model_class)
+            self._indexed = True
+    
+    def get_fields(self, model_class: Type[models.Model]) -> Mapping[str, Mapping[str, Any]]:
+        if not self._indexed:
+            self.index()
+        fields = self._fields.get(model_class)
+        if fields is not None:
+            self.hits += 1
+            return fields
+        
+        with self._lock:
+            if model_class not in self._fields:
+                self.misses += 1
+                self._add(model_class)
+            return self._fields[model_class]
+    
+    def get_related_models(self, model_class: Type[models.Model]) -> Tuple[Type[models.Model], ...]:
+        related = self._related.get(model_class)
+        if related is not None:
+            return related
+        
+        seen = {model_class}
+        related = []
+        queue = deque([model_class])
+        while queue:
+            for field_info in self.get_fields(queue.popleft()).values():
+                target = field_info.get('related_model')
+                if target is None or field_info.get('read_only') or target in seen:
+                    continue
+                seen.add(target)
+                related.append(target)
+                queue.append(target)
+        
+        with self._lock:
+            self._related[model_class] = tuple(related)
+        return self._related[model_class]
+    
+    def prune(self) -> None:
+        # Related models span modules, so one changed model module drops the whole graph.
+        with self._lock:
+            if any(stamp != stat_module(module_name) for module_name, stamp in self._stamps.items()):
+                self.clear()
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._fields.clear()
+            self._related.clear()
+            self._stamps.clear()
+            self._indexed = False
+            self.hits = 0
+            self.misses = 0
+    
+    def reset_locks(self) -> None:
+        self._lock = threading.RLock()
+    
+    def _add(self, model_class: Type[models.Model]) -> None:
+        self._fields[model_class] = introspect_model_fields(model_class)
+        if model_class.__module__ not in self._stamps:
+            self._stamps[model_class.__module__] = stat_module(model_class.__module__)
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'models': len(self._fields),
+        }
+
+
+model_graph = ModelGraph()
+
+
+def introspect_model_fields(model_class: Type[models.Model]) -> Mapping[str, Mapping[str, Any]]:
+    fields = {}
+    meta = model_class._meta
+    
+    for field in meta.get_fields():
+        if field.is_relation and field.related_model is None:
+            continue
+        if isinstance(field, ForeignObjectRel):
+            fields[field.get_accessor_name()] = MappingProxyType(get_reverse_relation_info(field))
+        elif field is not meta.pk:
+            fields[field.name] = MappingProxyType(get_field_info(field))
+    
+    return MappingProxyType(fields)
+
+
+def get_field_info(field: models.Field) -> Dict[str, Any]:
+    field_info = dict(get_field_type_info(field))
+    field_info['required'] = not (field.blank or field.null or field.has_default())
+    
+    if field.help_text:
+        field_info['description'] = str(field.help_text)
+    
+    if field.has_default() and not callable(field.default):
+        field_info['default'] = field.default
+    
+    if not field.editable:
+        field_info['read_only'] = True
+    
+    if field.is_relation:
+        field_info['related_model'] = field.related_model
+        field_info['many'] = field.many_to_many or field.one_to_many
+    
+    return field_info
+
+
+def get_reverse_relation_info(relation: ForeignObjectRel) -> Dict[str, Any]:
+    field_info = dict(get_pk_type_info(relation.related_model))
+    field_info.update({
+        'required': False,
+        'read_only': True,
+        'related_model': relation.related_model,
+        'many': relation.one_to_many or relation.many_to_many,
+    })
+    return field_info
+
+
+def get_field_type_info(field: models.Field) -> Mapping[str, Any]:
+    if not field.is_relation:
+        return model_field_types.resolve(type(field))
+    if field.many_to_many or field.one_to_many:
+        return get_pk_type_info(field.related_model)
+    return get_field_type_info(field.target_field)
+
+
+def get_pk_type_info(model_class: Type[models.Model]) -> Mapping[str, Any]:
+    return get_field_type_info(model_class._meta.pk)
+
+
+def get_model_pk(model_class: Type[models.Model]) -> Optional[Tuple[str, Mapping[str, Any]]]:
+    pk = model_class._meta.pk
+    if pk is None:
+        return None
+    return pk.name, get_pk_type_info(model_class)
@@ -0,0 +1,105 @@
+import logging
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+
+logger = logging.getLogger(__name__)
+
+INVALID_NAME_CHARACTERS = re.compile(r'[^A-Za-z0-9._-]')
+
+
+class ComponentNames:
+    def __init__(self):
+        self._names: Dict[Type[Any], str] = {}
+        self._taken: Dict[str, Type[Any]] = {}
+        self._collisions: Dict[str, Tuple[str, ...]] = {}
+        self._indexed = False
+        self._source: Any = None
+        self._lock = threading.Lock()
+    
+    @property
+    def indexed(self) -> bool:
+        return self._indexed
+    
+    def indexed_for(self, source: Any) -> bool:
+        return self._indexed and self._source is source
+    
+    def index(self, classes: Iterable[Type[Any]], source: Any = None) -> None:
+        groups: Dict[str, List[Type[Any]]] = {}
+        for cls in classes:
+            group = groups.setdefault(cls.__name__, [])
+            if cls not in group:
+                group.append(cls)
+        
+        names: Dict[Type[Any], str] = {}
+        taken: Dict[str, Type[Any]] = {}
+        collisions: Dict[str, Tuple[str, ...]] = {}
+        for name, group in groups.items():
+            if len(group) == 1:
+                names[group[0]] = name
+                taken[name] = group[0]
+                continue
+            qualified = []
+            for cls in group:
+                qualified_name = base_name = get_qualified_name(cls)
+                suffix = 2
+                while qualified_name in taken:
+                    qualified_name = f'{base_name}_{suffix}'
+                    suffix += 1
+                names[cls] = qualified_name
+                taken[qualified_name] = cls
+                qualified.append(qualified_name)
+            taken[name] = group[0]
+            collisions[name] = tuple(qualified)
+            logger.warning(
+                'Component name %r is used by %d classes; naming them %s', name, len(group), ', '.join(qualified),
+            )
+        
+        with self._lock:
+            self._names, self._taken, self._collisions = names, taken, collisions
+            self._indexed = True
+            self._source = source
+    
+    def get(self, cls: Type[Any]) -> str:
+        name = self._names.get(cls)
+        if name is not None:
+            return name
+        name = cls.__name__
+        return get_qualified_name(cls) if self._taken.get(name, cls) is not cls else name
+    
+    def collisions(self) -> Dict[str, Tuple[str, ...]]:
+        return dict(self._collisions)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._names, self._taken, self._collisions = {}, {}, {}
+            self._indexed = False
+            self._source = None
+    
+    def reset_locks(self) -> None:
+        self._lock = threading.Lock()
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            'components': len(self._names),
+            'collisions': len(self._collisions),
+        }
+
+
+component_names = ComponentNames()
+
+
+def get_qualified_name(cls: Type[Any]) -> str:
+    return INVALID_NAME_CHARACTERS.sub('_', f'{cls.__module__}.{cls.__qualname__}')
+
+
+def get_component_name(cls: Type[Any]) -> str:
+    from autoapi_swagger.utils import get_current_resolver
+    
+    resolver = get_current_resolver()
+    if not component_names.indexed_for(resolver):
+        from autoapi_swagger.docs_generator import get_drf_patterns, iter_component_classes
+        
+        component_names.index(iter_component_classes(get_drf_patterns(resolver)), source=resolver)
+    return component_names.get(cls)
@@ -0,0 +1,108 @@
+import gzip
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Iterable, Optional, Type
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+IDENTITY = 'identity'
+GZIP = 'gzip'
+BROTLI = 'br'
+
+# Payloads built at runtime are compressed on the first request; artifacts are compressed offline.
+RUNTIME_LEVELS = {GZIP: 6, BROTLI: 5}
+MAX_LEVELS = {GZIP: 9, BROTLI: 11}
+
+
+def get_available_encodings() -> tuple:
+    if brotli is not None:
+        return (BROTLI, GZIP, IDENTITY)
+    return (GZIP, IDENTITY)
+
+
+def compress(content: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    if encoding == GZIP:
+        return gzip.compress(content, compresslevel=level or RUNTIME_LEVELS[GZIP], mtime=0)
+    if encoding == BROTLI:
+        if brotli is None:
+            raise ValueError('Brotli compression requires the "brotli" package')
+        return brotli.compress(content, mode=brotli.MODE_TEXT, quality=level or RUNTIME_LEVELS[BROTLI])
+    return content
+
+
+class SchemaPayload:
+    def __init__(self, content: bytes, encoded: Optional[Dict[str, bytes]] = None):
+        self.content = content
+        self.digest = hashlib.sha256(content).hexdigest()
+        self._encoded = {IDENTITY: content}
+        self._encoded.update(encoded or {})
+        self._locks = {GZIP: threading.Lock(), BROTLI: threading.Lock()}
+    
+    @classmethod
+    def from_schema(cls, schema: Dict[str, Any], encoder: Optional[Type[json.JSONEncoder]] = None) -> 'SchemaPayload':
+        content = json.dumps(schema, cls=encoder, separators=(',', ':'), ensure_ascii=False)
+        return cls(content.encode('utf-8'))
+    
+    def encode(self, encoding: str) -> bytes:
+        if encoding not in self._encoded:
+            # Concurrent first requests for one encoding share a single compression.
+            with self._locks[encoding]:
+                if encoding not in self._encoded:
+                    self._encoded[encoding] = compress(self.content, encoding)
+        return self._encoded[encoding]
+    
+    def is_encoded(self, encoding: str) -> bool:
+        return encoding in self._encoded
+    
+    def reset_locks(self) -> None:
+        self._locks = {GZIP: threading.Lock(), BROTLI: threading.Lock()}
+    
+    def etag(self, encoding: str = IDENTITY) -> str:
+        if encoding == IDENTITY:
+            return f'"{self.digest}"'
+        return f'"{self.digest}-{encoding}"'
+    
+    def matches(self, etags: Iterable[str]) -> bool:
+        for etag in etags:
+            if etag == '*':
+                return True
+            if etag.startswith('W/'):
+                etag = etag[2:]
+            if etag.strip('"').split('-')[0] == self.digest:
+                return True
+        return False
+
+
+def choose_encoding(accept_encoding: str, available: Iterable[str]) -> str:
+    weights = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[coding] = quality
+    
+    best, best_quality = None, 0.0
+    for coding in available:
+        if coding == IDENTITY:
+            continue
+        quality = weights.get(coding, weights.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    
+    if best is None or best_quality < weights.get(IDENTITY, 0.0):
+        return IDENTITY
+    return best
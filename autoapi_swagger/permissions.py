@@ -0,0 +1,130 @@
+from typing import Any, Dict, FrozenSet, Hashable, List, Optional, Set, Tuple, Type
+from django.core.exceptions import PermissionDenied
+from django.http import Http404
+from rest_framework import exceptions, permissions, viewsets
+from rest_framework.request import Request, clone_request
+from rest_framework.settings import api_settings
+from rest_framework.views import APIView
+from autoapi_swagger.docs_generator import get_drf_patterns, iter_operation_specs
+
+
+OperationKey = Tuple[str, str]
+PermissionCheck = Tuple[Type[Any], str, Optional[str], Tuple[Any, ...]]
+Fingerprint = FrozenSet[Hashable]
+
+# Permissions that only look at the request (user and method), so one check covers every view using them.
+REQUEST_SCOPED_PERMISSIONS = (
+    permissions.AllowAny,
+    permissions.IsAuthenticated,
+    permissions.IsAdminUser,
+    permissions.IsAuthenticatedOrReadOnly,
+)
+
+
+class OperationPermissions:
+    def __init__(self):
+        self.operations: Dict[OperationKey, Hashable] = {}
+        self.checks: Dict[Hashable, PermissionCheck] = {}
+    
+    def add(self, path: str, method: str, view_class: Type[Any], action_name: Optional[str]) -> None:
+        permission_classes = get_permission_classes(view_class, action_name)
+        key = get_check_key(view_class, method, action_name, permission_classes)
+        self.operations[(path, method)] = key
+        self.checks.setdefault(key, (view_class, method, action_name, permission_classes))
+    
+    def get_permission_classes(self, path: str, method: str) -> Tuple[Any, ...]:
+        return self.checks[self.operations[(path, method)]][3]
+    
+    def fingerprint(self, request: Request) -> Fingerprint:
+        # Authenticate once; every cloned request below reuses the user.
+        request.user
+        return frozenset(
+            key for key, (view_class, method, action_name, permission_classes) in self.checks.items()
+            if has_operation_permission(request, view_class, method, action_name, permission_classes)
+        )
+    
+    def allows_all(self, fingerprint: Fingerprint) -> bool:
+        return len(fingerprint) == len(self.checks)
+    
+    def allowed_operations(self, fingerprint: Fingerprint) -> Set[OperationKey]:
+        return {operation for operation, key in self.operations.items() if key in fingerprint}
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            'operations': len(self.operations),
+            'checks': len(self.checks),
+        }
+
+
+def build_operation_permissions(patterns: Optional[List[Dict[str, Any]]] = None) -> OperationPermissions:
+    operation_permissions = OperationPermissions()
+    for pattern_info in get_drf_patterns() if patterns is None else patterns:
+        view_class = pattern_info['view_class']
+        for op_path, method, action_name, _ in iter_operation_specs(view_class, pattern_info['path']):
+            operation_permissions.add(op_path, method, view_class, action_name)
+    return operation_permissions
+
+
+def get_permission_classes(view_class: Type[Any], action_name: Optional[str]) -> Tuple[Any, ...]:
+    if action_name and hasattr(view_class, 'get_extra_actions'):
+        for action in view_class.get_extra_actions():
+            name = getattr(action, 'url_name', None) or getattr(action, 'name', 'unknown')
+            if name == action_name and 'permission_classes' in getattr(action, 'kwargs', {}):
+                return tuple(action.kwargs['permission_classes'])
+    return tuple(getattr(view_class, 'permission_classes', api_settings.DEFAULT_PERMISSION_CLASSES))
+
+
+def get_check_key(
+    view_class: Type[Any],
+    method: str,
+    action_name: Optional[str],
+    permission_classes: Tuple[Any, ...],
+) -> Hashable:
+    if overrides_permissions(view_class) or not all(map(is_request_scoped, permission_classes)):
+        return (view_class, method, action_name)
+    return (tuple(map(freeze, permission_classes)), method)
+
+
+def overrides_permissions(view_class: Type[Any]) -> bool:
+    return (
+        getattr(view_class, 'get_permissions', None) is not APIView.get_permissions
+        or getattr(view_class, 'check_permissions', None) is not APIView.check_permissions
+    )
+
+
+def is_request_scoped(permission_class: Any) -> bool:
+    operands = [getattr(permission_class, name) for name in ('op1_class', 'op2_class') if hasattr(permission_class, name)]
+    if operands:
+        return all(map(is_request_scoped, operands))
+    return permission_class in REQUEST_SCOPED_PERMISSIONS or getattr(permission_class, 'autoapi_request_scoped', False)
+
+
+def freeze(permission_class: Any) -> Hashable:
+    try:
+        hash(permission_class)
+    except TypeError:
+        return ('id', id(permission_class))
+    return permission_class
+
+
+def has_operation_permission(
+    request: Request,
+    view_class: Type[Any],
+    method: str,
+    action_name: Optional[str],
+    permission_classes: Tuple[Any, ...],
+) -> bool:
+    view = view_class()
+    view.args = ()
+    view.kwargs = {}
+    view.format_kwarg = None
+    view.permission_classes = permission_classes
+    if issubclass(view_class, viewsets.ViewSetMixin):
+        view.action = action_name
+        view.action_map = {method: action_name}
+    view.request = clone_request(request, method.upper())
+    try:
+        view.check_permissions(view.request)
+    except (exceptions.APIException, Http404, PermissionDenied):
+        return False
+    return True
@@ -0,0 +1,168 @@
+import os
+from bisect import bisect_left
+from typing import Any, Callable, Container, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+COMPONENTS_PREFIX = '#/components/'
+MAX_REPORTED_REFS = 20
+
+
+class DanglingRefError(ValueError):
+    def __init__(self, dangling: Dict[str, List[str]]):
+        self.dangling = dangling
+        lines = [f'{ref} (from {", ".join(locations)})' for ref, locations in list(dangling.items())[:MAX_REPORTED_REFS]]
+        if len(dangling) > MAX_REPORTED_REFS:
+            lines.append(f'... and {len(dangling) - MAX_REPORTED_REFS} more')
+        super().__init__(f'{len(dangling)} dangling $ref(s) in the OpenAPI schema:\n  ' + '\n  '.join(lines))
+
+
+class ShardCatalog:
+    __slots__ = ('tags', 'paths')
+    
+    def __init__(self, tags: Dict[str, int], paths: Iterable[str]):
+        self.tags = tags
+        self.paths = tuple(sorted(set(paths)))
+    
+    def resolve_prefix(self, prefix: str) -> Optional[str]:
+        # Every prefix selecting the same paths maps to one canonical prefix, so callers can cache by it.
+        if not prefix.startswith('/'):
+            prefix = '/' + prefix
+        start = bisect_left(self.paths, prefix)
+        end = start
+        while end < len(self.paths) and self.paths[end].startswith(prefix):
+            end += 1
+        if start == end:
+            return None
+        return os.path.commonprefix([self.paths[start], self.paths[end - 1]])
+
+
+def iter_refs(value: Any, seen: Optional[Set[int]] = None) -> Iterator[str]:
+    stack = [value] if isinstance(value, (dict, list)) else []
+    push = stack.append
+    while stack:
+        current = stack.pop()
+        if seen is not None:
+            # Rendered schemas share identical subtrees; each one only needs walking once.
+            if id(current) in seen:
+                continue
+            seen.add(id(current))
+        if isinstance(current, dict):
+            ref = current.get('$ref')
+            if isinstance(ref, str):
+                yield ref
+            children = current.values()
+        else:
+            children = current
+        for child in children:
+            if isinstance(child, (dict, list)):
+                push(child)
+
+
+def split_ref(ref: str) -> Optional[Tuple[str, str]]:
+    if not ref.startswith(COMPONENTS_PREFIX):
+        return None
+    section, _, name = ref[len(COMPONENTS_PREFIX):].partition('/')
+    if not section or not name:
+        return None
+    return section, name
+
+
+def get_referenced_components(schema: Dict[str, Any]) -> Set[Tuple[str, str]]:
+    components = schema.get('components', {})
+    roots = {key: value for key, value in schema.items() if key != 'components'}
+    
+    seen: Set[Tuple[str, str]] = set()
+    pending = list(iter_refs(roots))
+    while pending:
+        target = split_ref(pending.pop())
+        if target is None or target in seen:
+            continue
+        seen.add(target)
+        section, name = target
+        if name in components.get(section, {}):
+            pending.extend(iter_refs(components[section][name]))
+    return seen
+
+
+def prune_components(schema: Dict[str, Any]) -> Dict[str, Any]:
+    referenced = get_referenced_components(schema)
+    components = {}
+    for section, entries in schema.get('components', {}).items():
+        kept = {name: value for name, value in entries.items() if (section, name) in referenced}
+        if kept:
+            components[section] = kept
+    return {**schema, 'components': components}
+
+
+def filter_schema(schema: Dict[str, Any], tag: Optional[str] = None, prefix: Optional[str] = None) -> Dict[str, Any]:
+    return filter_operations(schema, lambda path, method, operation: (
+        (not prefix or path.startswith(prefix)) and (tag is None or tag in operation.get('tags', ()))
+    ))
+
+
+def select_operations(schema: Dict[str, Any], operations: Container[Tuple[str, str]]) -> Dict[str, Any]:
+    return filter_operations(schema, lambda path, method, operation: (path, method) in operations)
+
+
+def filter_operations(schema: Dict[str, Any], keep: Callable[[str, str, Dict[str, Any]], bool]) -> Dict[str, Any]:
+    paths = {}
+    for path, path_item in schema.get('paths', {}).items():
+        operations = {method: operation for method, operation in path_item.items() if keep(path, method, operation)}
+        if operations:
+            paths[path] = operations
+    return prune_components({**schema, 'paths': paths})
+
+
+def get_tag_counts(schema: Dict[str, Any]) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for path_item in schema.get('paths', {}).values():
+        for operation in path_item.values():
+            for tag in operation.get('tags', ()):
+                counts[tag] = counts.get(tag, 0) + 1
+    return counts
+
+
+def find_dangling_refs(schema: Dict[str, Any]) -> Dict[str, List[str]]:
+    components = schema.get('components', {})
+    index = {(section, name) for section, entries in components.items() for name in entries}
+    
+    checked: Dict[str, bool] = {}
+    dangling: Dict[str, List[str]] = {}
+    seen: Set[int] = set()
+    for location, value in iter_locations(schema):
+        for ref in iter_refs(value, seen):
+            resolved = checked.get(ref)
+            if resolved is None:
+                target = split_ref(ref)
+                resolved = checked[ref] = target in index if ref.startswith(COMPONENTS_PREFIX) else True
+            if not resolved:
+                dangling.setdefault(ref, []).append(location)
+    return dangling
+
+
+def validate_refs(schema: Dict[str, Any]) -> None:
+    dangling = find_dangling_refs(schema)
+    if dangling:
+        raise DanglingRefError(dangling)
+
+
+def iter_locations(schema: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+    for key, value in schema.items():
+        if key == 'paths':
+            for path, path_item in value.items():
+                for method, operation in path_item.items():
+                    yield f'#/paths/{escape_pointer(path)}/{method}', operation
+        elif key == 'components':
+            for section, entries in value.items():
+                for name, component in entries.items():
+                    yield f'#/components/{section}/{escape_pointer(name)}', component
+        else:
+            yield f'#/{escape_pointer(key)}', value
+
+
+def escape_pointer(token: str) -> str:
+    return token.replace('~', '~0').replace('/', '~1')
+
+
+def get_shard_catalog(schema: Dict[str, Any]) -> ShardCatalog:
+    return ShardCatalog(get_tag_counts(schema), schema.get('paths', {}))
@@ -1,13 +1,21 @@
+import copy
 from typing import Any, Dict, Optional, Type
 from rest_framework import serializers
 from autoapi_swagger.constants import (
     STATUS_CODES, JSEND_SCHEMA, ERROR_RESPONSES,
     SUCCESS_RESPONSES, CONTENT_TYPE_JSON
 )
+from autoapi_swagger.ir import ArraySchema, EnvelopeSchema, Node, Raw, Ref, Response
+from autoapi_swagger.naming import get_component_name
+
+
+JSEND_SUCCESS_REF = Ref('JSendSuccess')
+NO_CONTENT_RESPONSE = Raw(SUCCESS_RESPONSES['204'])
+ERROR_RESPONSE_NODES = {code: Raw(response) for code, response in ERROR_RESPONSES.items()}
 
 
 def build_jsend_schema() -> Dict[str, Any]:
-    return {
+    return copy.deepcopy({
         'JSendError': {
             **JSEND_SCHEMA,
             'properties': {
@@ -23,33 +31,27 @@ def build_jsend_schema() -> Dict[str, Any]:
             },
             'required': ['status', 'data']
         }
-    }
+    })
 
 
 def build_success_response(
-    schema_ref: Optional[str] = None,
+    schema_name: Optional[str] = None,
     status_code: str = STATUS_CODES['success'],
     is_list: bool = False
-) -> Dict[str, Any]:
-    response = SUCCESS_RESPONSES.get(status_code, SUCCESS_RESPONSES['200']).copy()
+) -> Response:
+    description = SUCCESS_RESPONSES.get(status_code, SUCCESS_RESPONSES['200'])['description']
     
-    if schema_ref:
-        data_schema = {'type': 'array', 'items': {'$ref': schema_ref}} if is_list else {'$ref': schema_ref}
-        schema = {
-            'allOf': [
-                {'$ref': '#/components/schemas/JSendSuccess'},
-                {'properties': {'data': data_schema}}
-            ]
-        }
+    if schema_name:
+        data_schema = ArraySchema(Ref(schema_name)) if is_list else Ref(schema_name)
+        schema = EnvelopeSchema(JSEND_SUCCESS_REF, data_schema)
     else:
-        schema = {'$ref': '#/components/schemas/JSendSuccess'}
+        schema = JSEND_SUCCESS_REF
     
-    response['content'] = {CONTENT_TYPE_JSON: {'schema': schema}}
-    return response
+    return Response(description, schema, CONTENT_TYPE_JSON)
 
 
-def build_error_responses() -> Dict[str, Any]:
-    return ERROR_RESPONSES.copy()
+def build_error_responses() -> Dict[str, Node]:
+    return dict(ERROR_RESPONSE_NODES)
 
 
 def build_responses(
@@ -57,25 +59,24 @@ def build_responses(
     model_class: Optional[Any] = None,
     method: str = 'get',
     action_name: Optional[str] = None
-) -> Dict[str, Any]:
+) -> Dict[str, Node]:
     responses = {}
     
     if method == 'delete':
-        responses[STATUS_CODES['no_content']] = SUCCESS_RESPONSES['204']
-        responses.update(build_error_responses())
+        responses[STATUS_CODES['no_content']] = NO_CONTENT_RESPONSE
+        responses.update(ERROR_RESPONSE_NODES)
         return responses
     
-    schema_ref = None
+    schema_name = None
     if serializer_class:
-        schema_ref = f"#/components/schemas/{serializer_class.__name__}"
+        schema_name = get_component_name(serializer_class)
     elif model_class:
-        schema_ref = f"#/components/schemas/{model_class.__name__}"
+        schema_name = get_component_name(model_class)
     
     status_code = STATUS_CODES['created'] if method == 'post' else STATUS_CODES['success']
     is_list = method == 'get' and action_name == 'list'
     
-    responses[status_code] = build_success_response(schema_ref, status_code, is_list)
-    responses.update(build_error_responses())
+    responses[status_code] = build_success_response(schema_name, status_code, is_list)
+    responses.update(ERROR_RESPONSE_NODES)
     
     return responses
-
@@ -0,0 +1,25 @@
+from typing import Any
+from django.conf import settings
+
+
+DEFAULTS = {
+    'SCHEMA_ARTIFACT_DIR': None,
+    'SCHEMA_WORKERS': None,
+    'SCHEMA_EXECUTOR': 'thread',
+    'INCREMENTAL_BUILDS': False,
+    'STREAM_SCHEMA': False,
+    'COMPACT_SCHEMA': True,
+    'WARM_UP_SCHEMA': False,
+    'WARM_UP_MODE': 'wait',
+    'WARM_UP_RETRY_AFTER': 5,
+    'WARM_UP_ENTRYPOINTS': ('runserver', 'gunicorn', 'uvicorn', 'daphne', 'hypercorn', 'granian', 'uwsgi', 'mod_wsgi'),
+    'SCHEMA_STORE': None,
+    'SCHEMA_STORE_OPTIONS': None,
+    'SCHEMA_STORE_VERSION': None,
+    'VALIDATE_REFS': False,
+}
+
+
+def get_setting(name: str) -> Any:
+    user_settings = getattr(settings, 'AUTOAPI_SWAGGER', None) or {}
+    return user_settings.get(name, DEFAULTS[name])
@@ -0,0 +1,206 @@
+import abc
+import hashlib
+import json
+import mmap
+import os
+import stat
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Hashable, Iterator, Optional, Union
+from django.conf import settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+from autoapi_swagger.constants import SCHEMA_STORE_LOCK_TIMEOUT
+from autoapi_swagger.payload import SchemaPayload
+from autoapi_swagger.settings import get_setting
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+Buffer = Union[bytes, memoryview]
+
+
+class SchemaStore(abc.ABC):
+    @abc.abstractmethod
+    def get(self, name: str, stamp: str) -> Optional[Buffer]:
+        ...
+    
+    @abc.abstractmethod
+    def set(self, name: str, stamp: str, content: bytes) -> None:
+        ...
+    
+    @contextmanager
+    def lock(self, name: str) -> Iterator[None]:
+        yield
+
+
+class CacheSchemaStore(SchemaStore):
+    def __init__(self, alias: str = 'default', timeout: Optional[int] = DEFAULT_TIMEOUT, lock_timeout: int = SCHEMA_STORE_LOCK_TIMEOUT):
+        self.alias = alias
+        self.timeout = timeout
+        self.lock_timeout = lock_timeout
+    
+    @property
+    def cache(self):
+        from django.core.cache import caches
+        return caches[self.alias]
+    
+    def get(self, name: str, stamp: str) -> Optional[Buffer]:
+        return self.cache.get(self._key(name, stamp))
+    
+    def set(self, name: str, stamp: str, content: bytes) -> None:
+        stamp_key = f'autoapi_swagger:stamp:{name}'
+        previous = self.cache.get(stamp_key)
+        if previous is not None and previous != stamp:
+            self.cache.delete(self._key(name, previous))
+        self.cache.set(self._key(name, stamp), bytes(content), timeout=self.timeout)
+        self.cache.set(stamp_key, stamp, timeout=self.timeout)
+    
+    @contextmanager
+    def lock(self, name: str) -> Iterator[None]:
+        lock_key = f'autoapi_swagger:lock:{name}'
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.lock_timeout
+        acquired = self.cache.add(lock_key, token, timeout=self.lock_timeout)
+        while not acquired and time.monotonic() < deadline:
+            time.sleep(0.05)
+            acquired = self.cache.add(lock_key, token, timeout=self.lock_timeout)
+        try:
+            yield
+        finally:
+            if acquired and self.cache.get(lock_key) == token:
+                self.cache.delete(lock_key)
+    
+    def _key(self, name: str, stamp: str) -> str:
+        return f'autoapi_swagger:schema:{name}:{stamp}'
+
+
+def get_default_store_directory() -> Path:
+    from importlib import import_module
+    
+    urlconf = getattr(settings, 'ROOT_URLCONF', None)
+    try:
+        project = os.path.realpath(import_module(urlconf).__file__)
+    except (ImportError, TypeError, AttributeError):
+        project = str(urlconf)
+    uid = os.getuid() if hasattr(os, 'getuid') else os.getpid()
+    digest = hashlib.sha256(project.encode('utf-8')).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f'autoapi_swagger-{uid}-{digest}'
+
+
+class FileSchemaStore(SchemaStore):
+    def __init__(self, directory: Optional[Union[str, Path]] = None):
+        self.private = directory is None
+        self.directory = Path(directory) if directory else get_default_store_directory()
+        self._checked = False
+    
+    def get(self, name: str, stamp: str) -> Optional[Buffer]:
+        self._ensure_directory()
+        try:
+            with open(self._path(name, stamp), 'rb') as fh:
+                return memoryview(mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ))
+        except (FileNotFoundError, ValueError):
+            return None
+    
+    def set(self, name: str, stamp: str, content: bytes) -> None:
+        self._ensure_directory()
+        path = self._path(name, stamp)
+        tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+        for stale in self.directory.glob(f'{name}.*.json'):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    
+    @contextmanager
+    def lock(self, name: str) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        self._ensure_directory()
+        with open(self.directory / f'{name}.lock', 'a') as fh:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+    
+    def _path(self, name: str, stamp: str) -> Path:
+        return self.directory / f'{name}.{stamp}.json'
+    
+    def _ensure_directory(self) -> None:
+        if self._checked:
+            return
+        if not self.private:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        else:
+            self.directory.mkdir(mode=0o700, exist_ok=True)
+            info = os.lstat(self.directory)
+            owner = os.getuid() if hasattr(os, 'getuid') else info.st_uid
+            if not stat.S_ISDIR(info.st_mode) or info.st_uid != owner or stat.S_IMODE(info.st_mode) & 0o077:
+                raise ImproperlyConfigured(
+                    f'Schema store directory {self.directory} must be a directory owned by the current user '
+                    f'and not accessible to other users. Set SCHEMA_STORE_OPTIONS["directory"] explicitly.'
+                )
+        self._checked = True
+
+
+SCHEMA_STORES = {
+    'cache': CacheSchemaStore,
+    'file': FileSchemaStore,
+}
+
+_stores = {}
+
+
+def get_schema_store() -> Optional[SchemaStore]:
+    backend = get_setting('SCHEMA_STORE')
+    if not backend:
+        return None
+    options = get_setting('SCHEMA_STORE_OPTIONS') or {}
+    cache_key = (backend, json.dumps(options, sort_keys=True, default=str))
+    if cache_key not in _stores:
+        store_class = SCHEMA_STORES.get(backend) or import_string(backend)
+        _stores[cache_key] = store_class(**options)
+    return _stores[cache_key]
+
+
+def get_store_stamp() -> str:
+    from autoapi_swagger import __version__
+    from autoapi_swagger.docs_generator import get_drf_patterns
+    
+    patterns = [
+        (p['path'], p['name'], f"{p['view_class'].__module__}.{p['view_class'].__qualname__}")
+        for p in get_drf_patterns()
+    ]
+    stamp = [
+        __version__,
+        getattr(settings, 'ROOT_URLCONF', None),
+        getattr(settings, 'AUTOAPI_SWAGGER', None),
+        patterns,
+    ]
+    return hashlib.sha256(json.dumps(stamp, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+
+
+def get_store_name(key: Hashable) -> str:
+    return hashlib.sha256(json.dumps(key, default=str).encode('utf-8')).hexdigest()[:32]
+
+
+def load_or_build_payload(store: SchemaStore, key: Hashable, builder: Callable[[], SchemaPayload]) -> SchemaPayload:
+    name, stamp = get_store_name(key), get_store_stamp()
+    content = store.get(name, stamp)
+    if content is None:
+        with store.lock(name):
+            content = store.get(name, stamp)
+            if content is None:
+                payload = builder()
+                store.set(name, stamp, payload.content)
+                return payload
+    return SchemaPayload(content)
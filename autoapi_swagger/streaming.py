@@ -0,0 +1,148 @@
+import json
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+from asgiref.sync import sync_to_async
+from autoapi_swagger.compaction import SchemaCompactor
+from autoapi_swagger.constants import OPENAPI_VERSION, DEFAULT_SERVER, DEFAULT_TITLE, DEFAULT_VERSION, STREAM_CHUNK_SIZE
+from autoapi_swagger.docs_generator import (
+    build_operation,
+    get_drf_patterns,
+    iter_operation_specs,
+    iter_view_schemas,
+)
+from autoapi_swagger.ir import Renderer
+from autoapi_swagger.responses import build_jsend_schema
+from autoapi_swagger.settings import get_setting
+
+
+def iter_openapi_schema(
+    title: str = DEFAULT_TITLE,
+    version: str = DEFAULT_VERSION,
+    description: str = '',
+    servers: Optional[List[Dict[str, str]]] = None,
+    encoder: Optional[Type[json.JSONEncoder]] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    compact: Optional[bool] = None,
+) -> Iterator[bytes]:
+    patterns = get_drf_patterns()
+    compact = get_setting('COMPACT_SCHEMA') if compact is None else compact
+    encode = (encoder or json.JSONEncoder)(separators=(',', ':'), ensure_ascii=False).encode
+    renderer = Renderer()
+    paths = iter_paths(patterns, renderer=renderer)
+    compactor = None
+    if compact:
+        # Paths are emitted before components, so shared parameters and responses are counted on the built operations first.
+        paths = list(paths)
+        compactor = count_operations(patterns, paths)
+        paths = (
+            (op_path, {method: compactor.compact_operation(operation) for method, operation in operations.items()})
+            for op_path, operations in paths
+        )
+    
+    def pieces() -> Iterator[str]:
+        yield '{"openapi":' + encode(OPENAPI_VERSION)
+        yield ',"info":' + encode({
+            'title': title,
+            'version': version,
+            'description': description or f'API documentation for {title}',
+        })
+        yield ',"servers":' + encode(servers or [DEFAULT_SERVER])
+        yield ',"paths":{'
+        yield from _join_members(paths, encode)
+        yield '},"components":{"schemas":{'
+        yield from _join_members(iter_component_schemas(patterns, compactor, renderer), encode)
+        yield '}'
+        for section, entries in compactor.component_items() if compactor else ():
+            yield ',' + encode(section) + ':' + encode(entries)
+        yield '}}'
+    
+    buffer, size = [], 0
+    for piece in pieces():
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield ''.join(buffer).encode('utf-8')
+            buffer, size = [], 0
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
+
+async def aiter_openapi_schema(**kwargs: Any) -> AsyncIterator[bytes]:
+    async for chunk in aiter_chunks(iter_openapi_schema(**kwargs)):
+        yield chunk
+
+
+async def aiter_chunks(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    next_chunk = sync_to_async(next, thread_sensitive=False)
+    while True:
+        chunk = await next_chunk(chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def iter_paths(
+    patterns: List[Dict[str, Any]],
+    compactor: Optional[SchemaCompactor] = None,
+    renderer: Optional[Renderer] = None,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    renderer = renderer or Renderer()
+    plan: Dict[str, List[Tuple[Type[Any], str, Optional[str], bool]]] = {}
+    for pattern_info in patterns:
+        view_class = pattern_info['view_class']
+        for op_path, method, action_name, is_detail in iter_operation_specs(view_class, pattern_info['path']):
+            plan.setdefault(op_path, []).append((view_class, method, action_name, is_detail))
+    
+    for op_path, specs in plan.items():
+        operations = {}
+        for view_class, method, action_name, is_detail in specs:
+            operation = build_operation(view_class, action_name, method, is_detail)
+            if operation:
+                operation = renderer.render(operation)
+                operations[method] = compactor.compact_operation(operation) if compactor else operation
+        yield op_path, operations
+
+
+def count_operations(patterns: List[Dict[str, Any]], paths: Iterable[Tuple[str, Dict[str, Any]]]) -> SchemaCompactor:
+    schema_names = set(build_jsend_schema())
+    schema_names.update(schema_name for schema_name, _, _ in iter_schema_sources(patterns))
+    compactor = SchemaCompactor(schemas=schema_names)
+    for _, operations in paths:
+        for operation in operations.values():
+            compactor.count_operation(operation)
+    return compactor
+
+
+def iter_component_schemas(
+    patterns: List[Dict[str, Any]],
+    compactor: Optional[SchemaCompactor] = None,
+    renderer: Optional[Renderer] = None,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    renderer = renderer or Renderer()
+    jsend_schemas = build_jsend_schema()
+    yield from jsend_schemas.items()
+    
+    for schema_name, build_schema, source_class in iter_schema_sources(patterns):
+        if schema_name not in jsend_schemas:
+            yield schema_name, renderer.render(build_schema(source_class))
+    
+    if compactor:
+        yield from compactor.envelopes.components.items()
+
+
+def iter_schema_sources(patterns: List[Dict[str, Any]]) -> Iterator[Tuple[str, Callable[[Type[Any]], Any], Type[Any]]]:
+    seen = set()
+    for pattern_info in patterns:
+        view_class = pattern_info['view_class']
+        if next(iter_operation_specs(view_class, pattern_info['path']), None) is None:
+            continue
+        for schema_name, build_schema, source_class in iter_view_schemas(view_class):
+            if schema_name not in seen:
+                seen.add(schema_name)
+                yield schema_name, build_schema, source_class
+
+
+def _join_members(members: Iterator[Tuple[str, Any]], encode) -> Iterator[str]:
+    separator = ''
+    for key, value in members:
+        yield separator + encode(key) + ':' + encode(value)
+        separator = ','
@@ -1,5 +1,4 @@
 from django.urls import path
-from autoapi_swagger.views import OpenAPISchemaView, swagger_ui_view
 
 
 def get_urls(
@@ -9,16 +8,35 @@ def get_urls(
     servers: list = None,
     schema_url: str = 'openapi.json',
     ui_url: str = 'swagger/',
+    shards_url: str = 'openapi/',
+    asynchronous: bool = False,
+    public: bool = True,
 ):
-    schema_view = OpenAPISchemaView.as_view(
+    from autoapi_swagger.views import (
+        AsyncOpenAPISchemaView, OpenAPISchemaView, OpenAPIShardIndexView, swagger_ui_asset_view, swagger_ui_view
+    )
+    
+    view_class = AsyncOpenAPISchemaView if asynchronous else OpenAPISchemaView
+    schema_view = view_class.as_view(
         title=title,
         version=version,
         description=description,
         servers=servers,
+        public=public,
     )
     
-    return [
+    urlpatterns = [
         path(schema_url, schema_view, name='openapi-schema'),
         path(ui_url, swagger_ui_view, {'schema_url': schema_url}, name='swagger-ui'),
+        path(f"{ui_url.rstrip('/')}/assets/<str:filename>", swagger_ui_asset_view, name='swagger-ui-asset'),
     ]
+    
+    if shards_url:
+        index_view = OpenAPIShardIndexView.as_view(title=title, version=version, public=public)
+        urlpatterns += [
+            path(f'{shards_url}index.json', index_view, name='openapi-shard-index'),
+            path(f'{shards_url}<str:tag>.json', schema_view, name='openapi-shard'),
+        ]
+    
+    return urlpatterns
 
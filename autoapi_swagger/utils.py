@@ -1,13 +1,58 @@
-from typing import Any, Dict, List, Optional, Type
-from django.urls import URLPattern, URLResolver
+import threading
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Type
+from django.dispatch import Signal, receiver
+from django.urls import URLPattern, URLResolver, get_resolver
 from rest_framework import serializers, viewsets, views
-from autoapi_swagger.constants import DETAIL_ACTIONS, ACTION_METHOD_MAP
+from autoapi_swagger.constants import DETAIL_ACTIONS, ACTION_METHOD_MAP, INTROSPECTION_CACHE_SIZE
+from autoapi_swagger.field_types import serializer_field_types, model_field_types
+from autoapi_swagger.instrumentation import timed_stage
+from autoapi_swagger.memo import WeakMemo
+from autoapi_swagger.model_graph import model_graph
+from autoapi_swagger.naming import component_names
 
 
-def get_serializer_fields(serializer_class: Type[serializers.Serializer]) -> Dict[str, Any]:
+serializer_fields_memo = WeakMemo(maxsize=INTROSPECTION_CACHE_SIZE)
+resolver_patterns_memo = WeakMemo(maxsize=INTROSPECTION_CACHE_SIZE)
+view_models_memo = WeakMemo(maxsize=INTROSPECTION_CACHE_SIZE)
+nested_serializers_memo = WeakMemo(maxsize=INTROSPECTION_CACHE_SIZE)
+
+resolver_changed = Signal()
+
+
+class ResolverWatch:
+    def __init__(self):
+        self._resolver: Optional[URLResolver] = None
+        self._lock = threading.Lock()
+    
+    def check(self, resolver: URLResolver) -> URLResolver:
+        with self._lock:
+            previous, self._resolver = self._resolver, resolver
+        if previous is not None and previous is not resolver:
+            resolver_changed.send(sender=self.__class__, resolver=resolver)
+        return resolver
+    
+    def reset_locks(self) -> None:
+        self._lock = threading.Lock()
+
+
+resolver_watch = ResolverWatch()
+
+
+def get_current_resolver() -> URLResolver:
+    return resolver_watch.check(get_resolver())
+
+
+def get_serializer_fields(serializer_class: Type[serializers.Serializer]) -> Mapping[str, Mapping[str, Any]]:
     if not issubclass(serializer_class, serializers.Serializer):
-        return {}
+        return MappingProxyType({})
     
+    with timed_stage('get_serializer_fields', serializer_class):
+        return serializer_fields_memo.get_or_compute(serializer_class, introspect_serializer_fields)
+
+
+def introspect_serializer_fields(serializer_class: Type[serializers.Serializer]) -> Mapping[str, Mapping[str, Any]]:
     fields = {}
     serializer = serializer_class()
     
@@ -28,42 +73,69 @@ def get_serializer_fields(serializer_class: Type[serializers.Serializer]) -> Dic
             field_info['default'] = field.default
         
         if isinstance(field, serializers.ChoiceField):
-            field_info['enum'] = list(field.choices.values()) if hasattr(field, 'choices') else []
+            field_info['enum'] = tuple(field.choices.values()) if hasattr(field, 'choices') else ()
         
-        fields[field_name] = field_info
-    
-    return fields
-
-
-def get_field_type(field: serializers.Field) -> Dict[str, Any]:
-    field_type_map = {
-        serializers.CharField: {'type': 'string'},
-        serializers.IntegerField: {'type': 'integer'},
-        serializers.FloatField: {'type': 'number'},
-        serializers.DecimalField: {'type': 'number'},
-        serializers.BooleanField: {'type': 'boolean'},
-        serializers.DateField: {'type': 'string', 'format': 'date'},
-        serializers.DateTimeField: {'type': 'string', 'format': 'date-time'},
-        serializers.TimeField: {'type': 'string', 'format': 'time'},
-        serializers.EmailField: {'type': 'string', 'format': 'email'},
-        serializers.URLField: {'type': 'string', 'format': 'uri'},
-        serializers.UUIDField: {'type': 'string', 'format': 'uuid'},
-        serializers.JSONField: {'type': 'object'},
-        serializers.FileField: {'type': 'string', 'format': 'binary'},
-        serializers.ImageField: {'type': 'string', 'format': 'binary'},
-    }
-    
-    for field_class, type_info in field_type_map.items():
-        if isinstance(field, field_class):
-            return type_info.copy()
-    
-    if isinstance(field, serializers.ListSerializer):
-        return {'type': 'array'}
+        nested = get_nested_serializer(field)
+        if nested is not None:
+            field_info['serializer'], field_info['many'] = nested
+        
+        fields[field_name] = MappingProxyType(field_info)
     
+    return MappingProxyType(fields)
+
+
+def get_nested_serializer(field: serializers.Field) -> Optional[Tuple[Type[serializers.Serializer], bool]]:
     if isinstance(field, serializers.Serializer):
-        return {'type': 'object'}
-    
-    return {'type': 'string'}
+        return type(field), False
+    child = getattr(field, 'child', None)
+    if isinstance(field, (serializers.ListSerializer, serializers.ListField)) and isinstance(child, serializers.Serializer):
+        return type(child), True
+    return None
+
+
+def get_nested_serializers(serializer_class: Type[serializers.Serializer]) -> Tuple[Type[serializers.Serializer], ...]:
+    return nested_serializers_memo.get_or_compute(serializer_class, collect_nested_serializers)
+
+
+def collect_nested_serializers(serializer_class: Type[serializers.Serializer]) -> Tuple[Type[serializers.Serializer], ...]:
+    seen = {serializer_class}
+    nested = []
+    queue = deque([serializer_class])
+    while queue:
+        for field_info in get_serializer_fields(queue.popleft()).values():
+            child = field_info.get('serializer')
+            if child is None or child in seen:
+                continue
+            seen.add(child)
+            nested.append(child)
+            if child in nested_serializers_memo:
+                for descendant in get_nested_serializers(child):
+                    if descendant not in seen:
+                        seen.add(descendant)
+                        nested.append(descendant)
+            else:
+                queue.append(child)
+    return tuple(nested)
+
+
+def get_declared_serializers(serializer_class: Type[serializers.Serializer]) -> Tuple[Type[serializers.Serializer], ...]:
+    # Declared fields are built with the class, so no serializer is instantiated here.
+    seen = {serializer_class}
+    declared = []
+    queue = deque([serializer_class])
+    while queue:
+        for field in getattr(queue.popleft(), '_declared_fields', {}).values():
+            nested = get_nested_serializer(field)
+            if nested is None or nested[0] in seen:
+                continue
+            seen.add(nested[0])
+            declared.append(nested[0])
+            queue.append(nested[0])
+    return tuple(declared)
+
+
+def get_field_type(field: serializers.Field) -> Mapping[str, Any]:
+    return serializer_field_types.resolve(type(field))
 
 
 def get_view_actions(view_class: Type[Any]) -> Dict[str, Dict[str, Any]]:
@@ -105,99 +177,113 @@ def get_view_serializer(view_class: Type[Any]) -> Optional[Type[serializers.Seri
 
 
 def get_view_queryset_model(view_class: Type[Any]) -> Optional[Type[Any]]:
-    if hasattr(view_class, 'get_queryset'):
-        queryset = view_class.get_queryset()
-        if queryset is not None and hasattr(queryset, 'model'):
-            return queryset.model
+    return view_models_memo.get_or_compute(view_class, resolve_view_model)
+
+
+def resolve_view_model(view_class: Type[Any]) -> Optional[Type[Any]]:
+    queryset = getattr(view_class, 'queryset', None)
+    model = getattr(queryset, 'model', None) if queryset is not None else None
+    if model is not None:
+        return model
     
-    if hasattr(view_class, 'queryset') and view_class.queryset is not None:
-        return view_class.queryset.model
+    meta = getattr(get_view_serializer(view_class), 'Meta', None)
+    model = getattr(meta, 'model', None)
+    if model is not None:
+        return model
     
-    return None
+    return getattr(view_class, 'autoapi_model', None)
 
 
 def extract_url_patterns(urlpatterns: List[Any], prefix: str = '') -> List[Dict[str, Any]]:
-    patterns = []
-    
+    return list(iter_url_patterns(urlpatterns, prefix))
+
+
+def iter_url_patterns(
+    urlpatterns: List[Any],
+    prefix: str = '',
+    converters: Optional[Dict[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
     for pattern in urlpatterns:
         if isinstance(pattern, URLPattern):
             callback = pattern.callback
             if hasattr(callback, 'cls'):
-                view_class = callback.cls
-                url_path = prefix + str(pattern.pattern)
-                patterns.append({
-                    'path': url_path,
-                    'view_class': view_class,
+                yield {
+                    'path': prefix + str(pattern.pattern),
+                    'view_class': callback.cls,
                     'name': pattern.name or '',
-                })
+                    'converters': {**converters, **pattern.pattern.converters} if converters else pattern.pattern.converters,
+                }
         elif isinstance(pattern, URLResolver):
-            new_prefix = prefix + str(pattern.pattern)
-            patterns.extend(extract_url_patterns(pattern.url_patterns, new_prefix))
-    
-    return patterns
+            nested_prefix = prefix + str(pattern.pattern)
+            nested_converters = {**converters, **pattern.pattern.converters} if converters else pattern.pattern.converters
+            for record in get_resolver_patterns(pattern):
+                yield {
+                    **record,
+                    'path': nested_prefix + record['path'],
+                    'converters': {**nested_converters, **record['converters']} if nested_converters else record['converters'],
+                }
 
 
-def get_model_fields(model_class: Type[Any]) -> Dict[str, Any]:
+def get_resolver_patterns(resolver: URLResolver) -> Tuple[Dict[str, Any], ...]:
+    return resolver_patterns_memo.get_or_compute(resolver, lambda r: tuple(iter_url_patterns(r.url_patterns)))
+
+
+def get_model_fields(model_class: Type[Any]) -> Mapping[str, Mapping[str, Any]]:
     if not hasattr(model_class, '_meta'):
-        return {}
-    
-    fields = {}
-    meta = model_class._meta
-    
-    for field in meta.get_fields():
-        if field.name in ['id', 'pk']:
-            continue
-        
-        model_field_type_info = get_model_field_type(field)
-        field_info = {
-            'type': model_field_type_info['type'],
-            'required': not field.null and not hasattr(field, 'blank') or not field.blank,
-        }
-        
-        if 'format' in model_field_type_info:
-            field_info['format'] = model_field_type_info['format']
-        
-        if hasattr(field, 'help_text') and field.help_text:
-            field_info['description'] = str(field.help_text)
-        
-        if hasattr(field, 'default') and field.default is not None:
-            if callable(field.default):
-                continue
-            field_info['default'] = field.default
-        
-        fields[field.name] = field_info
+        return MappingProxyType({})
     
-    return fields
+    with timed_stage('get_model_fields', model_class):
+        return model_graph.get_fields(model_class)
 
 
-def get_model_field_type(field: Any) -> Dict[str, Any]:
-    from django.db import models
-    
-    field_type_map = {
-        models.CharField: {'type': 'string'},
-        models.TextField: {'type': 'string'},
-        models.IntegerField: {'type': 'integer'},
-        models.BigIntegerField: {'type': 'integer'},
-        models.SmallIntegerField: {'type': 'integer'},
-        models.PositiveIntegerField: {'type': 'integer'},
-        models.FloatField: {'type': 'number'},
-        models.DecimalField: {'type': 'number'},
-        models.BooleanField: {'type': 'boolean'},
-        models.DateField: {'type': 'string', 'format': 'date'},
-        models.DateTimeField: {'type': 'string', 'format': 'date-time'},
-        models.TimeField: {'type': 'string', 'format': 'time'},
-        models.EmailField: {'type': 'string', 'format': 'email'},
-        models.URLField: {'type': 'string', 'format': 'uri'},
-        models.UUIDField: {'type': 'string', 'format': 'uuid'},
-        models.JSONField: {'type': 'object'},
-        models.FileField: {'type': 'string', 'format': 'binary'},
-        models.ImageField: {'type': 'string', 'format': 'binary'},
+def get_related_models(model_class: Type[Any]) -> Tuple[Type[Any], ...]:
+    if not hasattr(model_class, '_meta'):
+        return ()
+    return model_graph.get_related_models(model_class)
+
+
+def get_model_field_type(field: Any) -> Mapping[str, Any]:
+    return model_field_types.resolve(type(field))
+
+
+def get_introspection_cache_stats() -> Dict[str, Dict[str, int]]:
+    return {
+        'serializer_fields': serializer_fields_memo.stats(),
+        'url_patterns': resolver_patterns_memo.stats(),
+        'view_models': view_models_memo.stats(),
+        'nested_serializers': nested_serializers_memo.stats(),
+        'model_graph': model_graph.stats(),
+        'component_names': component_names.stats(),
     }
-    
-    field_type = type(field)
-    for model_field_class, type_info in field_type_map.items():
-        if issubclass(field_type, model_field_class):
-            return type_info.copy()
-    
-    return {'type': 'string'}
 
+
+def clear_introspection_caches() -> None:
+    serializer_fields_memo.clear()
+    resolver_patterns_memo.clear()
+    view_models_memo.clear()
+    nested_serializers_memo.clear()
+    model_graph.clear()
+
+
+def prune_introspection_caches() -> None:
+    serializer_fields_memo.prune()
+    resolver_patterns_memo.clear()
+    view_models_memo.prune()
+    nested_serializers_memo.prune()
+    model_graph.prune()
+
+
+def reset_introspection_locks() -> None:
+    serializer_fields_memo.reset_locks()
+    resolver_patterns_memo.reset_locks()
+    view_models_memo.reset_locks()
+    nested_serializers_memo.reset_locks()
+    model_graph.reset_locks()
+    component_names.reset_locks()
+    resolver_watch.reset_locks()
+
+
+@receiver(resolver_changed)
+def _clear_on_resolver_changed(**kwargs) -> None:
+    clear_introspection_caches()
+    component_names.clear()
@@ -1,20 +1,33 @@
-from typing import Any, Dict, Optional
-from django.http import HttpResponse
-from django.views.decorators.cache import cache_page
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
 from django.views.decorators.http import require_http_methods
-from django.utils.decorators import method_decorator
+from django.utils.cache import parse_etags
+from django.views import View
+from rest_framework.permissions import AllowAny
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
-from rest_framework.response import Response
-from autoapi_swagger.docs_generator import get_openapi_schema
-from autoapi_swagger.constants import DEFAULT_TITLE, DEFAULT_VERSION, SWAGGER_UI_VERSION
+from autoapi_swagger.assets import get_swagger_ui_asset, get_swagger_ui_asset_urls
+from autoapi_swagger.constants import (
+    DEFAULT_TITLE, DEFAULT_VERSION,
+    CONTENT_TYPE_JSON, PRIVATE_SCHEMA_CACHE_CONTROL, PRIVATE_SCHEMA_VARY, SCHEMA_CACHE_CONTROL,
+    SWAGGER_UI_ASSET_CACHE_CONTROL
+)
+from autoapi_swagger.payload import SchemaPayload, choose_encoding, get_available_encodings, IDENTITY
+from autoapi_swagger.settings import get_setting
 
 
-def get_swagger_ui_html(schema_url: str) -> str:
+def get_swagger_ui_html(schema_url: str, assets_url: str = 'assets/') -> str:
+    urls = get_swagger_ui_asset_urls(assets_url)
     return f'''<!DOCTYPE html>
 <html>
 <head>
     <title>Swagger UI</title>
-    <link rel="stylesheet" href="https://unpkg.com/swagger-ui-dist@{SWAGGER_UI_VERSION}/swagger-ui.css" />
+    <link rel="stylesheet" href="{urls['swagger-ui.css']}" />
+    <link rel="icon" type="image/png" href="{urls['favicon-32x32.png']}" sizes="32x32" />
+    <link rel="icon" type="image/png" href="{urls['favicon-16x16.png']}" sizes="16x16" />
     <style>
         html {{ box-sizing: border-box; overflow-y: scroll; }}
         *, *:before, *:after {{ box-sizing: inherit; }}
@@ -23,8 +36,8 @@ def get_swagger_ui_html(schema_url: str) -> str:
 </head>
 <body>
     <div id="swagger-ui"></div>
-    <script src="https://unpkg.com/swagger-ui-dist@{SWAGGER_UI_VERSION}/swagger-ui-bundle.js"></script>
-    <script src="https://unpkg.com/swagger-ui-dist@{SWAGGER_UI_VERSION}/swagger-ui-standalone-preset.js"></script>
+    <script src="{urls['swagger-ui-bundle.js']}"></script>
+    <script src="{urls['swagger-ui-standalone-preset.js']}"></script>
     <script>
         window.onload = function() {{
             SwaggerUIBundle({{
@@ -39,16 +52,149 @@ def get_swagger_ui_html(schema_url: str) -> str:
 </html>'''
 
 
-class OpenAPISchemaView(APIView):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.title = kwargs.get('title', DEFAULT_TITLE)
-        self.version = kwargs.get('version', DEFAULT_VERSION)
-        self.description = kwargs.get('description', '')
-        self.servers = kwargs.get('servers', None)
+@lru_cache(maxsize=32)
+def get_swagger_ui_page(schema_url: str, assets_url: str) -> SchemaPayload:
+    return SchemaPayload(get_swagger_ui_html(schema_url, assets_url).encode('utf-8'))
+
+
+def payload_response(
+    request,
+    payload: SchemaPayload,
+    content_type: str = CONTENT_TYPE_JSON,
+    cache_control: str = SCHEMA_CACHE_CONTROL,
+    encodings: Optional[Tuple[str, ...]] = None,
+    vary: str = 'Accept-Encoding',
+) -> HttpResponse:
+    encoding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''), encodings or get_available_encodings())
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
     
-    def get(self, request):
-        return Response(get_openapi_schema(
+    if if_none_match and payload.matches(parse_etags(if_none_match)):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(payload.encode(encoding), content_type=content_type)
+        if encoding != IDENTITY:
+            response['Content-Encoding'] = encoding
+    
+    response['ETag'] = payload.etag(encoding)
+    response['Cache-Control'] = cache_control
+    response['Vary'] = vary
+    return response
+
+
+async def apayload_response(
+    request,
+    payload: SchemaPayload,
+    content_type: str = CONTENT_TYPE_JSON,
+    cache_control: str = SCHEMA_CACHE_CONTROL,
+    encodings: Optional[Tuple[str, ...]] = None,
+    vary: str = 'Accept-Encoding',
+) -> HttpResponse:
+    encoding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''), encodings or get_available_encodings())
+    if not payload.is_encoded(encoding):
+        await sync_to_async(payload.encode, thread_sensitive=False)(encoding)
+    return payload_response(request, payload, content_type, cache_control, encodings, vary)
+
+
+class SchemaViewMixin:
+    title = DEFAULT_TITLE
+    version = DEFAULT_VERSION
+    description = ''
+    servers = None
+    cache_control = SCHEMA_CACHE_CONTROL
+    public = True
+    
+    def get_cache_headers(self) -> Dict[str, str]:
+        if self.public:
+            return {'cache_control': self.cache_control}
+        # The document depends on who asks, so shared caches must not keep it.
+        return {'cache_control': PRIVATE_SCHEMA_CACHE_CONTROL, 'vary': PRIVATE_SCHEMA_VARY}
+    
+    def payload_response(self, request, payload: SchemaPayload) -> HttpResponse:
+        return payload_response(request, payload, **self.get_cache_headers())
+    
+    def resolve_shard(self, tag: Optional[str], prefix: Optional[str]) -> Optional[str]:
+        from autoapi_swagger.cache import get_cached_shard_catalog
+        
+        if tag is None and not prefix:
+            return None
+        catalog = get_cached_shard_catalog()
+        if tag is not None and tag not in catalog.tags:
+            raise Http404(f'No schema shard for tag {tag!r}')
+        if not prefix:
+            return None
+        resolved = catalog.resolve_prefix(prefix)
+        if resolved is None:
+            raise Http404(f'No operations under {prefix!r}')
+        return resolved
+    
+    def get_variant_payload(self, request, **kwargs) -> Optional[SchemaPayload]:
+        from autoapi_swagger.cache import get_cached_variant_payload
+        
+        if self.public:
+            return None
+        return get_cached_variant_payload(
+            request, title=self.title, version=self.version, description=self.description, servers=self.servers, **kwargs
+        )
+    
+    def streams_schema(self) -> bool:
+        from autoapi_swagger.cache import peek_schema_payload
+        
+        if not self.public or not get_setting('STREAM_SCHEMA') or get_setting('SCHEMA_ARTIFACT_DIR'):
+            return False
+        return peek_schema_payload(
+            title=self.title, version=self.version, description=self.description, servers=self.servers
+        ) is None
+    
+    def get_streaming_content(self) -> Iterator[bytes]:
+        from rest_framework.utils.encoders import JSONEncoder
+        from autoapi_swagger.cache import cache_streamed_payload
+        from autoapi_swagger.streaming import iter_openapi_schema
+        
+        chunks = iter_openapi_schema(
+            title=self.title,
+            version=self.version,
+            description=self.description,
+            servers=self.servers,
+            encoder=JSONEncoder,
+        )
+        return cache_streamed_payload(
+            chunks, title=self.title, version=self.version, description=self.description, servers=self.servers
+        )
+    
+    def streaming_response(self) -> StreamingHttpResponse:
+        response = StreamingHttpResponse(self.get_streaming_content(), content_type=CONTENT_TYPE_JSON)
+        response['Cache-Control'] = self.cache_control
+        return response
+
+
+class OpenAPISchemaView(SchemaViewMixin, APIView):
+    def get(self, request, tag: Optional[str] = None):
+        from autoapi_swagger.cache import get_cached_schema_payload, get_cached_shard_payload
+        from autoapi_swagger.warmup import get_warmup_response
+        
+        warmup_response = get_warmup_response()
+        if warmup_response is not None:
+            return warmup_response
+        
+        prefix = self.resolve_shard(tag, request.query_params.get('prefix'))
+        payload = self.get_variant_payload(request, tag=tag, prefix=prefix)
+        if payload is not None:
+            return self.payload_response(request, payload)
+        
+        if tag is not None or prefix:
+            return self.payload_response(request, get_cached_shard_payload(
+                title=self.title,
+                version=self.version,
+                description=self.description,
+                servers=self.servers,
+                tag=tag,
+                prefix=prefix,
+            ))
+        
+        if self.streams_schema():
+            return self.streaming_response()
+        
+        return self.payload_response(request, get_cached_schema_payload(
             title=self.title,
             version=self.version,
             description=self.description,
@@ -56,9 +202,111 @@ class OpenAPISchemaView(APIView):
         ))
 
 
+class AsyncOpenAPISchemaView(SchemaViewMixin, View):
+    authentication_classes = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    permission_classes = api_settings.DEFAULT_PERMISSION_CLASSES
+    throttle_classes = api_settings.DEFAULT_THROTTLE_CLASSES
+    
+    async def get(self, request, tag: Optional[str] = None):
+        from autoapi_swagger.cache import aget_cached_schema_payload, aget_cached_variant_payload
+        from autoapi_swagger.warmup import aget_warmup_response
+        
+        drf_request = None
+        if self.requires_access_check():
+            drf_request, denied_response = await sync_to_async(self.check_access)(request)
+            if denied_response is not None:
+                return denied_response
+        
+        warmup_response = await aget_warmup_response()
+        if warmup_response is not None:
+            return warmup_response
+        
+        prefix = request.GET.get('prefix')
+        if tag is not None or prefix:
+            prefix = await sync_to_async(self.resolve_shard)(tag, prefix)
+        if not self.public:
+            payload = await aget_cached_variant_payload(
+                drf_request,
+                title=self.title,
+                version=self.version,
+                description=self.description,
+                servers=self.servers,
+                tag=tag,
+                prefix=prefix,
+            )
+            if payload is not None:
+                return await apayload_response(request, payload, **self.get_cache_headers())
+        elif tag is None and not prefix and self.streams_schema():
+            return self.streaming_response()
+        
+        payload = await aget_cached_schema_payload(
+            title=self.title,
+            version=self.version,
+            description=self.description,
+            servers=self.servers,
+            tag=tag,
+            prefix=prefix,
+        )
+        return await apayload_response(request, payload, **self.get_cache_headers())
+    
+    def requires_access_check(self) -> bool:
+        # A public view that allows anyone and has no throttles serves the same document either way.
+        if not self.public or self.throttle_classes:
+            return True
+        return not all(isinstance(permission, type) and issubclass(permission, AllowAny) for permission in self.permission_classes)
+    
+    def check_access(self, request) -> Tuple[Request, Optional[HttpResponse]]:
+        # Run the same authentication, permission and throttle checks as the sync APIView.
+        view = APIView(
+            authentication_classes=self.authentication_classes,
+            permission_classes=self.permission_classes,
+            throttle_classes=self.throttle_classes,
+        )
+        view.args, view.kwargs = self.args, self.kwargs
+        drf_request = view.initialize_request(request, *self.args, **self.kwargs)
+        view.request = drf_request
+        view.headers = view.default_response_headers
+        try:
+            view.initial(drf_request, *self.args, **self.kwargs)
+        except Exception as exc:
+            response = view.finalize_response(drf_request, view.handle_exception(exc), *self.args, **self.kwargs)
+            return drf_request, response.render()
+        return drf_request, None
+    
+    def get_streaming_content(self) -> AsyncIterator[bytes]:
+        from autoapi_swagger.streaming import aiter_chunks
+        
+        return aiter_chunks(super().get_streaming_content())
+
+
+class OpenAPIShardIndexView(OpenAPISchemaView):
+    def get(self, request):
+        from autoapi_swagger.cache import get_cached_shard_index
+        
+        payload = self.get_variant_payload(request, index=True)
+        if payload is not None:
+            return self.payload_response(request, payload)
+        return self.payload_response(request, get_cached_shard_index(title=self.title, version=self.version))
+
+
+@require_http_methods(["GET"])
+def swagger_ui_view(request, schema_url='openapi.json', assets_url=None):
+    assets_url = assets_url or request.path.rstrip('/') + '/assets/'
+    return payload_response(request, get_swagger_ui_page(schema_url, assets_url), content_type='text/html; charset=utf-8')
+
+
 @require_http_methods(["GET"])
-def swagger_ui_view(request, schema_url='openapi.json'):
-    return HttpResponse(get_swagger_ui_html(schema_url), content_type='text/html')
+def swagger_ui_asset_view(request, filename):
+    asset = get_swagger_ui_asset(filename)
+    if asset is None:
+        raise Http404(filename)
+    return payload_response(
+        request,
+        asset.payload,
+        content_type=asset.content_type,
+        cache_control=SWAGGER_UI_ASSET_CACHE_CONTROL,
+        encodings=asset.encodings(),
+    )
 
 
 def get_schema_view(
@@ -69,8 +317,20 @@ def get_schema_view(
     url: str = 'openapi.json',
     public: bool = True,
 ):
-    view = OpenAPISchemaView.as_view(
-        title=title, version=version, description=description, servers=servers
+    return OpenAPISchemaView.as_view(
+        title=title, version=version, description=description, servers=servers, public=public
+    )
+
+
+def get_async_schema_view(
+    title: str = DEFAULT_TITLE,
+    version: str = DEFAULT_VERSION,
+    description: str = '',
+    servers: Optional[list] = None,
+    url: str = 'openapi.json',
+    public: bool = True,
+):
+    return AsyncOpenAPISchemaView.as_view(
+        title=title, version=version, description=description, servers=servers, public=public
     )
-    return method_decorator(cache_page(60 * 15))(view) if not public else view
 
@@ -0,0 +1,174 @@
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.urls import URLPattern, URLResolver
+from django.utils.autoreload import DJANGO_AUTORELOAD_ENV
+from autoapi_swagger.cache import get_cached_schema_payload, make_cache_key, schema_cache, shard_cache, variant_cache
+from autoapi_swagger.constants import MANAGEMENT_PROGRAMS, WARM_UP_FORK_TIMEOUT
+from autoapi_swagger.settings import get_setting
+from autoapi_swagger.utils import get_current_resolver, reset_introspection_locks
+
+
+logger = logging.getLogger(__name__)
+
+SchemaViewOptions = Tuple[str, str, str, Optional[List[Dict[str, str]]]]
+
+
+class SchemaWarmup:
+    def __init__(self):
+        self._thread: Optional[threading.Thread] = None
+        self._done = threading.Event()
+        self.error: Optional[BaseException] = None
+        self.warmed = 0
+    
+    def start(self) -> threading.Thread:
+        if self._thread is None:
+            self._done.clear()
+            self.error = None
+            self._thread = threading.Thread(target=self._run, name='autoapi-swagger-warmup', daemon=True)
+            self._thread.start()
+        return self._thread
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        if self._thread is None:
+            return True
+        return self._done.wait(timeout)
+    
+    def is_running(self) -> bool:
+        return self._thread is not None and not self._done.is_set()
+    
+    def reset(self) -> None:
+        restart = self.is_running()
+        self._thread = None
+        self._done = threading.Event()
+        if restart:
+            self.start()
+    
+    def _run(self) -> None:
+        try:
+            self.warmed = warm_schema_cache()
+        except Exception as exc:
+            self.error = exc
+            logger.exception('OpenAPI schema warm-up failed')
+        finally:
+            self._done.set()
+
+
+schema_warmup = SchemaWarmup()
+_fork_hooks_registered = False
+
+
+def get_warmup_response() -> Optional[HttpResponse]:
+    if not schema_warmup.is_running():
+        return None
+    if use_unavailable_response():
+        return warming_up_response()
+    schema_warmup.wait()
+    return None
+
+
+async def aget_warmup_response() -> Optional[HttpResponse]:
+    if not schema_warmup.is_running():
+        return None
+    if use_unavailable_response():
+        return warming_up_response()
+    await sync_to_async(schema_warmup.wait, thread_sensitive=False)()
+    return None
+
+
+def use_unavailable_response() -> bool:
+    mode = get_setting('WARM_UP_MODE')
+    if mode not in ('wait', 'unavailable'):
+        raise ValueError(f"Unknown warm-up mode {mode!r}; expected 'wait' or 'unavailable'")
+    return mode == 'unavailable'
+
+
+def warming_up_response() -> HttpResponse:
+    response = HttpResponse(status=503)
+    response['Retry-After'] = str(get_setting('WARM_UP_RETRY_AFTER'))
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
+def warm_schema_cache(resolver: Optional[URLResolver] = None) -> int:
+    warmed = set()
+    for title, version, description, servers in iter_schema_view_options(resolver or get_current_resolver()):
+        key = make_cache_key(title, version, description, servers)
+        if key not in warmed:
+            warmed.add(key)
+            get_cached_schema_payload(title, version, description, servers)
+    return len(warmed)
+
+
+def iter_schema_view_options(resolver: URLResolver) -> Iterator[SchemaViewOptions]:
+    from autoapi_swagger.views import OpenAPIShardIndexView, SchemaViewMixin
+    
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_schema_view_options(pattern)
+        elif isinstance(pattern, URLPattern):
+            view_class = getattr(pattern.callback, 'view_class', None)
+            if (view_class is not None and issubclass(view_class, SchemaViewMixin)
+                    and not issubclass(view_class, OpenAPIShardIndexView)):
+                yield get_view_options(view_class, getattr(pattern.callback, 'view_initkwargs', {}))
+
+
+def get_view_options(view_class: Any, initkwargs: Dict[str, Any]) -> SchemaViewOptions:
+    return tuple(initkwargs.get(name, getattr(view_class, name)) for name in ('title', 'version', 'description', 'servers'))
+
+
+def get_entrypoint(argv: Sequence[str]) -> str:
+    if not argv:
+        return ''
+    program = Path(argv[0])
+    name = program.parent.name if program.name == '__main__.py' else program.stem
+    if name in MANAGEMENT_PROGRAMS:
+        return argv[1] if len(argv) > 1 else ''
+    return name
+
+
+def is_server_process(argv: Optional[Sequence[str]] = None) -> bool:
+    argv = sys.argv if argv is None else argv
+    entrypoint = get_entrypoint(argv)
+    if entrypoint not in get_setting('WARM_UP_ENTRYPOINTS'):
+        return False
+    if entrypoint == 'runserver' and '--noreload' not in argv:
+        # The autoreloader's parent only watches files; the server runs in its child.
+        return os.environ.get(DJANGO_AUTORELOAD_ENV) == 'true'
+    return True
+
+
+def start_schema_warmup() -> threading.Thread:
+    global _fork_hooks_registered
+    if hasattr(os, 'register_at_fork') and not _fork_hooks_registered:
+        _fork_hooks_registered = True
+        os.register_at_fork(before=_before_fork, after_in_child=_after_fork_in_child)
+    return schema_warmup.start()
+
+
+def _before_fork() -> None:
+    # Let a preloading master finish the build so forked workers share it copy-on-write.
+    schema_warmup.wait(WARM_UP_FORK_TIMEOUT)
+
+
+def _after_fork_in_child() -> None:
+    # A lock held by another thread at fork time would stay locked forever in the child.
+    from autoapi_swagger.assets import reset_asset_locks
+    from autoapi_swagger.field_types import reset_field_type_locks
+    from autoapi_swagger.incremental import fragment_store
+    from autoapi_swagger.views import get_swagger_ui_page
+    
+    schema_cache.reset_locks()
+    shard_cache.reset_locks()
+    variant_cache.reset_locks()
+    reset_introspection_locks()
+    fragment_store.reset_locks()
+    reset_field_type_locks()
+    reset_asset_locks()
+    get_swagger_ui_page.cache_clear()
+    schema_warmup.reset()
@@ -0,0 +1,193 @@
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SIZES = [10, 100, 1000, 5000]
+DEFAULT_THRESHOLD = 0.2
+
+
+def timed(func: Callable[[], Any], repeat: int = 1) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def import_time(module: str, repeat: int = 1) -> float:
+    def cumulative() -> float:
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=ROOT, check=True, capture_output=True, text=True,
+        )
+        for line in reversed(completed.stderr.splitlines()):
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == module:
+                return int(fields[1]) / 1_000_000
+        raise RuntimeError(f'No import time reported for {module}')
+    
+    return statistics.median(cumulative() for _ in range(repeat))
+
+
+def run_size(routes: int, repeat: int) -> Dict[str, Any]:
+    from synthetic import build_project
+    
+    project = build_project(routes)
+    
+    from django.test import Client
+    from django.urls import get_resolver
+    from autoapi_swagger import get_openapi_schema, invalidate_schema_cache
+    from autoapi_swagger.refs import validate_refs
+    from autoapi_swagger.utils import extract_url_patterns, get_serializer_fields
+    
+    def reset() -> None:
+        invalidate_schema_cache()
+    
+    def all_serializer_fields() -> None:
+        for serializer_class in project['serializers']:
+            get_serializer_fields(serializer_class)
+    
+    def urlconf_patterns() -> None:
+        extract_url_patterns(get_resolver().url_patterns)
+    
+    client = Client()
+    
+    def render_view() -> None:
+        response = client.get('/docs/openapi.json', HTTP_ACCEPT_ENCODING='gzip')
+        assert response.status_code == 200, response.status_code
+    
+    metrics = {}
+    metrics['import_autoapi_swagger'] = import_time('autoapi_swagger', repeat)
+    
+    reset()
+    metrics['extract_url_patterns.cold'] = timed(urlconf_patterns)
+    metrics['extract_url_patterns.warm'] = timed(urlconf_patterns, repeat)
+    
+    reset()
+    metrics['get_serializer_fields.cold'] = timed(all_serializer_fields)
+    metrics['get_serializer_fields.warm'] = timed(all_serializer_fields, repeat)
+    
+    reset()
+    metrics['get_openapi_schema.cold'] = timed(get_openapi_schema)
+    metrics['get_openapi_schema.warm'] = timed(get_openapi_schema, repeat)
+    
+    schema = get_openapi_schema()
+    metrics['validate_refs'] = timed(lambda: validate_refs(schema), repeat)
+    
+    reset()
+    metrics['schema_view.cold'] = timed(render_view)
+    metrics['schema_view.warm'] = timed(render_view, repeat)
+    
+    reset()
+    metrics['get_openapi_schema.peak_memory'] = peak_memory(get_openapi_schema)
+    
+    return {'shape': project['shape'], 'metrics': metrics}
+
+
+def run_isolated(routes: int, repeat: int) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, __file__, '--single', str(routes), '--repeat', str(repeat)],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def get_environment() -> Dict[str, str]:
+    import django
+    import rest_framework
+    import autoapi_swagger
+    
+    return {
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'djangorestframework': rest_framework.VERSION,
+        'autoapi_swagger': autoapi_swagger.__version__,
+        'platform': platform.platform(),
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    regressions = []
+    for size, current in results['results'].items():
+        previous = baseline.get('results', {}).get(size)
+        if not previous:
+            continue
+        for metric, value in current['metrics'].items():
+            reference = previous['metrics'].get(metric)
+            if not reference:
+                continue
+            ratio = value / reference
+            if ratio > 1 + threshold:
+                regressions.append(f'{size} routes: {metric} {reference:.6g} -> {value:.6g} ({ratio:.2f}x)')
+    return regressions
+
+
+def print_table(results: Dict[str, Any], stream=sys.stderr) -> None:
+    for size, result in results['results'].items():
+        print(f"\n{size} routes ({result['shape']})", file=stream)
+        for metric, value in result['metrics'].items():
+            unit = 'bytes' if metric.endswith('memory') else 's'
+            print(f'  {metric:<36} {value:>14.6f} {unit}' if unit == 's' else f'  {metric:<36} {value:>14d} {unit}', file=stream)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark autoapi-swagger schema generation on synthetic projects.')
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help='Comma-separated route counts.')
+    parser.add_argument('--repeat', type=int, default=5, help='Repetitions for warm measurements (median is kept).')
+    parser.add_argument('--output', help='Write results as JSON to this file.')
+    parser.add_argument('--baseline', help='Compare against a previously saved results file.')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed slowdown relative to the baseline before failing (0.2 = 20%%).')
+    parser.add_argument('--single', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    
+    if args.single:
+        print(json.dumps(run_size(args.single, args.repeat)))
+        return 0
+    
+    results = {'environment': None, 'results': {}}
+    for size in (int(s) for s in args.sizes.split(',') if s.strip()):
+        results['results'][str(size)] = run_isolated(size, args.repeat)
+    
+    from synthetic import configure_django
+    configure_django()
+    results['environment'] = get_environment()
+    
+    print_table(results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + '\n')
+    else:
+        print(json.dumps(results, indent=2))
+    
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.threshold)
+        if regressions:
+            print('\nRegressions:', *regressions, sep='\n  ', file=sys.stderr)
+            return 1
+        print('\nNo regressions against baseline.', file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,167 @@
+import sys
+import types
+from typing import Any, Dict, List
+
+
+APP_LABEL = 'autoapi_bench'
+URLCONF_MODULE = 'autoapi_bench_urls'
+
+
+def configure_django() -> None:
+    import django
+    from django.conf import settings
+    
+    if settings.configured:
+        return
+    settings.configure(
+        SECRET_KEY='autoapi-swagger-benchmarks',
+        DEBUG=False,
+        ALLOWED_HOSTS=['*'],
+        ROOT_URLCONF=URLCONF_MODULE,
+        INSTALLED_APPS=[
+            'django.contrib.contenttypes',
+            'django.contrib.auth',
+            'rest_framework',
+            'autoapi_swagger',
+        ],
+        DATABASES={},
+        USE_TZ=True,
+    )
+    django.setup()
+
+
+def get_project_shape(routes: int) -> Dict[str, int]:
+    routes = max(1, routes)
+    viewsets = routes // 4
+    views = max(1, routes - viewsets)
+    serializers = max(1, routes // 2)
+    models = max(1, routes // 4)
+    return {'routes': routes, 'views': views, 'viewsets': viewsets, 'serializers': serializers, 'models': models}
+
+
+def build_models(count: int) -> List[Any]:
+    from django.db import models
+    
+    result = []
+    for index in range(count):
+        attrs = {
+            '__module__': f'{APP_LABEL}.models',
+            'Meta': type('Meta', (), {'app_label': APP_LABEL}),
+            'name': models.CharField(max_length=100, help_text='Display name'),
+            'slug': models.SlugField(unique=True),
+            'email': models.EmailField(blank=True),
+            'quantity': models.PositiveIntegerField(default=0),
+            'price': models.DecimalField(max_digits=10, decimal_places=2),
+            'is_active': models.BooleanField(default=True),
+            'created_at': models.DateTimeField(auto_now_add=True),
+            'external_id': models.UUIDField(null=True),
+            'metadata': models.JSONField(default=dict),
+        }
+        result.append(type(f'BenchModel{index}', (models.Model,), attrs))
+    return result
+
+
+def build_serializers(count: int, model_classes: List[Any]) -> List[Any]:
+    from rest_framework import serializers
+    
+    result = []
+    for index in range(count):
+        model_class = model_classes[index % len(model_classes)]
+        meta = type('Meta', (), {'model': model_class, 'fields': '__all__'})
+        attrs = {
+            '__module__': f'{APP_LABEL}.serializers',
+            'Meta': meta,
+            'status': serializers.ChoiceField(choices=['draft', 'published'], required=False),
+            'notes': serializers.CharField(required=False, help_text='Free-form notes'),
+        }
+        result.append(type(f'BenchSerializer{index}', (serializers.ModelSerializer,), attrs))
+    return result
+
+
+def build_views(count: int, serializer_classes: List[Any]) -> List[Any]:
+    from rest_framework import views
+    from rest_framework.response import Response
+    
+    def handler(self, request, *args, **kwargs):
+        return Response({})
+    
+    result = []
+    for index in range(count):
+        serializer_class = serializer_classes[index % len(serializer_classes)]
+        methods = {'get': handler, 'post': handler} if index % 2 == 0 else {
+            'get': handler, 'put': handler, 'patch': handler, 'delete': handler,
+        }
+        attrs = {
+            '__module__': f'{APP_LABEL}.views',
+            'serializer_class': serializer_class,
+            'queryset': serializer_class.Meta.model.objects.all(),
+            **methods,
+        }
+        result.append(type(f'BenchView{index}', (views.APIView,), attrs))
+    return result
+
+
+def build_viewsets(count: int, serializer_classes: List[Any]) -> List[Any]:
+    from rest_framework import viewsets
+    from rest_framework.decorators import action
+    from rest_framework.response import Response
+    
+    def publish(self, request, pk=None):
+        return Response({})
+    
+    result = []
+    for index in range(count):
+        serializer_class = serializer_classes[(index * 2 + 1) % len(serializer_classes)]
+        attrs = {
+            '__module__': f'{APP_LABEL}.views',
+            'serializer_class': serializer_class,
+            'queryset': serializer_class.Meta.model.objects.all(),
+        }
+        if index % 2 == 0:
+            attrs['publish'] = action(detail=True, methods=['post'])(publish)
+        result.append(type(f'BenchViewSet{index}', (viewsets.ModelViewSet,), attrs))
+    return result
+
+
+def build_urlconf(view_classes: List[Any], viewset_classes: List[Any] = (), nesting: int = 3) -> types.ModuleType:
+    from django.urls import include, path
+    from rest_framework.routers import DefaultRouter
+    from autoapi_swagger.urls import get_urls
+    
+    groups: Dict[int, list] = {}
+    for index, view_class in enumerate(view_classes):
+        group = index // 50
+        route = f'resource{index}/' if index % 2 == 0 else f'resource{index}/<int:pk>/'
+        groups.setdefault(group, []).append(path(route, view_class.as_view(), name=f'resource-{index}'))
+    
+    routers: Dict[int, DefaultRouter] = {}
+    for index, viewset_class in enumerate(viewset_classes):
+        router = routers.setdefault(index // 50, DefaultRouter())
+        router.register(f'collection{index}', viewset_class, basename=f'collection-{index}')
+    
+    urlpatterns = [path(f'group{group}/', include(patterns)) for group, patterns in groups.items()]
+    urlpatterns += [path(f'routed{group}/', include(router.urls)) for group, router in routers.items()]
+    for level in reversed(range(nesting)):
+        urlpatterns = [path(f'v{level}/', include(urlpatterns))]
+    
+    module = types.ModuleType(URLCONF_MODULE)
+    module.urlpatterns = urlpatterns + [path('docs/', include(get_urls(title='Benchmark API')))]
+    sys.modules[URLCONF_MODULE] = module
+    return module
+
+
+def build_project(routes: int) -> Dict[str, Any]:
+    configure_django()
+    shape = get_project_shape(routes)
+    model_classes = build_models(shape['models'])
+    serializer_classes = build_serializers(shape['serializers'], model_classes)
+    view_classes = build_views(shape['views'], serializer_classes)
+    viewset_classes = build_viewsets(shape['viewsets'], serializer_classes)
+    build_urlconf(view_classes, viewset_classes)
+    return {
+        'shape': shape,
+        'models': model_classes,
+        'serializers': serializer_classes,
+        'views': view_classes,
+        'viewsets': viewset_classes,
+    }
@@ -13,6 +13,7 @@ setup(
     long_description_content_type="text/markdown",
     url="",
     packages=find_packages(exclude=['tests', 'tests.*']),
+    package_data={"autoapi_swagger": ["swagger_ui/*"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -36,5 +37,9 @@ setup(
         "Django>=4.2",
         "djangorestframework>=3.12",
     ],
+    extras_require={
+        "brotli": ["brotli>=1.0"],
+        "yaml": ["PyYAML>=5.1"],
+    },
 )
 
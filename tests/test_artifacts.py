@@ -0,0 +1,61 @@
+import gzip
+import json
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+from tests.testproject import setup
+
+setup()
+
+from django.core.management import call_command
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from rest_framework.utils.encoders import JSONEncoder
+from autoapi_swagger.cache import invalidate_schema_cache
+from autoapi_swagger.docs_generator import get_openapi_schema
+from autoapi_swagger.views import OpenAPISchemaView
+
+
+class GenerateOpenAPITestCase(SimpleTestCase):
+    """Django tests for writing schema artifacts and serving them without introspection"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        call_command('generate_openapi', output_dir=str(self.directory), title='Artifact API', stdout=StringIO())
+    
+    def test_artifacts_match_the_built_schema(self):
+        expected = json.loads(json.dumps(get_openapi_schema(title='Artifact API'), cls=JSONEncoder))
+        minified = (self.directory / 'openapi.min.json').read_bytes()
+        
+        self.assertEqual(json.loads((self.directory / 'openapi.json').read_text()), expected)
+        self.assertEqual(json.loads(minified), expected)
+        self.assertNotIn(b'\n', minified)
+        compressed = (self.directory / 'openapi.min.json.gz').read_bytes()
+        self.assertEqual(gzip.decompress(compressed), minified)
+        self.assertEqual(compressed[8], 2)
+    
+    def test_artifact_is_served_without_introspection(self):
+        view = OpenAPISchemaView.as_view()
+        factory = RequestFactory()
+        
+        with override_settings(AUTOAPI_SWAGGER={'SCHEMA_ARTIFACT_DIR': str(self.directory)}), \
+                mock.patch('autoapi_swagger.cache.get_openapi_schema', side_effect=AssertionError('introspected')):
+            response = view(factory.get('/docs/openapi.json'))
+            compressed = view(factory.get('/docs/openapi.json', HTTP_ACCEPT_ENCODING='gzip'))
+            shard = view(factory.get('/docs/openapi/Category.json'), tag='Category')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, (self.directory / 'openapi.min.json').read_bytes())
+        self.assertEqual(json.loads(response.content)['info']['title'], 'Artifact API')
+        self.assertEqual(compressed['Content-Encoding'], 'gzip')
+        self.assertEqual(compressed.content, (self.directory / 'openapi.min.json.gz').read_bytes())
+        self.assertEqual(shard.status_code, 200)
+        self.assertEqual({operation['tags'][0] for path_item in json.loads(shard.content)['paths'].values() for operation in path_item.values()}, {'Category'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import gzip
+import re
+import unittest
+from tests.testproject import setup
+
+setup()
+
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase
+from autoapi_swagger.assets import SWAGGER_UI_ASSETS, SWAGGER_UI_DIR
+from autoapi_swagger.constants import SWAGGER_UI_ASSET_CACHE_CONTROL
+from autoapi_swagger.views import get_swagger_ui_page, swagger_ui_asset_view, swagger_ui_view
+
+
+class SwaggerUIAssetTestCase(SimpleTestCase):
+    """Django tests for serving the bundled Swagger UI assets"""
+    
+    def setUp(self):
+        self.factory = RequestFactory()
+    
+    def get_asset_urls(self):
+        page = swagger_ui_view(self.factory.get('/docs/swagger/'), schema_url='openapi.json')
+        return dict(re.findall(r'(?:href|src)="/docs/swagger/assets/(([\w-]+)\.[0-9a-f]{12}\.\w+)"', page.content.decode()))
+    
+    def test_page_links_every_asset_by_content_hash(self):
+        page = swagger_ui_view(self.factory.get('/docs/swagger/'), schema_url='openapi.json')
+        
+        self.assertEqual(page.status_code, 200)
+        self.assertIn(b'url: "openapi.json"', page.content)
+        self.assertNotIn(b'unpkg', page.content)
+        self.assertEqual(sorted(name + '.' + hashed.rpartition('.')[2] for hashed, name in self.get_asset_urls().items()), sorted(SWAGGER_UI_ASSETS))
+    
+    def test_page_is_rendered_once_per_url(self):
+        self.assertIs(get_swagger_ui_page('openapi.json', '/docs/swagger/assets/'), get_swagger_ui_page('openapi.json', '/docs/swagger/assets/'))
+        self.assertIsNot(get_swagger_ui_page('v2.json', '/docs/swagger/assets/'), get_swagger_ui_page('openapi.json', '/docs/swagger/assets/'))
+    
+    def test_assets_are_served_immutable_and_precompressed(self):
+        hashed = {name: filename for filename, name in self.get_asset_urls().items()}
+        bundle = hashed['swagger-ui-bundle']
+        request = self.factory.get(f'/docs/swagger/assets/{bundle}', HTTP_ACCEPT_ENCODING='gzip')
+        
+        response = swagger_ui_asset_view(request, bundle)
+        not_modified = swagger_ui_asset_view(self.factory.get(f'/docs/swagger/assets/{bundle}', HTTP_IF_NONE_MATCH=response['ETag'], HTTP_ACCEPT_ENCODING='gzip'), bundle)
+        icon = swagger_ui_asset_view(self.factory.get('/', HTTP_ACCEPT_ENCODING='gzip'), hashed['favicon-32x32'])
+        
+        self.assertEqual(response['Cache-Control'], SWAGGER_UI_ASSET_CACHE_CONTROL)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(response['Content-Type'], 'application/javascript; charset=utf-8')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), (SWAGGER_UI_DIR / 'swagger-ui-bundle.js').read_bytes())
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertFalse(icon.has_header('Content-Encoding'))
+        self.assertEqual(icon.content, (SWAGGER_UI_DIR / 'favicon-32x32.png').read_bytes())
+    
+    def test_unhashed_names_are_not_found(self):
+        with self.assertRaises(Http404):
+            swagger_ui_asset_view(self.factory.get('/docs/swagger/assets/swagger-ui.css'), 'swagger-ui.css')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+from tests.testproject import setup
+
+setup()
+
+import types
+from django.test import SimpleTestCase, override_settings
+from django.urls import clear_url_caches, include, path
+from django.urls.converters import IntConverter, StringConverter, UUIDConverter
+from autoapi_swagger.cache import get_cached_schema_payload, invalidate_schema_cache, schema_cache, shard_cache, variant_cache
+from autoapi_swagger.docs_generator import get_drf_patterns
+from autoapi_swagger.utils import get_current_resolver, get_introspection_cache_stats, iter_url_patterns, resolver_changed
+from tests.testproject.views import TreeView
+
+
+class ResolverChangeTestCase(SimpleTestCase):
+    """Django tests for invalidating every cache when the URL resolver changes"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+        self.changes = []
+        resolver_changed.connect(self.record_change)
+        self.addCleanup(resolver_changed.disconnect, self.record_change)
+    
+    def record_change(self, resolver, **kwargs):
+        self.changes.append(resolver)
+    
+    def test_unchanged_resolver_keeps_caches(self):
+        first = get_cached_schema_payload()
+        self.assertIs(get_cached_schema_payload(), first)
+        self.assertEqual(self.changes, [])
+    
+    def test_clear_url_caches_resets_every_cache(self):
+        get_cached_schema_payload()
+        self.assertGreater(get_introspection_cache_stats()['serializer_fields']['size'], 0)
+        invalidations = [cache.stats()['invalidations'] for cache in (schema_cache, shard_cache, variant_cache)]
+        
+        clear_url_caches()
+        schema_cache.peek(('missing',))
+        
+        self.assertEqual(len(self.changes), 1)
+        self.assertEqual(
+            [cache.stats()['invalidations'] for cache in (schema_cache, shard_cache, variant_cache)],
+            [count + 1 for count in invalidations],
+        )
+        stats = get_introspection_cache_stats()
+        self.assertEqual(stats['serializer_fields']['size'], 0)
+        self.assertEqual(stats['model_graph']['models'], 0)
+        self.assertEqual(stats['component_names']['components'], 0)
+    
+    def test_root_urlconf_switch_rebuilds_schema(self):
+        before = get_cached_schema_payload()
+        with override_settings(ROOT_URLCONF='tests.testproject.urls_widgets'):
+            during = get_cached_schema_payload()
+        
+        self.assertIsNot(during, before)
+        self.assertIn(b'/api/a/widgets/', during.content)
+        self.assertNotIn(b'/api/a/widgets/', get_cached_schema_payload().content)
+        self.assertEqual(len(self.changes), 2)
+
+
+class URLPatternTestCase(SimpleTestCase):
+    """Django tests for flattening the URLconf lazily and memoizing it per resolver"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+    
+    def test_nested_includes_keep_prefixes_and_converters(self):
+        urlpatterns = [
+            path('v<int:version>/', include([
+                path('trees/', include([
+                    path('<uuid:id>/', TreeView.as_view(), name='tree-detail'),
+                ])),
+            ])),
+        ]
+        records = iter_url_patterns(urlpatterns, '/')
+        
+        self.assertIsInstance(records, types.GeneratorType)
+        record, = records
+        self.assertEqual(record['path'], '/v<int:version>/trees/<uuid:id>/')
+        self.assertIs(record['view_class'], TreeView)
+        self.assertEqual(record['name'], 'tree-detail')
+        self.assertEqual({name: type(converter) for name, converter in record['converters'].items()}, {'version': IntConverter, 'id': UUIDConverter})
+    
+    def test_patterns_are_flattened_once_per_resolver(self):
+        first = get_drf_patterns()
+        misses = get_introspection_cache_stats()['url_patterns']['misses']
+        
+        self.assertEqual(get_drf_patterns(), first)
+        self.assertEqual(get_introspection_cache_stats()['url_patterns']['misses'], misses)
+        self.assertIsInstance(next(p for p in first if p['path'].endswith('<str:tag>.json'))['converters']['tag'], StringConverter)
+    
+    def test_reloaded_resolver_is_flattened_again(self):
+        resolver = get_current_resolver()
+        get_drf_patterns()
+        
+        clear_url_caches()
+        with override_settings(ROOT_URLCONF='tests.testproject.urls_widgets'):
+            widget_paths = [p['path'] for p in get_drf_patterns()]
+        
+        self.assertIsNot(get_current_resolver(), resolver)
+        self.assertIn('api/a/widgets/', widget_paths)
+        self.assertNotIn('api/a/widgets/', [p['path'] for p in get_drf_patterns()])
+        self.assertEqual(get_introspection_cache_stats()['url_patterns']['hits'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
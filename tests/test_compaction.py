@@ -0,0 +1,99 @@
+import copy
+import unittest
+import importlib.util
+from pathlib import Path
+
+# Import compaction directly without triggering package __init__
+compaction_path = Path(__file__).parent.parent / 'autoapi_swagger' / 'compaction.py'
+spec = importlib.util.spec_from_file_location('compaction', compaction_path)
+compaction = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(compaction)
+
+ID_PARAMETER = {'name': 'id', 'in': 'path', 'required': True, 'schema': {'type': 'integer'}}
+NOT_FOUND = {'description': 'Not Found', 'content': {'application/json': {'schema': {'type': 'object'}}}}
+
+
+def success(ref, is_list=False):
+    data = {'type': 'array', 'items': {'$ref': ref}} if is_list else {'$ref': ref}
+    return {
+        'description': 'Success',
+        'content': {'application/json': {'schema': {'allOf': [
+            {'$ref': '#/components/schemas/JSendSuccess'},
+            {'properties': {'data': data}},
+        ]}}},
+    }
+
+
+def operation(ref, parameters=(), is_list=False):
+    op = {'responses': {'200': success(ref, is_list), '404': NOT_FOUND}}
+    if parameters:
+        op['parameters'] = list(parameters)
+    return op
+
+
+class CompactSchemaTestCase(unittest.TestCase):
+    """Pure Python tests for component deduplication"""
+    
+    def setUp(self):
+        self.schema = {
+            'openapi': '3.0.0',
+            'paths': {
+                '/items/': {'get': operation('#/components/schemas/Item', is_list=True)},
+                '/items/{id}/': {
+                    'get': operation('#/components/schemas/Item', [ID_PARAMETER]),
+                    'put': operation('#/components/schemas/Item', [ID_PARAMETER]),
+                },
+            },
+            'components': {'schemas': {'Item': {'type': 'object'}}},
+        }
+    
+    def test_repeated_parameter_is_referenced(self):
+        compacted = compaction.compact_schema(self.schema)
+        self.assertEqual(compacted['components']['parameters'], {'IdPath': ID_PARAMETER})
+        for method in ('get', 'put'):
+            self.assertEqual(
+                compacted['paths']['/items/{id}/'][method]['parameters'],
+                [{'$ref': '#/components/parameters/IdPath'}],
+            )
+    
+    def test_repeated_responses_are_referenced(self):
+        compacted = compaction.compact_schema(self.schema)
+        self.assertEqual(compacted['components']['responses']['NotFound'], NOT_FOUND)
+        self.assertEqual(
+            compacted['paths']['/items/{id}/']['get']['responses']['200'],
+            {'$ref': '#/components/responses/ItemResponse'},
+        )
+    
+    def test_envelopes_become_schemas(self):
+        compacted = compaction.compact_schema(self.schema)
+        self.assertIn('ItemEnvelope', compacted['components']['schemas'])
+        self.assertEqual(
+            compacted['components']['responses']['ItemResponse']['content']['application/json']['schema'],
+            {'$ref': '#/components/schemas/ItemEnvelope'},
+        )
+    
+    def test_single_use_items_stay_inline(self):
+        compacted = compaction.compact_schema(self.schema)
+        response = compacted['paths']['/items/']['get']['responses']['200']
+        self.assertEqual(response, success('#/components/schemas/Item', is_list=True))
+        self.assertNotIn('ItemListEnvelope', compacted['components']['schemas'])
+    
+    def test_min_occurrences_one_interns_everything(self):
+        compacted = compaction.compact_schema(self.schema, min_occurrences=1)
+        self.assertIn('ItemListEnvelope', compacted['components']['schemas'])
+        self.assertIn('ItemListResponse', compacted['components']['responses'])
+    
+    def test_input_is_not_mutated(self):
+        original = copy.deepcopy(self.schema)
+        compaction.compact_schema(self.schema)
+        self.assertEqual(self.schema, original)
+    
+    def test_name_collisions_get_suffix(self):
+        self.schema['components']['schemas']['ItemEnvelope'] = {'type': 'string'}
+        compacted = compaction.compact_schema(self.schema)
+        self.assertEqual(compacted['components']['schemas']['ItemEnvelope'], {'type': 'string'})
+        self.assertIn('ItemEnvelope2', compacted['components']['schemas'])
+    
+    def test_camelize(self):
+        self.assertEqual(compaction.camelize('Internal Server Error'), 'InternalServerError')
+        self.assertEqual(compaction.camelize('user_id query'), 'UserIdQuery')
@@ -0,0 +1,72 @@
+import unittest
+from tests.testproject import setup
+
+setup()
+
+from django.db import models
+from django.test import SimpleTestCase
+from rest_framework import serializers
+from autoapi_swagger import register_field_type, register_model_field_type
+from autoapi_swagger.cache import invalidate_schema_cache
+from autoapi_swagger.docs_generator import get_openapi_schema
+from autoapi_swagger.field_types import serializer_field_types
+from autoapi_swagger.utils import get_field_type, get_model_field_type
+
+
+class LowercaseEmailField(serializers.EmailField):
+    pass
+
+
+class MoneyField(serializers.DecimalField):
+    pass
+
+
+class CompanyEmailField(models.EmailField):
+    pass
+
+
+class FieldTypeTestCase(SimpleTestCase):
+    """Django tests for resolving field types through the class MRO"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+    
+    def test_subclasses_resolve_to_their_closest_registered_base(self):
+        self.assertEqual(get_field_type(LowercaseEmailField()), {'type': 'string', 'format': 'email'})
+        self.assertEqual(get_field_type(serializers.SlugField()), {'type': 'string'})
+        self.assertEqual(get_model_field_type(CompanyEmailField()), {'type': 'string', 'format': 'email'})
+        self.assertEqual(get_model_field_type(models.PositiveBigIntegerField()), {'type': 'integer'})
+    
+    def test_unknown_fields_fall_back_to_string(self):
+        self.assertEqual(get_field_type(serializers.ReadOnlyField()), {'type': 'string'})
+        self.assertEqual(get_model_field_type(models.GenericIPAddressField()), {'type': 'string'})
+    
+    def test_resolved_types_are_read_only(self):
+        type_info = get_field_type(serializers.EmailField())
+        
+        with self.assertRaises(TypeError):
+            type_info['format'] = 'uri'
+        self.assertIs(get_field_type(LowercaseEmailField()), type_info)
+    
+    def test_registering_a_subclass_overrides_its_base(self):
+        self.addCleanup(serializer_field_types.unregister, MoneyField)
+        self.assertEqual(get_field_type(MoneyField(max_digits=10, decimal_places=2)), {'type': 'number'})
+        
+        register_field_type(MoneyField, {'type': 'string', 'format': 'decimal'})
+        
+        self.assertEqual(get_field_type(MoneyField(max_digits=10, decimal_places=2)), {'type': 'string', 'format': 'decimal'})
+        self.assertEqual(get_field_type(serializers.DecimalField(max_digits=10, decimal_places=2)), {'type': 'number'})
+    
+    def test_registered_types_reach_the_schema(self):
+        self.addCleanup(register_model_field_type, models.DecimalField, {'type': 'number'})
+        self.assertEqual(get_openapi_schema()['components']['schemas']['Product']['properties']['price']['type'], 'number')
+        
+        register_model_field_type(models.DecimalField, {'type': 'string', 'format': 'decimal'})
+        price = get_openapi_schema()['components']['schemas']['Product']['properties']['price']
+        
+        self.assertEqual(price, {'type': 'string', 'format': 'decimal', 'default': 0})
+        self.assertEqual(get_openapi_schema()['components']['schemas']['Product']['properties']['email']['format'], 'email')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).parent.parent
+
+
+def run_isolated(code):
+    completed = subprocess.run(
+        [sys.executable, '-c', code], cwd=ROOT, check=True, capture_output=True, text=True,
+    )
+    return json.loads(completed.stdout)
+
+
+class LazyImportTestCase(unittest.TestCase):
+    """Pure Python tests for lazy top-level imports"""
+    
+    def test_package_import_loads_no_framework_modules(self):
+        loaded = run_isolated(
+            'import json, sys, autoapi_swagger; '
+            "print(json.dumps(sorted(m for m in sys.modules if m.split('.')[0] in ('django', 'rest_framework', 'autoapi_swagger'))))"
+        )
+        self.assertEqual(loaded, ['autoapi_swagger'])
+    
+    def test_version_does_not_trigger_lazy_loading(self):
+        loaded = run_isolated(
+            'import json, sys, autoapi_swagger; autoapi_swagger.__version__; '
+            "print(json.dumps([m for m in sys.modules if m.startswith('autoapi_swagger.')]))"
+        )
+        self.assertEqual(loaded, [])
+    
+    def test_public_names_are_listed(self):
+        names = run_isolated('import json, autoapi_swagger; print(json.dumps([dir(autoapi_swagger), autoapi_swagger.__all__]))')
+        self.assertTrue(set(names[1]) <= set(names[0]))
+    
+    def test_unknown_attribute_raises(self):
+        raised = run_isolated(
+            'import json, autoapi_swagger\n'
+            'try:\n'
+            '    autoapi_swagger.missing\n'
+            'except AttributeError as exc:\n'
+            '    print(json.dumps(str(exc)))\n'
+        )
+        self.assertIn('missing', raised)
+
+
+if __name__ == '__main__':
+    unittest.main()
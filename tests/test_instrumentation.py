@@ -0,0 +1,72 @@
+import tempfile
+import unittest
+from io import StringIO
+from tests.testproject import setup
+
+setup()
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from autoapi_swagger.cache import invalidate_schema_cache
+from autoapi_swagger.docs_generator import get_openapi_schema
+from autoapi_swagger.instrumentation import is_enabled, profile_schema_build, register_hook, schema_stage_timed, unregister_hook
+
+
+class InstrumentationTestCase(SimpleTestCase):
+    """Django tests for per-stage timing hooks and the --profile report"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+    
+    def test_profile_covers_every_build_stage(self):
+        with profile_schema_build() as profile:
+            get_openapi_schema()
+        
+        self.assertEqual(
+            set(profile.totals()),
+            {'extract_url_patterns', 'build_path_item', 'get_serializer_fields', 'get_model_fields', 'extract_schemas', 'assembly'},
+        )
+        self.assertEqual(profile.totals()['extract_url_patterns']['count'], 1)
+        self.assertIn('tests.testproject.views.TreeView', dict(profile.slowest_views(limit=100)))
+        self.assertIn('tests.testproject.serializers.ProductSerializer', dict(profile.slowest_serializers(limit=100)))
+        self.assertIn('tests.testproject.models.Category', dict(profile.slowest_models(limit=100)))
+        self.assertEqual(len(profile.slowest_views(limit=2)), 2)
+    
+    def test_hooks_and_signal_receivers_get_the_same_events(self):
+        hooked, received = [], []
+        
+        def hook(stage, label, duration):
+            hooked.append((stage, label))
+        
+        def receiver(sender, stage, label, duration, **kwargs):
+            received.append((stage, label))
+        
+        register_hook(hook)
+        schema_stage_timed.connect(receiver)
+        try:
+            get_openapi_schema()
+        finally:
+            unregister_hook(hook)
+            schema_stage_timed.disconnect(receiver)
+        
+        self.assertTrue(hooked)
+        self.assertEqual(received, hooked)
+        self.assertFalse(is_enabled())
+    
+    def test_generate_openapi_prints_the_profile(self):
+        stdout = StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            call_command('generate_openapi', output_dir=directory, profile=True, profile_top=1, stdout=stdout)
+        lines = stdout.getvalue().splitlines()
+        
+        self.assertEqual(lines[0], 'Stage timings:')
+        self.assertIn('build_path_item', {line.split()[0] for line in lines[1:lines.index('Slowest views:')]})
+        for heading in ('Slowest views:', 'Slowest serializers:', 'Slowest models:'):
+            entries = lines[lines.index(heading) + 1:lines.index(heading) + 3]
+            self.assertTrue(entries[0].startswith('  ') and entries[0].endswith(('View', 'ViewSet', 'Serializer', 'Category', 'Product', 'Tag')))
+            self.assertFalse(entries[1].startswith('  '))
+        self.assertFalse(is_enabled())
+
+
+if __name__ == '__main__':
+    unittest.main()
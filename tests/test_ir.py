@@ -0,0 +1,127 @@
+import json
+import pickle
+import sys
+import unittest
+import importlib.util
+from pathlib import Path
+
+# Import ir directly without triggering package __init__
+ir_path = Path(__file__).parent.parent / 'autoapi_swagger' / 'ir.py'
+spec = importlib.util.spec_from_file_location('ir', ir_path)
+ir = importlib.util.module_from_spec(spec)
+# Nodes are pickled by module path for process pool builds
+sys.modules[spec.name] = ir
+spec.loader.exec_module(ir)
+
+
+ERROR_RESPONSE = {'description': 'Bad Request'}
+
+
+def build_operation(operation_id, schema_name='Product'):
+    return ir.Operation(
+        summary='Retrieve',
+        operation_id=operation_id,
+        tags=('Product',),
+        parameters=(ir.Parameter('id', 'path', ir.PropertySchema(type='integer'), required=True, description='Resource identifier'),),
+        request_body=ir.RequestBody(ir.Ref(schema_name)),
+        responses={
+            '200': ir.Response('Success', ir.EnvelopeSchema(ir.Ref('JSendSuccess'), ir.ArraySchema(ir.Ref(schema_name)))),
+            '400': ir.Raw(ERROR_RESPONSE),
+        },
+    )
+
+
+class IntermediateRepresentationTestCase(unittest.TestCase):
+    """Pure Python tests for the schema intermediate representation"""
+    
+    def test_operation_renders_openapi_dict(self):
+        rendered = ir.Renderer().render(build_operation('product_retrieve'))
+        
+        self.assertEqual(list(rendered), ['summary', 'operationId', 'tags', 'parameters', 'requestBody', 'responses'])
+        self.assertEqual(rendered['parameters'], [{
+            'name': 'id',
+            'in': 'path',
+            'required': True,
+            'schema': {'type': 'integer'},
+            'description': 'Resource identifier',
+        }])
+        self.assertEqual(rendered['requestBody'], {
+            'required': True,
+            'content': {'application/json': {'schema': {'$ref': '#/components/schemas/Product'}}},
+        })
+        self.assertEqual(rendered['responses']['200']['content']['application/json']['schema'], {'allOf': [
+            {'$ref': '#/components/schemas/JSendSuccess'},
+            {'properties': {'data': {'type': 'array', 'items': {'$ref': '#/components/schemas/Product'}}}},
+        ]})
+        self.assertEqual(rendered['responses']['400'], ERROR_RESPONSE)
+        self.assertIsNot(rendered['responses']['400'], ERROR_RESPONSE)
+    
+    def test_equal_nodes_render_to_shared_dicts(self):
+        renderer = ir.Renderer()
+        first = renderer.render(build_operation('product_list'))
+        second = renderer.render(build_operation('product_create'))
+        
+        self.assertIsNot(first, second)
+        self.assertIs(first['parameters'][0], second['parameters'][0])
+        self.assertIs(first['responses']['200'], second['responses']['200'])
+        self.assertIsNot(
+            first['responses']['200'],
+            renderer.render(build_operation('order_list', 'Order'))['responses']['200'],
+        )
+    
+    def test_uninterned_renderer_returns_unshared_dicts(self):
+        renderer = ir.Renderer(intern=False)
+        first = renderer.render(build_operation('product_list'))
+        second = renderer.render(build_operation('product_create'))
+        
+        self.assertEqual(first['responses'], second['responses'])
+        self.assertIsNot(first['parameters'][0], second['parameters'][0])
+        self.assertIsNot(first['responses']['200'], second['responses']['200'])
+        first['responses']['400']['description'] = 'Changed'
+        self.assertEqual(second['responses']['400'], ERROR_RESPONSE)
+    
+    def test_property_schema_omits_unset_keys(self):
+        render = ir.Renderer().render
+        
+        self.assertEqual(render(ir.PropertySchema(type='string')), {'type': 'string'})
+        self.assertEqual(render(ir.PropertySchema(type='string', default=None)), {'type': 'string', 'default': None})
+        self.assertEqual(
+            render(ir.PropertySchema(type='integer', read_only=True, related=ir.Ref('Category'))),
+            {'type': 'integer', 'readOnly': True, 'x-related': {'$ref': '#/components/schemas/Category'}},
+        )
+    
+    def test_unhashable_defaults_are_rendered_without_interning(self):
+        prop = ir.PropertySchema(type='object', default={'a': 1})
+        schema = ir.ObjectSchema([('options', prop)], ['options'])
+        
+        self.assertEqual(ir.Renderer().render(schema), {
+            'type': 'object',
+            'properties': {'options': {'type': 'object', 'default': {'a': 1}}},
+            'required': ['options'],
+        })
+    
+    def test_nodes_survive_pickling(self):
+        operation = build_operation('product_retrieve')
+        restored = pickle.loads(pickle.dumps(operation))
+        
+        self.assertEqual(restored.parameters, operation.parameters)
+        self.assertEqual(
+            json.dumps(ir.Renderer().render(restored), sort_keys=True),
+            json.dumps(ir.Renderer().render(operation), sort_keys=True),
+        )
+    
+    @unittest.skipIf(ir.yaml is None, 'PyYAML is not installed')
+    def test_yaml_spells_out_shared_subtrees(self):
+        renderer = ir.Renderer()
+        document = {'paths': renderer.render_paths({
+            '/a/': {'get': build_operation('a_get')},
+            '/b/': {'get': build_operation('b_get')},
+        })}
+        rendered = ir.render_yaml(document)
+        
+        self.assertNotIn('&id', rendered)
+        self.assertEqual(ir.yaml.safe_load(rendered), json.loads(json.dumps(document)))
+
+
+if __name__ == '__main__':
+    unittest.main()
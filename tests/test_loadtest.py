@@ -0,0 +1,148 @@
+import threading
+import unittest
+import importlib.util
+from pathlib import Path
+
+# Import loadtest directly without triggering package __init__
+loadtest_path = Path(__file__).parent.parent / 'autoapi_swagger' / 'loadtest.py'
+spec = importlib.util.spec_from_file_location('loadtest', loadtest_path)
+loadtest = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(loadtest)
+
+
+def ref(section, name):
+    return {'$ref': f'#/components/{section}/{name}'}
+
+
+COMPONENTS = {
+    'schemas': {
+        'Product': {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer', 'readOnly': True},
+                'name': {'type': 'string'},
+                'email': {'type': 'string', 'format': 'email'},
+                'status': {'type': 'string', 'enum': ['draft', 'live']},
+                'price': {'type': 'number', 'default': 5},
+                'category': ref('schemas', 'Category'),
+                'tags': {'type': 'array', 'items': {'type': 'integer'}},
+            },
+            'required': ['name'],
+        },
+        'Category': {'type': 'object', 'properties': {'name': {'type': 'string'}, 'parent': ref('schemas', 'Category')}},
+    },
+    'parameters': {'IdPath': {'name': 'id', 'in': 'path', 'schema': {'type': 'integer'}}},
+}
+
+
+class SynthesizeTestCase(unittest.TestCase):
+    """Pure Python tests for request body synthesis"""
+    
+    def test_object_from_component(self):
+        body = loadtest.synthesize(ref('schemas', 'Product'), COMPONENTS, write=True)
+        self.assertEqual(body, {
+            'name': 'string',
+            'email': 'user@example.com',
+            'status': 'draft',
+            'price': 5,
+            'category': {'name': 'string'},
+            'tags': [1],
+        })
+    
+    def test_read_only_fields_are_kept_outside_request_bodies(self):
+        self.assertEqual(loadtest.synthesize(ref('schemas', 'Product'), COMPONENTS)['id'], 1)
+    
+    def test_all_of_is_merged(self):
+        schema = {'allOf': [{'type': 'object', 'properties': {'a': {'type': 'boolean'}}}, {'properties': {'b': {'type': 'string', 'format': 'date'}}}]}
+        self.assertEqual(loadtest.synthesize(schema, COMPONENTS), {'a': True, 'b': '2024-01-01'})
+
+
+class LoadPlanTestCase(unittest.TestCase):
+    """Pure Python tests for turning a schema into load operations"""
+    
+    def setUp(self):
+        self.schema = {
+            'paths': {
+                '/api/products/': {
+                    'get': {'operationId': 'product_list'},
+                    'post': {
+                        'operationId': 'product_create',
+                        'requestBody': {'content': {'application/json': {'schema': ref('schemas', 'Product')}}},
+                    },
+                },
+                '/api/products/{id}/': {'get': {'operationId': 'product_detail', 'parameters': [ref('parameters', 'IdPath')]}},
+                '/api/v1/^products/(?P<pk>[^/.]+)/': {'get': {'operationId': 'product_detail'}},
+                '/api/v1/^products\\.(?P<format>[a-z0-9]+)/?': {'get': {'operationId': 'product_list'}},
+                '/api/tree/<int:depth>/<slug:name>/': {'delete': {}},
+            },
+            'components': COMPONENTS,
+        }
+    
+    def test_urls_and_bodies(self):
+        plan = loadtest.build_load_plan(self.schema, unsafe_methods=True)
+        self.assertEqual(
+            [(operation.operation_id, operation.method, operation.url) for operation in plan.operations],
+            [
+                ('product_list', 'get', '/api/products/'),
+                ('product_create', 'post', '/api/products/'),
+                ('product_detail', 'get', '/api/products/1/'),
+                ('product_detail_2', 'get', '/api/v1/products/1/'),
+                ('delete_/api/tree/<int:depth>/<slug:name>/', 'delete', '/api/tree/1/example/'),
+            ],
+        )
+        self.assertEqual(plan.operations[1].body['name'], 'string')
+        self.assertEqual(list(plan.skipped), ['product_list_2'])
+    
+    def test_write_methods_are_skipped_by_default(self):
+        plan = loadtest.build_load_plan(self.schema)
+        
+        self.assertEqual({operation.method for operation in plan.operations}, {'get'})
+        self.assertEqual(
+            sorted(operation_id for operation_id, reason in plan.skipped.items() if 'unsafe' in reason),
+            ['delete_/api/tree/<int:depth>/<slug:name>/', 'product_create'],
+        )
+    
+    def test_filters_and_path_params(self):
+        plan = loadtest.build_load_plan(self.schema, methods=['GET'], operation_ids=['product_detail'], path_params={'id': '7'})
+        self.assertEqual([operation.url for operation in plan.operations], ['/api/products/7/', '/api/v1/products/1/'])
+
+
+class RunLoadTestCase(unittest.TestCase):
+    """Pure Python tests for the load driver and latency report"""
+    
+    def test_percentile_uses_nearest_rank(self):
+        ordered = [float(value) for value in range(1, 101)]
+        self.assertEqual(loadtest.percentile(ordered, 50), 50.0)
+        self.assertEqual(loadtest.percentile(ordered, 99), 99.0)
+        self.assertEqual(loadtest.percentile([3.0], 95), 3.0)
+        self.assertEqual(loadtest.percentile([], 95), 0.0)
+    
+    def test_requests_are_spread_over_workers(self):
+        operations = [
+            loadtest.LoadOperation('ok', 'get', '/ok/', '/ok/'),
+            loadtest.LoadOperation('broken', 'post', '/broken/', '/broken/', {'name': 'string'}),
+        ]
+        calls = []
+        lock = threading.Lock()
+        
+        def send(method, url, body, headers):
+            with lock:
+                calls.append((method, url, headers['Authorization']))
+            if url == '/broken/':
+                raise ConnectionError
+            return 200
+        
+        report = loadtest.run_load(operations, send, concurrency=3, requests=10, warmup=1, headers={'Authorization': 'Token x'})
+        summary = report.to_dict()
+        
+        self.assertEqual(len(calls), 22)
+        self.assertEqual(summary['requests'], 20)
+        self.assertEqual(summary['operations']['ok']['errors'], 0)
+        self.assertEqual(summary['operations']['broken']['errors'], 10)
+        self.assertEqual(summary['operations']['broken']['statuses'], {'0': 10})
+        self.assertIn('p99_ms', summary['operations']['ok'])
+        self.assertIn('broken', report.format_table())
+
+
+if __name__ == '__main__':
+    unittest.main()
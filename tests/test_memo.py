@@ -0,0 +1,63 @@
+import gc
+import unittest
+import importlib.util
+from pathlib import Path
+
+# Import memo directly without triggering package __init__
+memo_path = Path(__file__).parent.parent / 'autoapi_swagger' / 'memo.py'
+spec = importlib.util.spec_from_file_location('memo', memo_path)
+memo = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(memo)
+
+
+class WeakMemoTestCase(unittest.TestCase):
+    """Pure Python tests for the weakref-keyed introspection memo"""
+    
+    def setUp(self):
+        self.calls = []
+        self.memo = memo.WeakMemo(maxsize=2)
+    
+    def compute(self, key):
+        self.calls.append(key)
+        return key.__name__
+    
+    def test_computes_once(self):
+        cls = type('A', (), {})
+        self.assertEqual(self.memo.get_or_compute(cls, self.compute), 'A')
+        self.assertEqual(self.memo.get_or_compute(cls, self.compute), 'A')
+        self.assertEqual(self.calls, [cls])
+        self.assertEqual(self.memo.stats()['hits'], 1)
+        self.assertEqual(self.memo.stats()['misses'], 1)
+    
+    def test_bounded_lru(self):
+        a, b, c = (type(name, (), {}) for name in 'ABC')
+        self.memo.get_or_compute(a, self.compute)
+        self.memo.get_or_compute(b, self.compute)
+        self.memo.get_or_compute(a, self.compute)
+        self.memo.get_or_compute(c, self.compute)
+        self.assertIn(a, self.memo)
+        self.assertNotIn(b, self.memo)
+        self.assertEqual(len(self.memo), 2)
+    
+    def test_entries_do_not_keep_keys_alive(self):
+        cls = type('Temporary', (), {})
+        self.memo.get_or_compute(cls, self.compute)
+        del cls
+        self.calls.clear()
+        gc.collect()
+        self.assertEqual(len(self.memo), 0)
+    
+    def test_clear(self):
+        cls = type('A', (), {})
+        self.memo.get_or_compute(cls, self.compute)
+        self.memo.clear()
+        self.assertEqual(self.memo.stats(), {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 2})
+    
+    def test_reset_locks_replaces_a_held_lock(self):
+        held = self.memo._lock
+        held.acquire()
+        self.addCleanup(held.release)
+        self.memo.reset_locks()
+        
+        cls = type('A', (), {})
+        self.assertEqual(self.memo.get_or_compute(cls, self.compute), 'A')
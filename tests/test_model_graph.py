@@ -0,0 +1,79 @@
+import unittest
+from tests.testproject import setup
+
+setup()
+
+from django.apps import apps
+from django.test import SimpleTestCase
+from autoapi_swagger.cache import invalidate_schema_cache
+from autoapi_swagger.docs_generator import build_model_schema, get_openapi_schema
+from autoapi_swagger.ir import Renderer
+from autoapi_swagger.utils import clear_introspection_caches, get_introspection_cache_stats, get_model_fields, get_related_models
+from tests.testproject.models import Category, Product, Redemption, Tag, Voucher
+
+
+class ModelGraphTestCase(SimpleTestCase):
+    """Django tests for relation-aware model schemas built from the model graph"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+        clear_introspection_caches()
+    
+    def test_relations_use_the_target_primary_key_type(self):
+        fields = get_model_fields(Redemption)
+        
+        self.assertEqual((fields['voucher']['type'], fields['voucher']['format']), ('string', 'uuid'))
+        self.assertIs(fields['voucher']['related_model'], Voucher)
+        self.assertFalse(fields['voucher']['many'])
+        self.assertEqual(fields['products']['type'], 'integer')
+        self.assertTrue(fields['products']['many'])
+    
+    def test_forward_relations_reference_the_related_component(self):
+        properties = Renderer().render(build_model_schema(Redemption))['properties']
+        
+        self.assertEqual(properties['id'], {'type': 'integer', 'description': 'Primary key'})
+        self.assertEqual(properties['voucher'], {'type': 'string', 'format': 'uuid', 'x-related': {'$ref': '#/components/schemas/Voucher'}})
+        self.assertEqual(properties['products'], {
+            'type': 'array',
+            'items': {'type': 'integer'},
+            'x-related': {'$ref': '#/components/schemas/Product'},
+        })
+    
+    def test_reverse_relations_are_read_only(self):
+        properties = get_openapi_schema()['components']['schemas']['Category']['properties']
+        
+        self.assertEqual(properties['products'], {'type': 'array', 'items': {'type': 'integer'}, 'readOnly': True})
+        self.assertEqual(properties['category_set'], {'type': 'array', 'items': {'type': 'integer'}, 'readOnly': True})
+        self.assertEqual(properties['parent']['x-related'], {'$ref': '#/components/schemas/Category'})
+        self.assertEqual(get_model_fields(Voucher)['redemption'], {
+            'type': 'integer', 'required': False, 'read_only': True, 'related_model': Redemption, 'many': False,
+        })
+    
+    def test_cached_fields_cannot_be_changed_by_callers(self):
+        fields = get_model_fields(Product)
+        
+        with self.assertRaises(TypeError):
+            fields['injected'] = {'type': 'string', 'required': False}
+        with self.assertRaises(TypeError):
+            fields['category']['read_only'] = True
+        
+        self.assertIs(get_model_fields(Product), fields)
+        self.assertNotIn('read_only', fields['category'])
+    
+    def test_related_models_follow_writable_relations(self):
+        self.assertEqual(get_related_models(Product), (Category, Tag))
+        self.assertEqual(get_related_models(Redemption), (Voucher, Product, Category, Tag))
+        self.assertEqual(get_related_models(Voucher), ())
+    
+    def test_every_model_is_indexed_once(self):
+        get_model_fields(Product)
+        get_model_fields(Category)
+        stats = get_introspection_cache_stats()['model_graph']
+        
+        self.assertEqual(stats['models'], len(apps.get_models()))
+        self.assertEqual(stats['misses'], 0)
+        self.assertEqual(stats['hits'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
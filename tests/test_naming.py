@@ -0,0 +1,78 @@
+import unittest
+import importlib.util
+from pathlib import Path
+
+# Import naming directly without triggering package __init__
+naming_path = Path(__file__).parent.parent / 'autoapi_swagger' / 'naming.py'
+spec = importlib.util.spec_from_file_location('naming', naming_path)
+naming = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(naming)
+
+
+def make_class(name, module, qualname=None):
+    cls = type(name, (), {'__module__': module})
+    cls.__qualname__ = qualname or name
+    return cls
+
+
+class ComponentNamesTestCase(unittest.TestCase):
+    """Pure Python tests for component name disambiguation"""
+    
+    def setUp(self):
+        self.names = naming.ComponentNames()
+        self.shop_product = make_class('ProductSerializer', 'shop.serializers')
+        self.billing_product = make_class('ProductSerializer', 'billing.serializers')
+        self.category = make_class('CategorySerializer', 'shop.serializers')
+    
+    def test_unique_names_are_kept(self):
+        self.names.index([self.shop_product, self.category, self.category])
+        
+        self.assertEqual(self.names.get(self.shop_product), 'ProductSerializer')
+        self.assertEqual(self.names.get(self.category), 'CategorySerializer')
+        self.assertEqual(self.names.collisions(), {})
+    
+    def test_colliding_names_are_qualified(self):
+        with self.assertLogs('naming', level='WARNING'):
+            self.names.index([self.shop_product, self.category, self.billing_product])
+        
+        self.assertEqual(self.names.get(self.shop_product), 'shop.serializers.ProductSerializer')
+        self.assertEqual(self.names.get(self.billing_product), 'billing.serializers.ProductSerializer')
+        self.assertEqual(self.names.get(self.category), 'CategorySerializer')
+        self.assertEqual(self.names.collisions(), {
+            'ProductSerializer': ('shop.serializers.ProductSerializer', 'billing.serializers.ProductSerializer'),
+        })
+    
+    def test_identical_qualified_names_get_suffixes(self):
+        first = make_class('Item', 'app.factories', 'build.<locals>.Item')
+        second = make_class('Item', 'app.factories', 'build.<locals>.Item')
+        with self.assertLogs('naming', level='WARNING'):
+            self.names.index([first, second])
+        
+        self.assertEqual(self.names.get(first), 'app.factories.build._locals_.Item')
+        self.assertEqual(self.names.get(second), 'app.factories.build._locals_.Item_2')
+    
+    def test_unindexed_classes_do_not_shadow_indexed_ones(self):
+        self.names.index([self.shop_product])
+        
+        self.assertEqual(self.names.get(self.billing_product), 'billing.serializers.ProductSerializer')
+        self.assertEqual(self.names.get(self.category), 'CategorySerializer')
+    
+    def test_clear_resets_index(self):
+        self.names.index([self.shop_product])
+        self.names.clear()
+        
+        self.assertFalse(self.names.indexed)
+        self.assertEqual(self.names.stats(), {'components': 0, 'collisions': 0})
+    
+    def test_index_is_tied_to_its_source(self):
+        first, second = object(), object()
+        self.names.index([self.shop_product], source=first)
+        
+        self.assertTrue(self.names.indexed_for(first))
+        self.assertFalse(self.names.indexed_for(second))
+        self.names.clear()
+        self.assertFalse(self.names.indexed_for(first))
+
+
+if __name__ == '__main__':
+    unittest.main()
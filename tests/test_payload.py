@@ -0,0 +1,95 @@
+import gzip
+import json
+import threading
+import time
+import unittest
+import importlib.util
+from pathlib import Path
+
+# Import payload directly without triggering package __init__
+payload_path = Path(__file__).parent.parent / 'autoapi_swagger' / 'payload.py'
+spec = importlib.util.spec_from_file_location('payload', payload_path)
+payload = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(payload)
+
+
+class SchemaPayloadTestCase(unittest.TestCase):
+    """Pure Python tests for pre-rendered schema payloads"""
+    
+    def setUp(self):
+        self.schema = {'openapi': '3.0.0', 'info': {'title': 'Café'}, 'paths': {}}
+        self.payload = payload.SchemaPayload.from_schema(self.schema)
+    
+    def test_content_is_compact_json(self):
+        self.assertEqual(json.loads(self.payload.content), self.schema)
+        self.assertNotIn(b', ', self.payload.content)
+        self.assertIn('Café'.encode('utf-8'), self.payload.content)
+    
+    def test_gzip_round_trip(self):
+        self.assertEqual(gzip.decompress(self.payload.encode('gzip')), self.payload.content)
+    
+    def test_runtime_compression_uses_a_moderate_level(self):
+        # Byte 8 of a gzip member is 2 for the slowest level and 0 for the levels in between.
+        self.assertEqual(self.payload.encode('gzip')[8], 0)
+        self.assertEqual(payload.compress(self.payload.content, 'gzip', payload.MAX_LEVELS['gzip'])[8], 2)
+    
+    def test_concurrent_first_requests_compress_once(self):
+        calls = []
+        original = payload.compress
+        
+        def slow_compress(content, encoding, level=None):
+            calls.append(encoding)
+            time.sleep(0.05)
+            return original(content, encoding, level)
+        
+        payload.compress = slow_compress
+        self.addCleanup(setattr, payload, 'compress', original)
+        threads = [threading.Thread(target=self.payload.encode, args=('gzip',)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(calls, ['gzip'])
+    
+    def test_identity_encoding(self):
+        self.assertIs(self.payload.encode('identity'), self.payload.content)
+    
+    def test_etag_is_strong_and_per_encoding(self):
+        self.assertTrue(self.payload.etag().startswith('"'))
+        self.assertNotEqual(self.payload.etag('identity'), self.payload.etag('gzip'))
+    
+    def test_etag_is_stable_for_same_content(self):
+        other = payload.SchemaPayload.from_schema(dict(self.schema))
+        self.assertEqual(self.payload.etag(), other.etag())
+    
+    def test_matches(self):
+        self.assertTrue(self.payload.matches([self.payload.etag()]))
+        self.assertTrue(self.payload.matches([self.payload.etag('gzip')]))
+        self.assertTrue(self.payload.matches(['W/' + self.payload.etag()]))
+        self.assertTrue(self.payload.matches(['*']))
+        self.assertFalse(self.payload.matches(['"other"']))
+
+
+class ChooseEncodingTestCase(unittest.TestCase):
+    """Pure Python tests for Accept-Encoding negotiation"""
+    
+    available = ('br', 'gzip', 'identity')
+    
+    def test_empty_header(self):
+        self.assertEqual(payload.choose_encoding('', self.available), 'identity')
+    
+    def test_prefers_first_available(self):
+        self.assertEqual(payload.choose_encoding('gzip, deflate, br', self.available), 'br')
+    
+    def test_quality_values(self):
+        self.assertEqual(payload.choose_encoding('br;q=0.5, gzip;q=0.8', self.available), 'gzip')
+    
+    def test_refused_encoding(self):
+        self.assertEqual(payload.choose_encoding('br;q=0, gzip', self.available), 'gzip')
+    
+    def test_unavailable_encoding(self):
+        self.assertEqual(payload.choose_encoding('br', ('gzip', 'identity')), 'identity')
+    
+    def test_wildcard(self):
+        self.assertEqual(payload.choose_encoding('*', ('gzip', 'identity')), 'gzip')
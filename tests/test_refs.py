@@ -0,0 +1,155 @@
+import unittest
+import importlib.util
+from pathlib import Path
+
+# Import refs directly without triggering package __init__
+refs_path = Path(__file__).parent.parent / 'autoapi_swagger' / 'refs.py'
+spec = importlib.util.spec_from_file_location('refs', refs_path)
+refs = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(refs)
+
+
+def ref(section, name):
+    return {'$ref': f'#/components/{section}/{name}'}
+
+
+class SchemaShardTestCase(unittest.TestCase):
+    """Pure Python tests for shard filtering and component pruning"""
+    
+    def setUp(self):
+        self.schema = {
+            'openapi': '3.0.0',
+            'paths': {
+                '/api/products/': {
+                    'get': {'tags': ['Product'], 'responses': {'200': ref('responses', 'ProductResponse')}},
+                },
+                '/api/billing/invoices/': {
+                    'get': {'tags': ['Invoice'], 'responses': {'200': ref('responses', 'InvoiceResponse')}},
+                    'post': {'tags': ['Invoice'], 'parameters': [ref('parameters', 'IdPath')], 'responses': {}},
+                },
+            },
+            'components': {
+                'schemas': {
+                    'Product': {'type': 'object'},
+                    'Invoice': {'type': 'object', 'properties': {'lines': {'type': 'array', 'items': ref('schemas', 'Line')}}},
+                    'Line': {'type': 'object', 'properties': {'invoice': ref('schemas', 'Invoice')}},
+                    'Unused': {'type': 'object'},
+                },
+                'responses': {
+                    'ProductResponse': {'content': {'application/json': {'schema': ref('schemas', 'Product')}}},
+                    'InvoiceResponse': {'content': {'application/json': {'schema': ref('schemas', 'Invoice')}}},
+                },
+                'parameters': {'IdPath': {'name': 'id', 'in': 'path'}},
+            },
+        }
+    
+    def test_iter_refs_walks_nested_values(self):
+        found = set(refs.iter_refs(self.schema['components']['schemas']))
+        self.assertEqual(found, {'#/components/schemas/Line', '#/components/schemas/Invoice'})
+    
+    def test_split_ref(self):
+        self.assertEqual(refs.split_ref('#/components/schemas/Product'), ('schemas', 'Product'))
+        self.assertIsNone(refs.split_ref('#/definitions/Product'))
+        self.assertIsNone(refs.split_ref('#/components/schemas'))
+    
+    def test_referenced_components_are_transitive(self):
+        referenced = refs.get_referenced_components(self.schema)
+        self.assertIn(('schemas', 'Line'), referenced)
+        self.assertIn(('schemas', 'Invoice'), referenced)
+        self.assertNotIn(('schemas', 'Unused'), referenced)
+    
+    def test_filter_by_tag(self):
+        shard = refs.filter_schema(self.schema, tag='Product')
+        self.assertEqual(list(shard['paths']), ['/api/products/'])
+        self.assertEqual(shard['components'], {
+            'schemas': {'Product': {'type': 'object'}},
+            'responses': {'ProductResponse': self.schema['components']['responses']['ProductResponse']},
+        })
+    
+    def test_filter_by_prefix(self):
+        shard = refs.filter_schema(self.schema, prefix='/api/billing')
+        self.assertEqual(list(shard['paths']), ['/api/billing/invoices/'])
+        self.assertEqual(set(shard['components']['schemas']), {'Invoice', 'Line'})
+        self.assertEqual(set(shard['components']['parameters']), {'IdPath'})
+    
+    def test_select_operations(self):
+        variant = refs.select_operations(self.schema, {('/api/billing/invoices/', 'get'), ('/api/products/', 'post')})
+        self.assertEqual(variant['paths'], {'/api/billing/invoices/': {'get': self.schema['paths']['/api/billing/invoices/']['get']}})
+        self.assertEqual(set(variant['components']), {'schemas', 'responses'})
+    
+    def test_filter_does_not_mutate(self):
+        refs.filter_schema(self.schema, tag='Product')
+        self.assertEqual(len(self.schema['paths']), 2)
+        self.assertIn('Unused', self.schema['components']['schemas'])
+    
+    def test_tag_counts(self):
+        self.assertEqual(refs.get_tag_counts(self.schema), {'Product': 1, 'Invoice': 2})
+    
+
+    def test_shard_catalog(self):
+        catalog = refs.get_shard_catalog(self.schema)
+        self.assertEqual(catalog.tags, {'Product': 1, 'Invoice': 2})
+        self.assertEqual(catalog.paths, ('/api/billing/invoices/', '/api/products/'))
+
+
+class ShardPrefixTestCase(unittest.TestCase):
+    """Pure Python tests for canonical shard prefixes"""
+    
+    def setUp(self):
+        self.catalog = refs.ShardCatalog({}, ['/api/products/', '/api/products/{id}/', '/api/billing/invoices/', '/api/products/'])
+    
+    def test_prefixes_selecting_the_same_paths_share_one_form(self):
+        self.assertEqual(self.catalog.resolve_prefix('/api/prod'), '/api/products/')
+        self.assertEqual(self.catalog.resolve_prefix('api/products'), '/api/products/')
+        self.assertEqual(self.catalog.resolve_prefix('/api/products/{'), '/api/products/{id}/')
+        self.assertEqual(self.catalog.resolve_prefix('/'), '/api/')
+    
+    def test_unknown_prefix(self):
+        self.assertIsNone(self.catalog.resolve_prefix('/api/orders'))
+        self.assertIsNone(self.catalog.resolve_prefix('/zzz'))
+
+
+class RefValidationTestCase(unittest.TestCase):
+    """Pure Python tests for $ref validation"""
+    
+    def test_resolved_refs_pass(self):
+        shared = {'schema': ref('schemas', 'Product')}
+        schema = {
+            'paths': {'/a/': {'get': {'responses': {'200': shared}}}, '/b/': {'get': {'responses': {'200': shared}}}},
+            'components': {'schemas': {'Product': {'type': 'object'}}},
+        }
+        self.assertEqual(refs.find_dangling_refs(schema), {})
+        refs.validate_refs(schema)
+    
+    def test_dangling_refs_are_reported_with_locations(self):
+        schema = {
+            'paths': {
+                '/api/products/': {'post': {'requestBody': {'schema': ref('schemas', 'Missing')}}},
+            },
+            'components': {
+                'schemas': {'Product': {'properties': {'tag': ref('schemas', 'Missing'), 'own': ref('schemas', 'Product')}}},
+            },
+        }
+        
+        self.assertEqual(refs.find_dangling_refs(schema), {
+            '#/components/schemas/Missing': ['#/paths/~1api~1products~1/post', '#/components/schemas/Product'],
+        })
+        with self.assertRaises(refs.DanglingRefError) as raised:
+            refs.validate_refs(schema)
+        self.assertIn('#/components/schemas/Missing', str(raised.exception))
+        self.assertIsInstance(raised.exception, ValueError)
+    
+    def test_refs_are_checked_against_their_section(self):
+        schema = {
+            'paths': {'/a/': {'get': {'parameters': [ref('parameters', 'Product')]}}},
+            'components': {'schemas': {'Product': {}}},
+        }
+        self.assertEqual(list(refs.find_dangling_refs(schema)), ['#/components/parameters/Product'])
+    
+    def test_external_refs_are_ignored(self):
+        schema = {'paths': {'/a/': {'get': {'parameters': [{'$ref': 'common.yaml#/Limit'}]}}}, 'components': {}}
+        self.assertEqual(refs.find_dangling_refs(schema), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,356 @@
+import importlib
+import json
+import multiprocessing
+import os
+import unittest
+from unittest import mock
+from tests.testproject import setup
+
+setup()
+
+from django.db import connections
+from django.test import SimpleTestCase, override_settings
+from django.urls import clear_url_caches
+from rest_framework import generics, serializers
+from rest_framework.utils.encoders import JSONEncoder
+from autoapi_swagger.cache import invalidate_schema_cache
+from autoapi_swagger.docs_generator import get_openapi_schema
+from autoapi_swagger.constants import ERROR_RESPONSES
+from autoapi_swagger.naming import component_names
+from autoapi_swagger.incremental import clear_fragment_cache, get_fragment_cache_stats
+from autoapi_swagger.streaming import iter_openapi_schema
+from autoapi_swagger.refs import find_dangling_refs
+from autoapi_swagger.utils import get_introspection_cache_stats, get_nested_serializers, get_serializer_fields, get_view_queryset_model, serializer_fields_memo
+from tests.testproject.models import Category, Product, Tag
+from tests.testproject.serializers import ProductSerializer, TreeSerializer
+from tests.testproject.views import CategoryViewSet, TreeView
+
+
+class ComponentNameTestCase(SimpleTestCase):
+    """Django tests for component names across URLconf changes"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+    
+    def test_root_urlconf_switch_keeps_colliding_components_apart(self):
+        self.assertNotIn('WidgetSerializer', get_openapi_schema()['components']['schemas'])
+        
+        with override_settings(ROOT_URLCONF='tests.testproject.urls_widgets'):
+            schemas = get_openapi_schema()['components']['schemas']
+        
+        self.assertNotIn('WidgetSerializer', schemas)
+        self.assertIn('name', schemas['tests.testproject.widgets_a.WidgetSerializer']['properties'])
+        self.assertIn('size', schemas['tests.testproject.widgets_b.WidgetSerializer']['properties'])
+    
+    def test_shard_only_instantiates_its_own_serializers(self):
+        instantiated = set()
+        init = serializers.BaseSerializer.__init__
+        
+        def record(serializer, *args, **kwargs):
+            instantiated.add(type(serializer))
+            init(serializer, *args, **kwargs)
+        
+        with mock.patch.object(serializers.BaseSerializer, '__init__', record):
+            schema = get_openapi_schema(tag='Tr')
+        
+        self.assertIn('TreeSerializer', schema['components']['schemas'])
+        self.assertEqual(instantiated, {TreeSerializer, serializers.ListSerializer})
+    
+    def test_invalidation_keeps_the_name_index(self):
+        get_openapi_schema()
+        invalidate_schema_cache()
+        
+        self.assertTrue(component_names.indexed)
+    
+    @override_settings(ROOT_URLCONF='tests.testproject.urls_widget_a')
+    def test_reloaded_urlconf_keeps_plain_names(self):
+        get_openapi_schema()
+        
+        from tests.testproject import urls_widget_a, widgets_a
+        
+        for module in (widgets_a, urls_widget_a):
+            importlib.reload(module)
+        clear_url_caches()
+        schemas = get_openapi_schema()['components']['schemas']
+        
+        self.assertIn('WidgetSerializer', schemas)
+        self.assertFalse([name for name in schemas if name.startswith('tests.')])
+
+
+class SchemaMutationTestCase(SimpleTestCase):
+    """Django tests for mutating a built schema"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+    
+    def test_mutating_an_operation_leaves_other_operations_alone(self):
+        schema = get_openapi_schema(compact=False)
+        tree = schema['paths']['/api/v1/tree/']
+        
+        tree['get']['responses']['400']['description'] = 'Changed'
+        tree['get']['responses']['200']['content']['application/json']['schema']['allOf'].clear()
+        schema['components']['schemas']['JSendSuccess']['properties'].clear()
+        
+        self.assertEqual(tree['post']['responses']['400'], ERROR_RESPONSES['400'])
+        self.assertEqual(tree['options']['responses']['200']['content']['application/json']['schema']['allOf'][0], {'$ref': '#/components/schemas/JSendSuccess'})
+        self.assertEqual(ERROR_RESPONSES['400']['description'], 'Bad Request')
+        self.assertEqual(get_openapi_schema(compact=False)['paths']['/api/v1/tree/']['get']['responses']['400'], ERROR_RESPONSES['400'])
+        self.assertIn('data', get_openapi_schema()['components']['schemas']['JSendSuccess']['properties'])
+
+class IncrementalBuildTestCase(SimpleTestCase):
+    """Django tests for reusing view fragments between builds"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+        clear_fragment_cache()
+    
+    def test_invalidating_the_schema_cache_keeps_fragments(self):
+        first = get_openapi_schema(incremental=True)
+        fragments = get_fragment_cache_stats()['fragments']
+        
+        invalidate_schema_cache()
+        second = get_openapi_schema(incremental=True)
+        
+        self.assertGreater(fragments, 0)
+        self.assertEqual(second, first)
+        self.assertEqual(get_fragment_cache_stats()['reused'], fragments)
+        self.assertEqual(get_fragment_cache_stats()['fragments'], fragments)
+    
+    def test_rebuild_after_invalidation_instantiates_no_serializer(self):
+        first = get_openapi_schema(incremental=True)
+        invalidate_schema_cache()
+        instantiated = []
+        init = serializers.BaseSerializer.__init__
+        
+        def record(serializer, *args, **kwargs):
+            instantiated.append(type(serializer))
+            init(serializer, *args, **kwargs)
+        
+        with mock.patch.object(serializers.BaseSerializer, '__init__', record):
+            second = get_openapi_schema(incremental=True)
+        
+        self.assertEqual(second, first)
+        self.assertEqual(instantiated, [])
+    
+    def test_invalidation_drops_memos_of_changed_modules(self):
+        from tests.testproject import serializers as serializers_module
+        
+        get_serializer_fields(ProductSerializer)
+        get_serializer_fields(TreeSerializer)
+        original = os.stat(serializers_module.__file__)
+        self.addCleanup(os.utime, serializers_module.__file__, ns=(original.st_atime_ns, original.st_mtime_ns))
+        
+        invalidate_schema_cache()
+        self.assertIn(ProductSerializer, serializer_fields_memo)
+        self.assertIn(TreeSerializer, serializer_fields_memo)
+        
+        os.utime(serializers_module.__file__, ns=(original.st_atime_ns, original.st_mtime_ns + 1_000_000_000))
+        invalidate_schema_cache()
+        self.assertNotIn(ProductSerializer, serializer_fields_memo)
+        self.assertNotIn(TreeSerializer, serializer_fields_memo)
+    
+    def test_fragments_follow_component_name_changes(self):
+        with override_settings(ROOT_URLCONF='tests.testproject.urls_widgets'):
+            get_openapi_schema(incremental=True)
+        
+        with override_settings(ROOT_URLCONF='tests.testproject.urls_widget_a'):
+            schema = get_openapi_schema(incremental=True)
+            self.assertEqual(schema, get_openapi_schema())
+        
+        self.assertIn('WidgetSerializer', schema['components']['schemas'])
+        self.assertNotIn('tests.testproject.widgets_a.WidgetSerializer', schema['components']['schemas'])
+
+
+
+class ParallelBuildTestCase(SimpleTestCase):
+    """Django tests for building view fragments on a worker pool"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+    
+    def assertSameDocument(self, schema, expected):
+        self.assertEqual(json.dumps(schema, cls=JSONEncoder), json.dumps(expected, cls=JSONEncoder))
+    
+    def test_thread_pool_matches_the_serial_build(self):
+        serial = get_openapi_schema()
+        invalidate_schema_cache()
+        
+        self.assertSameDocument(get_openapi_schema(workers=4, executor='thread'), serial)
+    
+    @unittest.skipUnless(multiprocessing.get_start_method() == 'fork', 'workers inherit the configured test settings')
+    def test_process_pool_matches_the_serial_build(self):
+        self.assertSameDocument(get_openapi_schema(workers=2, executor='process'), get_openapi_schema())
+    
+    @override_settings(AUTOAPI_SWAGGER={'SCHEMA_WORKERS': 4})
+    def test_workers_setting_is_used_by_default(self):
+        self.assertSameDocument(get_openapi_schema(), get_openapi_schema(workers=1))
+    
+    def test_unknown_executor_is_rejected(self):
+        with self.assertRaises(ValueError):
+            get_openapi_schema(workers=2, executor='greenlet')
+
+
+def reject_queries(execute, sql, params, many, context):
+    raise AssertionError(f'Schema generation ran a query: {sql}')
+
+
+class ViewModelTestCase(SimpleTestCase):
+    """Django tests for resolving a view's model without running view code"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+    
+    def test_queryset_model_comes_first(self):
+        view_class = type('TagListView', (generics.ListAPIView,), {
+            'queryset': Tag.objects.all(), 'serializer_class': ProductSerializer, 'autoapi_model': Category,
+        })
+        self.assertIs(get_view_queryset_model(view_class), Tag)
+    
+    def test_serializer_model_comes_before_the_override(self):
+        view_class = type('ProductListView', (generics.ListAPIView,), {'serializer_class': ProductSerializer, 'autoapi_model': Category})
+        self.assertIs(get_view_queryset_model(view_class), Product)
+    
+    def test_override_is_used_last(self):
+        serializer_class = type('PlainSerializer', (serializers.Serializer,), {'name': serializers.CharField()})
+        view_class = type('PlainView', (generics.GenericAPIView,), {'serializer_class': serializer_class, 'autoapi_model': Category})
+        
+        self.assertIs(get_view_queryset_model(view_class), Category)
+        self.assertIsNone(get_view_queryset_model(TreeView))
+    
+    def test_get_queryset_is_never_called(self):
+        self.assertIs(get_view_queryset_model(CategoryViewSet), Category)
+        misses = get_introspection_cache_stats()['view_models']['misses']
+        
+        self.assertIs(get_view_queryset_model(CategoryViewSet), Category)
+        self.assertEqual(get_introspection_cache_stats()['view_models']['misses'], misses)
+    
+    def test_schema_is_built_without_database_queries(self):
+        with connections['default'].execute_wrapper(reject_queries):
+            schemas = get_openapi_schema()['components']['schemas']
+        
+        self.assertIn('Category', schemas)
+        self.assertIn('Product', schemas)
+
+
+class ChickenSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    
+    def get_fields(self):
+        fields = super().get_fields()
+        fields['egg'] = EggSerializer(required=False)
+        return fields
+
+
+class EggSerializer(serializers.Serializer):
+    laid_by = ChickenSerializer(required=False)
+
+
+class SerializerFieldsTestCase(SimpleTestCase):
+    """Django tests for the memoized serializer introspection result"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+    
+    def test_cached_fields_cannot_be_changed_by_callers(self):
+        fields = get_serializer_fields(ProductSerializer)
+        
+        with self.assertRaises(TypeError):
+            fields['injected'] = {'type': 'string', 'required': False}
+        with self.assertRaises(TypeError):
+            fields['email']['format'] = 'uri'
+        with self.assertRaises(TypeError):
+            get_serializer_fields(TreeView)['injected'] = {}
+        
+        self.assertIs(get_serializer_fields(ProductSerializer), fields)
+        self.assertEqual(fields['email'], {'type': 'string', 'required': False, 'format': 'email'})
+
+
+def build_serializer_lattice(depth):
+    layer = type('Layer0', (serializers.Serializer,), {'value': serializers.IntegerField()})
+    for index in range(1, depth + 1):
+        layer = type(f'Layer{index}', (serializers.Serializer,), {
+            'left': layer(required=False),
+            'right': layer(many=True, required=False),
+        })
+    return layer
+
+
+class NestedSerializerTestCase(SimpleTestCase):
+    """Django tests for nested serializers becoming shared components"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+    
+    def test_nested_serializers_are_referenced(self):
+        schema = get_openapi_schema()
+        schemas = schema['components']['schemas']
+        properties = schemas['ProductSerializer']['properties']
+        
+        self.assertEqual(properties['category_detail'], {'$ref': '#/components/schemas/CategorySerializer'})
+        self.assertEqual(properties['tag_list'], {'type': 'array', 'items': {'$ref': '#/components/schemas/TagSerializer'}})
+        self.assertIn('CategorySerializer', schemas)
+        self.assertIn('TagSerializer', schemas)
+        self.assertFalse(find_dangling_refs(schema))
+    
+    def test_self_reference_points_at_its_own_component(self):
+        tree = get_openapi_schema()['components']['schemas']['TreeSerializer']
+        self.assertEqual(tree['properties']['children'], {'type': 'array', 'items': {'$ref': '#/components/schemas/TreeSerializer'}})
+    
+    def test_mutual_recursion_terminates(self):
+        self.assertEqual(get_nested_serializers(ChickenSerializer), (EggSerializer,))
+        self.assertEqual(get_nested_serializers(EggSerializer), (ChickenSerializer,))
+    
+    def test_each_serializer_is_introspected_once(self):
+        # 2**30 paths lead from the top layer to the bottom one through 31 distinct serializers.
+        top = build_serializer_lattice(30)
+        misses = get_introspection_cache_stats()['serializer_fields']['misses']
+        
+        nested = get_nested_serializers(top)
+        
+        self.assertEqual(len(nested), 30)
+        self.assertEqual(len(set(nested)), 30)
+        self.assertEqual(get_introspection_cache_stats()['serializer_fields']['misses'] - misses, 31)
+
+
+def reject_duplicate_keys(pairs):
+    keys = [key for key, _ in pairs]
+    if len(set(keys)) != len(keys):
+        raise ValueError(f'Duplicate keys in {keys}')
+    return dict(pairs)
+
+
+class StreamingTestCase(SimpleTestCase):
+    """Django tests for streaming the schema piece by piece"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+    
+    def assertStreamMatchesSchema(self, **kwargs):
+        streamed = json.loads(b''.join(iter_openapi_schema(encoder=JSONEncoder, **kwargs)), object_pairs_hook=reject_duplicate_keys)
+        self.assertEqual(streamed, json.loads(json.dumps(get_openapi_schema(**kwargs), cls=JSONEncoder)))
+        return streamed
+    
+    def test_stream_matches_the_built_schema(self):
+        streamed = self.assertStreamMatchesSchema()
+        self.assertIn('responses', streamed['components'])
+    
+    def test_uncompacted_stream_matches_the_built_schema(self):
+        self.assertStreamMatchesSchema(compact=False)
+    
+    def test_compacted_stream_builds_each_operation_once(self):
+        from autoapi_swagger import streaming
+        
+        with mock.patch.object(streaming, 'build_operation', wraps=streaming.build_operation) as build_operation:
+            streamed = json.loads(b''.join(iter_openapi_schema(encoder=JSONEncoder, compact=True)))
+        
+        self.assertEqual(build_operation.call_count, sum(len(path_item) for path_item in streamed['paths'].values()))
+    
+    @override_settings(ROOT_URLCONF='tests.testproject.urls_widgets')
+    def test_envelopes_do_not_clash_with_components(self):
+        schemas = self.assertStreamMatchesSchema()['components']['schemas']
+        self.assertEqual(schemas['TreeSerializerEnvelope']['properties'], {'wrapped': {'type': 'boolean'}})
+        self.assertIn('TreeSerializerEnvelope2', schemas)
+
+
+if __name__ == '__main__':
+    unittest.main()
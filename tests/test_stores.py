@@ -0,0 +1,101 @@
+import os
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from tests.testproject import setup
+
+setup()
+
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+from autoapi_swagger.payload import SchemaPayload
+from autoapi_swagger.stores import CacheSchemaStore, FileSchemaStore, SchemaStore, load_or_build_payload
+
+
+class SchemaStoreTestCase(SimpleTestCase):
+    """Django tests for sharing schema payloads between processes"""
+    
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = FileSchemaStore(directory.name)
+    
+    def test_store_interface_is_abstract(self):
+        with self.assertRaises(TypeError):
+            SchemaStore()
+        
+        class ReadOnlyStore(SchemaStore):
+            def get(self, name, stamp):
+                return None
+        
+        with self.assertRaises(TypeError):
+            ReadOnlyStore()
+    
+    def test_file_store_round_trip(self):
+        self.assertIsNone(self.store.get('schema', 'a'))
+        self.store.set('schema', 'a', b'{"a":1}')
+        self.store.set('schema', 'b', b'{"b":1}')
+        
+        self.assertIsNone(self.store.get('schema', 'a'))
+        self.assertEqual(bytes(self.store.get('schema', 'b')), b'{"b":1}')
+    
+    def test_file_store_defaults_to_a_private_project_directory(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        with mock.patch('tempfile.gettempdir', return_value=root.name):
+            store = FileSchemaStore()
+            store.set('schema', 'a', b'{"a":1}')
+            other = FileSchemaStore()
+        
+        self.assertEqual(store.directory.parent, Path(root.name))
+        self.assertTrue(store.directory.name.startswith('autoapi_swagger-'))
+        self.assertEqual(other.directory, store.directory)
+        self.assertEqual(stat.S_IMODE(os.stat(store.directory).st_mode), 0o700)
+        self.assertEqual(bytes(store.get('schema', 'a')), b'{"a":1}')
+    
+    def test_file_store_rejects_a_shared_default_directory(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        with mock.patch('tempfile.gettempdir', return_value=root.name):
+            store = FileSchemaStore()
+        store.directory.mkdir()
+        os.chmod(store.directory, 0o777)
+        
+        with self.assertRaises(ImproperlyConfigured):
+            store.get('schema', 'a')
+        with self.assertRaises(ImproperlyConfigured):
+            store.set('schema', 'a', b'{"a":1}')
+    
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'stores', 'TIMEOUT': 60}})
+    def test_cache_store_expires_and_evicts_previous_stamps(self):
+        store = CacheSchemaStore()
+        cache = caches['default']
+        self.addCleanup(cache.clear)
+        
+        store.set('schema', 'a', b'{"a":1}')
+        store.set('schema', 'b', b'{"b":1}')
+        
+        self.assertIsNone(store.get('schema', 'a'))
+        self.assertEqual(store.get('schema', 'b'), b'{"b":1}')
+        self.assertIsNotNone(cache._expire_info[cache.make_and_validate_key(store._key('schema', 'b'))])
+    
+    def test_payload_is_built_once_and_reused(self):
+        calls = []
+        
+        def build():
+            calls.append(1)
+            return SchemaPayload(b'{"openapi":"3.0.0"}')
+        
+        first = load_or_build_payload(self.store, ('payload',), build)
+        second = load_or_build_payload(self.store, ('payload',), build)
+        
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(bytes(second.content), first.content)
+        self.assertEqual(second.etag(), first.etag())
+
+
+if __name__ == '__main__':
+    unittest.main()
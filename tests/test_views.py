@@ -0,0 +1,229 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from tests.testproject import setup
+
+setup()
+
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.views import APIView
+from autoapi_swagger.cache import SingleFlight, get_cached_shard_catalog, invalidate_schema_cache, shard_cache
+from autoapi_swagger.docs_generator import get_openapi_schema
+from autoapi_swagger.views import AsyncOpenAPISchemaView, OpenAPISchemaView
+
+
+class HeaderAuthentication(BaseAuthentication):
+    def authenticate(self, request):
+        if request.META.get('HTTP_X_USER'):
+            return SimpleNamespace(is_authenticated=True, is_staff=False), None
+        return None
+    
+    def authenticate_header(self, request):
+        return 'X-User'
+
+
+class SchemaViewAccessTestCase(SimpleTestCase):
+    """Django tests for DRF authentication and permissions on the schema views"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+        self.factory = RequestFactory()
+        policy = {'authentication_classes': [HeaderAuthentication], 'permission_classes': [IsAuthenticated]}
+        self.sync_view = OpenAPISchemaView.as_view(**policy)
+        self.async_view = AsyncOpenAPISchemaView.as_view(**policy)
+    
+    def test_anonymous_requests_are_rejected_by_both_views(self):
+        sync_response = self.sync_view(self.factory.get('/docs/openapi.json'))
+        async_response = asyncio.run(self.async_view(self.factory.get('/docs/openapi.json')))
+        
+        self.assertEqual(sync_response.status_code, 401)
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertEqual(async_response['WWW-Authenticate'], 'X-User')
+    
+    def test_authenticated_requests_are_served_by_both_views(self):
+        sync_response = self.sync_view(self.factory.get('/docs/openapi.json', HTTP_X_USER='1'))
+        async_response = asyncio.run(self.async_view(self.factory.get('/docs/openapi.json', HTTP_X_USER='1')))
+        
+        self.assertEqual(sync_response.status_code, 200)
+        self.assertEqual(async_response.status_code, 200)
+        self.assertEqual(async_response.content, sync_response.content)
+    
+    def test_async_view_uses_drf_default_policies(self):
+        for attribute in ('authentication_classes', 'permission_classes', 'throttle_classes'):
+            self.assertEqual(getattr(AsyncOpenAPISchemaView, attribute), getattr(APIView, attribute))
+    
+    @override_settings(AUTOAPI_SWAGGER={'STREAM_SCHEMA': True})
+    def test_async_view_streams_with_an_async_iterator(self):
+        async def fetch():
+            response = await AsyncOpenAPISchemaView.as_view()(self.factory.get('/docs/openapi.json'))
+            return response, b''.join([chunk async for chunk in response])
+        
+        response, content = asyncio.run(fetch())
+        
+        self.assertTrue(response.is_async)
+        self.assertEqual(json.loads(content)['paths'].keys(), get_openapi_schema()['paths'].keys())
+
+
+class AsyncViewThreadHopTestCase(SimpleTestCase):
+    """Django tests for serving a cached schema without leaving the event loop"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+        self.factory = RequestFactory()
+    
+    def fetch(self, view, path='/docs/openapi.json', **kwargs):
+        return asyncio.run(view(self.factory.get(path), **kwargs))
+    
+    def test_public_view_without_checks_skips_the_thread_hops(self):
+        view = AsyncOpenAPISchemaView.as_view(permission_classes=[AllowAny], throttle_classes=[])
+        self.fetch(view)
+        
+        with mock.patch.object(AsyncOpenAPISchemaView, 'check_access', side_effect=AssertionError('checked')), \
+                mock.patch.object(AsyncOpenAPISchemaView, 'resolve_shard', side_effect=AssertionError('resolved')):
+            response = self.fetch(view)
+        
+        self.assertEqual(response.status_code, 200)
+    
+    def test_views_with_checks_or_shards_still_hop(self):
+        view = AsyncOpenAPISchemaView.as_view(permission_classes=[IsAuthenticated], throttle_classes=[])
+        public_view = AsyncOpenAPISchemaView.as_view(permission_classes=[AllowAny], throttle_classes=[])
+        
+        self.assertEqual(self.fetch(view).status_code, 403)
+        with self.assertRaises(Http404):
+            self.fetch(public_view, '/docs/openapi/Missing.json', tag='Missing')
+        self.assertTrue(AsyncOpenAPISchemaView(permission_classes=[AllowAny], public=False).requires_access_check())
+        self.assertTrue(AsyncOpenAPISchemaView(permission_classes=[AllowAny], throttle_classes=[object]).requires_access_check())
+
+
+class StreamingViewTestCase(SimpleTestCase):
+    """Django tests for streaming only the first schema build"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+        self.factory = RequestFactory()
+    
+    @override_settings(AUTOAPI_SWAGGER={'STREAM_SCHEMA': True})
+    def test_streamed_schema_is_cached_for_later_requests(self):
+        view = OpenAPISchemaView.as_view()
+        first = view(self.factory.get('/docs/openapi.json'))
+        content = b''.join(first)
+        
+        with mock.patch('autoapi_swagger.streaming.iter_openapi_schema', side_effect=AssertionError('streamed twice')):
+            second = view(self.factory.get('/docs/openapi.json'))
+            compressed = view(self.factory.get('/docs/openapi.json', HTTP_ACCEPT_ENCODING='gzip'))
+        
+        self.assertTrue(first.streaming)
+        self.assertFalse(second.streaming)
+        self.assertEqual(second.content, content)
+        self.assertTrue(second.has_header('ETag'))
+        self.assertEqual(compressed['Content-Encoding'], 'gzip')
+    
+    @override_settings(AUTOAPI_SWAGGER={'STREAM_SCHEMA': True})
+    def test_unfinished_stream_is_not_cached(self):
+        view = OpenAPISchemaView.as_view()
+        first = view(self.factory.get('/docs/openapi.json'))
+        next(iter(first))
+        first.close()
+        
+        self.assertTrue(view(self.factory.get('/docs/openapi.json')).streaming)
+    
+    @override_settings(AUTOAPI_SWAGGER={'STREAM_SCHEMA': True})
+    def test_async_view_serves_the_cached_stream(self):
+        async def fetch():
+            response = await AsyncOpenAPISchemaView.as_view()(self.factory.get('/docs/openapi.json'))
+            if response.streaming:
+                return response, b''.join([chunk async for chunk in response])
+            return response, response.content
+        
+        first, content = asyncio.run(fetch())
+        second, cached = asyncio.run(fetch())
+        
+        self.assertTrue(first.streaming)
+        self.assertFalse(second.streaming)
+        self.assertEqual(cached, content)
+
+
+class SchemaShardViewTestCase(SimpleTestCase):
+    """Django tests for the per-tag and per-prefix shard routes"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+    
+    def test_known_tag_is_served(self):
+        tag = next(iter(get_cached_shard_catalog().tags))
+        response = self.client.get(f'/docs/openapi/{tag}.json')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['paths'])
+    
+    def test_unknown_tag_is_not_found(self):
+        self.assertEqual(self.client.get('/docs/openapi/Missing.json').status_code, 404)
+        self.assertEqual(shard_cache.stats()['entries'], 0)
+    
+    def test_unknown_prefix_is_not_found(self):
+        self.assertEqual(self.client.get('/docs/openapi.json', {'prefix': '/nowhere/'}).status_code, 404)
+        self.assertEqual(shard_cache.stats()['entries'], 0)
+    
+    def test_equivalent_prefixes_share_one_cache_entry(self):
+        responses = [self.client.get('/docs/openapi.json', {'prefix': prefix}) for prefix in ('/api/v1/tr', 'api/v1/tree', '/api/v1/tree/')]
+        
+        self.assertEqual([response.status_code for response in responses], [200] * 3)
+        self.assertEqual(list(responses[0].json()['paths']), ['/api/v1/tree/'])
+        self.assertEqual(len({response['ETag'] for response in responses}), 1)
+        self.assertEqual(shard_cache.stats()['entries'], 1)
+
+
+class SingleFlightTestCase(unittest.TestCase):
+    """Tests for collapsing concurrent async schema builds into one"""
+    
+    def test_concurrent_runs_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+        
+        def build():
+            calls.append(threading.get_ident())
+            time.sleep(0.05)
+            return object()
+        
+        async def run():
+            return await asyncio.gather(*(flight.run('schema', build) for _ in range(5)))
+        
+        results = asyncio.run(run())
+        
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(flight.pending(), 0)
+    
+    def test_errors_reach_every_waiter(self):
+        flight = SingleFlight()
+        
+        def build():
+            time.sleep(0.01)
+            raise ValueError('broken')
+        
+        async def run():
+            return await asyncio.gather(*(flight.run('schema', build) for _ in range(3)), return_exceptions=True)
+        
+        results = asyncio.run(run())
+        
+        self.assertEqual([type(result) for result in results], [ValueError] * 3)
+        self.assertEqual(flight.pending(), 0)
+    
+    def test_distinct_keys_build_separately(self):
+        flight = SingleFlight()
+        
+        async def run():
+            return await asyncio.gather(flight.run('a', lambda: 'a'), flight.run('b', lambda: 'b'))
+        
+        self.assertEqual(asyncio.run(run()), ['a', 'b'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+import asyncio
+import importlib
+import os
+import pkgutil
+import threading
+import unittest
+from unittest import mock
+from tests.testproject import setup
+
+setup()
+
+from django.apps import apps
+from django.test import RequestFactory, SimpleTestCase, override_settings
+import autoapi_swagger
+from autoapi_swagger.assets import get_swagger_ui_assets
+from autoapi_swagger.cache import get_cached_schema_payload, invalidate_schema_cache, schema_cache
+from autoapi_swagger.views import AsyncOpenAPISchemaView, OpenAPISchemaView
+from autoapi_swagger.warmup import SchemaWarmup, _after_fork_in_child, is_server_process, warm_schema_cache
+
+
+LOCK_TYPES = (type(threading.Lock()), type(threading.RLock()))
+
+
+def find_module_locks():
+    found = {}
+    for module_info in pkgutil.walk_packages(autoapi_swagger.__path__, 'autoapi_swagger.'):
+        module = importlib.import_module(module_info.name)
+        for name, value in vars(module).items():
+            collect_locks(value, (module, ('attr', name)), found, set())
+    return list(found.values())
+
+
+def collect_locks(value, path, found, seen):
+    if isinstance(value, LOCK_TYPES):
+        found.setdefault(id(value), (path, value))
+    elif id(value) in seen:
+        return
+    elif isinstance(value, dict):
+        seen.add(id(value))
+        for key, item in list(value.items()):
+            collect_locks(item, path + (('item', key),), found, seen)
+    elif type(value).__module__.startswith('autoapi_swagger') and hasattr(value, '__dict__'):
+        seen.add(id(value))
+        for name, item in vars(value).items():
+            collect_locks(item, path + (('attr', name),), found, seen)
+
+
+def resolve_path(path):
+    value = path[0]
+    for kind, key in path[1:]:
+        try:
+            value = getattr(value, key) if kind == 'attr' else value[key]
+        except (AttributeError, KeyError):
+            return None
+    return value
+
+
+def format_path(path):
+    return path[0].__name__ + ''.join(f'.{key}' if kind == 'attr' else f'[{key!r}]' for kind, key in path[1:])
+
+
+class ForkTestCase(SimpleTestCase):
+    """Django tests for making shared caches usable in a forked worker"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+    
+    def test_child_replaces_every_lock_held_at_fork_time(self):
+        payload = get_cached_schema_payload()
+        get_swagger_ui_assets()
+        held = find_module_locks()
+        self.assertIn('autoapi_swagger.assets._lock', [format_path(path) for path, _ in held])
+        self.assertIn('autoapi_swagger.field_types.serializer_field_types._lock', [format_path(path) for path, _ in held])
+        for _, lock in held:
+            lock.acquire()
+        
+        # The test thread stands in for a thread that did not survive the fork.
+        def child():
+            _after_fork_in_child()
+            payload.encode('gzip')
+            get_swagger_ui_assets()
+            invalidate_schema_cache()
+            get_cached_schema_payload()
+        
+        worker = threading.Thread(target=child)
+        worker.start()
+        worker.join(timeout=10)
+        for _, lock in held:
+            lock.release()
+        
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(schema_cache.stats()['entries'], 2)
+        self.assertEqual([format_path(path) for path, lock in held if resolve_path(path) is lock], [])
+
+
+class WarmupTestCase(SimpleTestCase):
+    """Django tests for requests that arrive while the schema is warming up"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+        self.factory = RequestFactory()
+        self.release = threading.Event()
+        self.warmup = SchemaWarmup()
+        for patcher in (
+            mock.patch('autoapi_swagger.warmup.schema_warmup', self.warmup),
+            mock.patch('autoapi_swagger.warmup.warm_schema_cache', lambda: self.release.wait(10)),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.release.set)
+        self.warmup.start()
+    
+    @override_settings(AUTOAPI_SWAGGER={'WARM_UP_MODE': 'unavailable', 'WARM_UP_RETRY_AFTER': 7})
+    def test_unavailable_mode_answers_503_until_the_build_is_done(self):
+        sync_response = OpenAPISchemaView.as_view()(self.factory.get('/docs/openapi.json'))
+        async_response = asyncio.run(AsyncOpenAPISchemaView.as_view()(self.factory.get('/docs/openapi.json')))
+        
+        for response in (sync_response, async_response):
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response['Retry-After'], '7')
+            self.assertEqual(response['Cache-Control'], 'no-store')
+        
+        self.release.set()
+        self.assertTrue(self.warmup.wait(10))
+        self.assertEqual(OpenAPISchemaView.as_view()(self.factory.get('/docs/openapi.json')).status_code, 200)
+    
+    def test_wait_mode_holds_requests_until_the_build_is_done(self):
+        responses = []
+        request = threading.Thread(target=lambda: responses.append(OpenAPISchemaView.as_view()(self.factory.get('/docs/openapi.json'))))
+        request.start()
+        request.join(timeout=0.2)
+        
+        self.assertTrue(request.is_alive())
+        self.release.set()
+        request.join(timeout=10)
+        self.assertEqual([response.status_code for response in responses], [200])
+    
+    @override_settings(AUTOAPI_SWAGGER={'WARM_UP_MODE': 'sometimes'})
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            OpenAPISchemaView.as_view()(self.factory.get('/docs/openapi.json'))
+
+
+class WarmSchemaCacheTestCase(SimpleTestCase):
+    """Django tests for warming every schema view found in the URLconf"""
+    
+    def setUp(self):
+        invalidate_schema_cache()
+    
+    def test_each_schema_view_is_warmed_once(self):
+        self.assertEqual(warm_schema_cache(), 1)
+        self.assertEqual(schema_cache.stats()['entries'], 2)
+        
+        payload = get_cached_schema_payload(title='Test API')
+        self.assertEqual(schema_cache.stats()['entries'], 2)
+        self.assertIn(b'"title":"Test API"', payload.content)
+    
+    def test_failed_warmup_lets_requests_through(self):
+        warmup = SchemaWarmup()
+        with mock.patch('autoapi_swagger.warmup.warm_schema_cache', side_effect=RuntimeError('boom')), \
+                self.assertLogs('autoapi_swagger.warmup', 'ERROR'):
+            warmup.start()
+            self.assertTrue(warmup.wait(10))
+        
+        self.assertIsInstance(warmup.error, RuntimeError)
+        self.assertFalse(warmup.is_running())
+
+
+class ServerProcessTestCase(SimpleTestCase):
+    """Django tests for starting the warm-up only in server processes"""
+    
+    def test_servers_are_detected(self):
+        self.assertTrue(is_server_process(['/usr/bin/gunicorn', 'project.wsgi']))
+        self.assertTrue(is_server_process(['/venv/lib/uvicorn/__main__.py', 'project.asgi:application']))
+        self.assertTrue(is_server_process(['manage.py', 'runserver', '--noreload']))
+    
+    def test_other_commands_are_not_servers(self):
+        self.assertFalse(is_server_process(['manage.py', 'migrate']))
+        self.assertFalse(is_server_process(['/venv/lib/django/__main__.py', 'generate_openapi']))
+        self.assertFalse(is_server_process(['manage.py', 'test']))
+        self.assertFalse(is_server_process(['/usr/bin/pytest', '-q']))
+        self.assertFalse(is_server_process([]))
+    
+    def test_runserver_warms_the_reloaded_child_only(self):
+        with mock.patch.dict(os.environ, {'RUN_MAIN': 'true'}):
+            self.assertTrue(is_server_process(['manage.py', 'runserver']))
+        with mock.patch.dict(os.environ):
+            os.environ.pop('RUN_MAIN', None)
+            self.assertFalse(is_server_process(['manage.py', 'runserver']))
+    
+    @override_settings(AUTOAPI_SWAGGER={'WARM_UP_ENTRYPOINTS': ('waitress-serve',)})
+    def test_entrypoints_are_configurable(self):
+        self.assertTrue(is_server_process(['/usr/bin/waitress-serve', 'project.wsgi:application']))
+        self.assertFalse(is_server_process(['/usr/bin/gunicorn', 'project.wsgi']))
+    
+    @override_settings(AUTOAPI_SWAGGER={'WARM_UP_SCHEMA': True})
+    def test_ready_starts_the_warmup_for_servers_only(self):
+        config = apps.get_app_config('autoapi_swagger')
+        with mock.patch('autoapi_swagger.warmup.start_schema_warmup') as start:
+            with mock.patch('sys.argv', ['manage.py', 'migrate']):
+                config.ready()
+            start.assert_not_called()
+            
+            with mock.patch('sys.argv', ['/usr/bin/gunicorn', 'project.wsgi']):
+                config.ready()
+            start.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
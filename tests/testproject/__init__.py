@@ -0,0 +1,22 @@
+def setup() -> None:
+    import django
+    from django.conf import settings
+    
+    if settings.configured:
+        return
+    settings.configure(
+        SECRET_KEY='autoapi-swagger-tests',
+        DEBUG=False,
+        ALLOWED_HOSTS=['*'],
+        ROOT_URLCONF='tests.testproject.urls',
+        INSTALLED_APPS=[
+            'django.contrib.contenttypes',
+            'django.contrib.auth',
+            'rest_framework',
+            'autoapi_swagger',
+            'tests.testproject',
+        ],
+        DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+        USE_TZ=True,
+    )
+    django.setup()
@@ -0,0 +1,27 @@
+from django.db import models
+
+
+class Category(models.Model):
+    name = models.CharField(max_length=50, help_text='Display name')
+    parent = models.ForeignKey('self', null=True, blank=True, on_delete=models.CASCADE)
+
+
+class Tag(models.Model):
+    label = models.SlugField()
+
+
+class Product(models.Model):
+    name = models.CharField(max_length=50)
+    email = models.EmailField(blank=True)
+    price = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='products')
+    tags = models.ManyToManyField(Tag, blank=True)
+
+
+class Voucher(models.Model):
+    code = models.UUIDField(primary_key=True)
+
+
+class Redemption(models.Model):
+    voucher = models.OneToOneField(Voucher, on_delete=models.CASCADE)
+    products = models.ManyToManyField(Product)
@@ -0,0 +1,33 @@
+from rest_framework import serializers
+from tests.testproject.models import Category, Product, Tag
+
+
+class TagSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Tag
+        fields = '__all__'
+
+
+class CategorySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Category
+        fields = '__all__'
+
+
+class ProductSerializer(serializers.ModelSerializer):
+    category_detail = CategorySerializer(source='category', read_only=True)
+    tag_list = TagSerializer(source='tags', many=True, read_only=True)
+    
+    class Meta:
+        model = Product
+        fields = '__all__'
+
+
+class TreeSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    contact = serializers.EmailField(required=False)
+    
+    def get_fields(self):
+        fields = super().get_fields()
+        fields['children'] = TreeSerializer(many=True, required=False)
+        return fields
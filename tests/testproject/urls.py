@@ -0,0 +1,15 @@
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+from autoapi_swagger.urls import get_urls
+from tests.testproject.views import CategoryViewSet, ProductViewSet, TagViewSet, TreeView
+
+router = DefaultRouter()
+router.register('products', ProductViewSet)
+router.register('categories', CategoryViewSet, basename='category')
+router.register('tags', TagViewSet)
+
+urlpatterns = [
+    path('api/v1/', include(router.urls)),
+    path('api/v1/tree/', TreeView.as_view()),
+    path('docs/', include(get_urls(title='Test API'))),
+]
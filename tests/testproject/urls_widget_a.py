@@ -0,0 +1,6 @@
+from django.urls import path
+from tests.testproject import widgets_a
+
+urlpatterns = [
+    path('api/a/widgets/', widgets_a.WidgetView.as_view()),
+]
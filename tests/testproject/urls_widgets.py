@@ -0,0 +1,9 @@
+from django.urls import include, path
+from tests.testproject import widgets_a, widgets_b
+
+urlpatterns = [
+    path('', include('tests.testproject.urls')),
+    path('api/a/widgets/', widgets_a.WidgetView.as_view()),
+    path('api/b/widgets/', widgets_b.WidgetView.as_view()),
+    path('api/a/envelopes/', widgets_a.EnvelopeView.as_view()),
+]
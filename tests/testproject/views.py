@@ -0,0 +1,38 @@
+from rest_framework import permissions, views, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from tests.testproject.models import Product, Tag
+from tests.testproject.serializers import CategorySerializer, ProductSerializer, TagSerializer, TreeSerializer
+
+
+class ProductViewSet(viewsets.ModelViewSet):
+    queryset = Product.objects.all()
+    serializer_class = ProductSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    
+    @action(detail=True, methods=['post'])
+    def publish(self, request, pk=None):
+        return Response({})
+
+
+class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
+    serializer_class = CategorySerializer
+    
+    def get_queryset(self):
+        raise AssertionError('Schema generation must not call get_queryset()')
+
+
+class TagViewSet(viewsets.ModelViewSet):
+    queryset = Tag.objects.all()
+    serializer_class = TagSerializer
+    permission_classes = [permissions.IsAdminUser]
+
+
+class TreeView(views.APIView):
+    serializer_class = TreeSerializer
+    
+    def get(self, request):
+        return Response({})
+    
+    def post(self, request):
+        return Response({})
@@ -0,0 +1,24 @@
+from rest_framework import serializers, views
+from rest_framework.response import Response
+
+
+class WidgetSerializer(serializers.Serializer):
+    name = serializers.CharField()
+
+
+class TreeSerializerEnvelope(serializers.Serializer):
+    wrapped = serializers.BooleanField()
+
+
+class WidgetView(views.APIView):
+    serializer_class = WidgetSerializer
+    
+    def get(self, request):
+        return Response({})
+
+
+class EnvelopeView(views.APIView):
+    serializer_class = TreeSerializerEnvelope
+    
+    def get(self, request):
+        return Response({})
@@ -0,0 +1,13 @@
+from rest_framework import serializers, views
+from rest_framework.response import Response
+
+
+class WidgetSerializer(serializers.Serializer):
+    size = serializers.IntegerField()
+
+
+class WidgetView(views.APIView):
+    serializer_class = WidgetSerializer
+    
+    def get(self, request):
+        return Response({})